@@ -4,6 +4,7 @@ from api.v1.endpoints import (
     auth,
     document_processing,
     document_uploads,
+    events,
     extractions,
     health,
     stats,
@@ -34,3 +35,4 @@ api_router.include_router(
     extractions.router, prefix="/extractions", tags=["Extractions"]
 )
 api_router.include_router(workflows.router, prefix="/workflows", tags=["Workflows"])
+api_router.include_router(events.router, prefix="/events", tags=["Progress Events"])
@@ -3,7 +3,7 @@ Authentication API endpoints for the API Gateway.
 """
 import logging
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordBearer
 
 from schemas.authentication_schema import Token, TokenRefresh, UserLogin
@@ -14,6 +14,9 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl="api/v1/auth/login", auto_error=False
+)
 
 
 @router.post(
@@ -76,18 +79,18 @@ async def refresh_token(refresh_token_data: TokenRefresh):
     """
 
     async def request_handler():
-        token_data = authentication_service.decode_token(
+        token_data = await authentication_service.decode_token(
             refresh_token_data.refresh_token
         )
 
-        if token_data.get("type") != "refresh":
+        if token_data.type != "refresh":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token type",
             )
 
         access_token = authentication_service.create_access_token(
-            data={"sub": token_data.get("sub")}
+            data={"sub": token_data.sub}
         )
 
         return {
@@ -108,26 +111,23 @@ async def refresh_token(refresh_token_data: TokenRefresh):
     status_code=status.HTTP_204_NO_CONTENT,
     response_description="No content",
 )
-async def logout(response: Response):
+async def logout(token: str | None = Depends(optional_oauth2_scheme)) -> Response:
     """
     Logout a user by invalidating their tokens.
 
-    In a stateless JWT system, we can't truly invalidate tokens without a blacklist.
-    This endpoint mainly serves to clear cookies if they're being used.
+    The bearer token of the request, if any, is revoked until it expires, and
+    the token cookies are cleared if they're being used.
+
+    Args:
+        token: Bearer token of the request
 
     Returns:
         No content on success
     """
+    if token is not None:
+        await authentication_service.revoke_token(token)
+
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
     response.delete_cookie(key="access_token")
     response.delete_cookie(key="refresh_token")
-
-    async def request_handler():
-        # In a stateless JWT system, we don't need to do anything server-side
-        # In a real application, we might add the token to a blacklist
-        return None
-
-    return await process_async_request(
-        request_handler=request_handler,
-        success_status_code=status.HTTP_204_NO_CONTENT,
-        error_message="Logout failed",
-    )
+    return response
@@ -3,8 +3,10 @@ from typing import Any
 
 from fastapi import APIRouter, Body, Query, status
 
+from schemas.document_processing_schema import ProcessingBatchRequest
 from services import document_processing_service
 from shared.utils.request_handler import process_async_request
+from utils.batch import run_batch
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -44,6 +46,44 @@ async def process_document(
     )
 
 
+@router.post(
+    "/batch",
+    summary="Process documents in one request",
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_description="One result per processing job",
+)
+async def process_document_batch(batch: ProcessingBatchRequest):
+    """
+    Submit every item for processing, concurrently.
+
+    At most BATCH_CONCURRENCY items are in flight downstream at once, and
+    each item gets its own result, so one failure does not fail the batch.
+
+    Args:
+        batch: Documents to process and their options
+
+    Returns:
+        Per-item results with the succeeded and failed counts
+    """
+
+    async def request_handler():
+        async def submit(item):
+            return await document_processing_service.process_document(
+                document_id=item.document_id,
+                options=item.options,
+            )
+
+        return await run_batch(
+            batch.items, submit, success_status_code=status.HTTP_202_ACCEPTED
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_207_MULTI_STATUS,
+        error_message="Failed to process documents",
+    )
+
+
 @router.get(
     "/{job_id}",
     summary="Get processing job status",
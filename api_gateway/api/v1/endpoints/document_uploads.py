@@ -1,8 +1,17 @@
 import logging
+from http import HTTPStatus
 
-from fastapi import APIRouter, File, Form, Query, UploadFile, status
+from fastapi import APIRouter, File, Form, Header, Query, Request, UploadFile, status
 
-from services import document_upload_service
+from core.config import settings
+from schemas.document_schema import (
+    DocumentStatus,
+    DocumentType,
+    UploadSessionComplete,
+    UploadSessionCreate,
+)
+from services import document_upload_service, document_view_service
+from shared.exceptions.base import ValidationError
 from shared.utils.request_handler import process_async_request
 
 router = APIRouter()
@@ -20,9 +29,8 @@ async def upload_document(
     metadata: str | None = Form(None),
 ):
     async def request_handler():
-        file_content = await file.read()
         return await document_upload_service.upload_document(
-            file_content=file_content,
+            file_content=file.file,
             filename=file.filename,
             content_type=file.content_type,
             metadata=metadata,
@@ -35,6 +43,310 @@ async def upload_document(
     )
 
 
+@router.post(
+    "/stream",
+    summary="Upload a document as a streamed multipart body",
+    status_code=status.HTTP_201_CREATED,
+    response_description="Document uploaded successfully",
+)
+async def stream_upload_document(request: Request):
+    """
+    Upload a document by piping the raw multipart body straight to ingestion.
+
+    The body is not parsed or buffered by the gateway, and its size is checked
+    against MAX_CONTENT_LENGTH while it streams.
+
+    Args:
+        request: The incoming multipart/form-data upload request
+
+    Returns:
+        Uploaded document information
+    """
+
+    async def request_handler():
+        content_type = request.headers.get("content-type", "")
+        if not content_type.startswith("multipart/form-data"):
+            raise ValidationError("Expected a multipart/form-data request body")
+
+        declared_length = request.headers.get("content-length")
+        content_length = int(declared_length) if declared_length else None
+        if content_length is not None and content_length > settings.MAX_CONTENT_LENGTH:
+            raise ValidationError(
+                "Request body exceeds the maximum allowed size of "
+                f"{settings.MAX_CONTENT_LENGTH} bytes",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return await document_upload_service.stream_upload_document(
+            body=request.stream(),
+            content_type=content_type,
+            content_length=content_length,
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_201_CREATED,
+        error_message="Failed to upload document",
+    )
+
+
+@router.post(
+    "/batch",
+    summary="Upload several documents in one request",
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_description="One result per uploaded file",
+)
+async def upload_documents(request: Request):
+    """
+    Upload many documents by piping one multipart body straight to ingestion.
+
+    Every ``file`` part becomes its own document. Ingestion stores the files
+    concurrently and records them with one bulk insert, and each file gets
+    its own result, so one bad file does not fail the rest of the batch.
+
+    Args:
+        request: The incoming multipart/form-data upload request
+
+    Returns:
+        Per-file results with the succeeded and failed counts
+    """
+
+    async def request_handler():
+        content_type = request.headers.get("content-type", "")
+        if not content_type.startswith("multipart/form-data"):
+            raise ValidationError("Expected a multipart/form-data request body")
+
+        declared_length = request.headers.get("content-length")
+        content_length = int(declared_length) if declared_length else None
+        if (
+            content_length is not None
+            and content_length > settings.BATCH_MAX_CONTENT_LENGTH
+        ):
+            raise ValidationError(
+                "Request body exceeds the maximum allowed size of "
+                f"{settings.BATCH_MAX_CONTENT_LENGTH} bytes",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return await document_upload_service.stream_upload_documents(
+            body=request.stream(),
+            content_type=content_type,
+            content_length=content_length,
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_207_MULTI_STATUS,
+        error_message="Failed to upload documents",
+    )
+
+
+@router.post(
+    "/uploads",
+    summary="Start a resumable upload",
+    status_code=status.HTTP_201_CREATED,
+    response_description="Upload session created",
+)
+async def create_upload_session(session_request: UploadSessionCreate):
+    """
+    Start a resumable upload for a large file.
+
+    The file is then sent as fixed-size chunks with ``PATCH /uploads/{id}``,
+    in any order and over as many connections as the client likes, and
+    turned into a document with ``POST /uploads/{id}/complete``.
+
+    Args:
+        session_request: Filename, size, MIME type and optional chunk size
+
+    Returns:
+        The upload session, including the chunk size to use
+    """
+
+    async def request_handler():
+        return await document_upload_service.create_upload_session(
+            session_request.model_dump(exclude_none=True)
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_201_CREATED,
+        error_message="Failed to create upload session",
+    )
+
+
+@router.get(
+    "/uploads/{session_id}",
+    summary="Get resumable upload progress",
+    status_code=status.HTTP_200_OK,
+    response_description="Upload session progress",
+)
+async def get_upload_session(session_id: str):
+    async def request_handler():
+        return await document_upload_service.get_upload_session(session_id)
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_200_OK,
+        error_message=f"Upload session with ID {session_id} not found",
+    )
+
+
+@router.patch(
+    "/uploads/{session_id}",
+    summary="Upload one chunk of a resumable upload",
+    status_code=status.HTTP_200_OK,
+    response_description="Chunk stored",
+)
+async def upload_chunk(
+    session_id: str,
+    request: Request,
+    content_range: str = Header(..., description="bytes <start>-<end>/<total>"),
+    x_chunk_sha256: str | None = Header(None, description="SHA-256 of the chunk"),
+):
+    """
+    Stream one chunk of a resumable upload straight to ingestion.
+
+    Args:
+        session_id: ID of the upload session
+        request: The incoming request, whose body is the chunk content
+        content_range: Byte range of the chunk within the file
+        x_chunk_sha256: Optional hex SHA-256 the chunk must match
+
+    Returns:
+        The upload session, including received and missing chunks
+    """
+
+    async def request_handler():
+        declared_length = request.headers.get("content-length")
+        content_length = int(declared_length) if declared_length else None
+        if content_length is not None and content_length > settings.MAX_CONTENT_LENGTH:
+            raise ValidationError(
+                "Chunk exceeds the maximum allowed size of "
+                f"{settings.MAX_CONTENT_LENGTH} bytes",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return await document_upload_service.upload_chunk(
+            session_id,
+            body=request.stream(),
+            content_range=content_range,
+            content_length=content_length,
+            checksum=x_chunk_sha256,
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_200_OK,
+        error_message=f"Failed to upload chunk for session {session_id}",
+    )
+
+
+@router.post(
+    "/uploads/{session_id}/complete",
+    summary="Finish a resumable upload",
+    status_code=status.HTTP_201_CREATED,
+    response_description="Document created from the uploaded chunks",
+)
+async def complete_upload_session(
+    session_id: str, completion: UploadSessionComplete | None = None
+):
+    async def request_handler():
+        return await document_upload_service.complete_upload_session(
+            session_id, sha256=completion.sha256 if completion else None
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_201_CREATED,
+        error_message=f"Failed to complete upload session {session_id}",
+    )
+
+
+@router.delete(
+    "/uploads/{session_id}",
+    summary="Abandon a resumable upload",
+    status_code=status.HTTP_200_OK,
+    response_description="Upload session aborted",
+)
+async def abort_upload_session(session_id: str):
+    async def request_handler():
+        return await document_upload_service.abort_upload_session(session_id)
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_200_OK,
+        error_message=f"Failed to abort upload session {session_id}",
+    )
+
+
+@router.get(
+    "/export",
+    summary="Export the document catalog",
+    status_code=status.HTTP_200_OK,
+    response_description="Newline-delimited JSON, one document per line",
+)
+async def export_documents(
+    request: Request,
+    status_filter: DocumentStatus
+    | None = Query(None, description="Filter by document status"),
+    document_type: DocumentType
+    | None = Query(None, description="Filter by document type"),
+):
+    """
+    Stream every document summary as NDJSON, relayed from ingestion as it arrives.
+
+    Args:
+        request: The incoming export request
+        status_filter: Optional filter by document status
+        document_type: Optional filter by document type
+
+    Returns:
+        Streaming NDJSON response
+    """
+    return await document_upload_service.export_documents(
+        request, status_filter=status_filter, document_type=document_type
+    )
+
+
+@router.get(
+    "/{document_id}/view",
+    summary="Get a document with its processing, extraction and workflows",
+    status_code=status.HTTP_200_OK,
+    response_description="Aggregated document view",
+)
+async def get_document_view(
+    document_id: str,
+    fields: str | None = Query(None, description="Branches to include (default: all)"),
+):
+    """
+    Get everything a document page needs in one round trip.
+
+    The document and the selected branches are read from their services
+    concurrently. A branch that fails or runs out of time is set to null and
+    reported under ``errors`` without failing the rest of the view.
+
+    Args:
+        document_id: ID of the document
+        fields: Optional comma-separated selection of processing, extraction
+            and workflows
+
+    Returns:
+        The document, its latest processing job and extraction result, its
+        workflows, and any branch errors
+    """
+
+    async def request_handler():
+        return await document_view_service.get_document_view(
+            document_id, fields=document_view_service.parse_fields(fields)
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_200_OK,
+        error_message=f"Document with ID {document_id} not found",
+    )
+
+
 @router.get(
     "/{document_id}",
     summary="Get document details",
@@ -59,15 +371,17 @@ async def get_document(document_id: str):
     response_description="List of documents",
 )
 async def list_documents(
-    page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    status_filter: str | None = Query(None, description="Filter by document status"),
-    document_type: str | None = Query(None, description="Filter by document type"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    status_filter: DocumentStatus
+    | None = Query(None, description="Filter by document status"),
+    document_type: DocumentType
+    | None = Query(None, description="Filter by document type"),
 ):
     async def request_handler():
         return await document_upload_service.list_documents(
-            page=page,
             limit=limit,
+            cursor=cursor,
             status_filter=status_filter,
             document_type=document_type,
         )
@@ -0,0 +1,57 @@
+import logging
+
+from fastapi import APIRouter, Header, status
+from starlette.responses import StreamingResponse
+
+from services import (
+    document_processing_service,
+    entity_extraction_service,
+    workflow_service,
+)
+from utils.progress_stream import ProgressResource, progress_hub
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+progress_hub.register(ProgressResource.WORKFLOWS, workflow_service.get_workflow)
+progress_hub.register(
+    ProgressResource.PROCESSING_JOBS, document_processing_service.get_processing_status
+)
+progress_hub.register(
+    ProgressResource.EXTRACTION_JOBS, entity_extraction_service.get_extraction_result
+)
+
+
+@router.get(
+    "/{resource}/{resource_id}",
+    summary="Stream workflow or job progress",
+    status_code=status.HTTP_200_OK,
+    response_description="Server-sent progress events",
+)
+async def stream_progress(
+    resource: ProgressResource,
+    resource_id: str,
+    last_event_id: str | None = Header(None),
+):
+    """
+    Push status and progress changes of a workflow or job as server-sent events.
+
+    Every change is sent as a ``progress`` event carrying the resource, the
+    current state is sent first, and the stream ends once the resource has
+    completed, failed or been canceled. Downstream failures are sent as
+    ``upstream-error`` events. All subscribers to the same resource share one
+    downstream poll.
+
+    Args:
+        resource: Kind of resource to follow
+        resource_id: ID of the workflow or job
+        last_event_id: ID of the last event a reconnecting client received
+
+    Returns:
+        Streaming ``text/event-stream`` response
+    """
+    return StreamingResponse(
+        progress_hub.stream(resource, resource_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
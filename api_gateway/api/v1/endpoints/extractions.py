@@ -3,8 +3,10 @@ from typing import Any
 
 from fastapi import APIRouter, Body, Query, status
 
+from schemas.document_extraction_schema import ExtractionBatchRequest
 from services import entity_extraction_service
 from shared.utils.request_handler import process_async_request
+from utils.batch import run_batch
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -33,6 +35,44 @@ async def process_document(
     )
 
 
+@router.post(
+    "/batch",
+    summary="Extract entities from documents in one request",
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_description="One result per extraction job",
+)
+async def extract_entities_batch(batch: ExtractionBatchRequest):
+    """
+    Submit every item for entity extraction, concurrently.
+
+    At most BATCH_CONCURRENCY items are in flight downstream at once, and
+    each item gets its own result, so one failure does not fail the batch.
+
+    Args:
+        batch: Documents to extract entities from and their options
+
+    Returns:
+        Per-item results with the succeeded and failed counts
+    """
+
+    async def request_handler():
+        async def submit(item):
+            return await entity_extraction_service.extract_entities(
+                document_id=item.document_id,
+                options=item.options,
+            )
+
+        return await run_batch(
+            batch.items, submit, success_status_code=status.HTTP_202_ACCEPTED
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_207_MULTI_STATUS,
+        error_message="Failed to extract entities",
+    )
+
+
 @router.get(
     "/{job_id}",
     summary="Get processing job status",
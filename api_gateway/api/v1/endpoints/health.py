@@ -1,21 +1,15 @@
 import logging
 from typing import Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from core.config import settings
-from utils.proxy import check_service_health
+from utils.circuit_breaker import get_circuit_breaker
+from utils.health_monitor import health_monitor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-SERVICES = [
-    "document_ingestion",
-    "document_processing",
-    "entity_extraction",
-    "task_orchestration",
-]
-
 
 @router.get(
     "/",
@@ -38,17 +32,30 @@ async def health_check() -> dict:
     status_code=status.HTTP_200_OK,
     response_description="Health status of all services",
 )
-async def services_health() -> dict[str, Any]:
+async def services_health(
+    refresh: bool = Query(
+        False, description="Probe services now instead of using the cached snapshot"
+    ),
+) -> dict[str, Any]:
     """
     Check health of all dependent services.
 
+    Args:
+        refresh: Whether to probe all services now instead of using the cached snapshot
+
     Returns:
-        Dict with health status of each service
+        Dict with health status and circuit breaker state of each service
     """
-    health_status = {}
+    snapshot = (
+        await health_monitor.refresh() if refresh else await health_monitor.snapshot()
+    )
 
-    for service_name in SERVICES:
-        health_status[service_name] = await check_service_health(service_name)
+    health_status = {}
+    for service_name, service_status in snapshot.items():
+        health_status[service_name] = {
+            **service_status,
+            "circuit_breaker": get_circuit_breaker(service_name).snapshot(),
+        }
 
     critical_services = {"document_ingestion", "document_processing"}
     critical_services_healthy = all(
@@ -56,6 +63,7 @@ async def services_health() -> dict[str, Any]:
         for service in critical_services
     )
 
+    refreshed_at = health_monitor.refreshed_at
     return {
         "api_gateway": {
             "status": "healthy",
@@ -63,4 +71,5 @@ async def services_health() -> dict[str, Any]:
         },
         "services": health_status,
         "overall_status": "healthy" if critical_services_healthy else "degraded",
+        "checked_at": refreshed_at.isoformat() if refreshed_at else None,
     }
@@ -6,14 +6,23 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, status
 
 from core.config import settings
+from services.authentication_service import token_verification_stats
+from shared.utils.loop_monitor import loop_monitor
+from shared.utils.metrics import request_totals
 from shared.utils.request_handler import process_async_request
+from utils.circuit_breaker import get_circuit_breaker
+from utils.concurrency_limiter import concurrency_limit_stats
+from utils.health_monitor import health_monitor
+from utils.http_clients import client_registry
+from utils.password_hasher import password_hasher
+from utils.progress_stream import progress_hub
+from utils.response_cache import response_cache
+from utils.single_flight import single_flight_stats
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 start_time = time.time()
-request_count = 0
-error_count = 0
 
 
 @router.get(
@@ -24,8 +33,7 @@ error_count = 0
 )
 async def get_system_stats():
     async def request_handler():
-        global request_count
-        request_count += 1
+        request_count, error_count = request_totals()
 
         uptime_seconds = time.time() - start_time
         uptime = str(timedelta(seconds=int(uptime_seconds)))
@@ -61,6 +69,14 @@ async def get_system_stats():
             "system": system_info,
             "memory": memory_info,
             "services": services_health,
+            "connection_pools": client_registry.pool_stats(),
+            "concurrency_limits": concurrency_limit_stats(),
+            "request_coalescing": single_flight_stats(),
+            "response_cache": response_cache.stats(),
+            "progress_streams": progress_hub.stats(),
+            "token_verification": token_verification_stats(),
+            "password_hashing": password_hasher.stats(),
+            "event_loop": loop_monitor.stats(),
         }
 
     return await process_async_request(
@@ -75,28 +91,23 @@ async def _get_services_health() -> dict:
     Get health status of all services.
 
     Returns:
-        Dict containing health status of all services
+        Dict containing the cached health status, probe latency histogram and
+        circuit breaker state of all services
     """
-    # This is a simplified version - in a real implementation,
-    # we would need to make actual requests to the services
-
-    services = {
-        "document_ingestion": {
-            "status": "healthy",
-            "url": settings.DOCUMENT_INGESTION_SERVICE_URL,
-        },
-        "document_processing": {
-            "status": "healthy",
-            "url": settings.DOCUMENT_PROCESSING_SERVICE_URL,
-        },
-        "entity_extraction": {
-            "status": "healthy",
-            "url": settings.ENTITY_EXTRACTION_SERVICE_URL,
-        },
-        "task_orchestration": {
-            "status": "healthy",
-            "url": settings.TASK_ORCHESTRATION_SERVICE_URL,
-        },
-    }
+    snapshot = await health_monitor.snapshot()
+    histograms = health_monitor.latency_histograms()
+
+    services = {}
+    for service_name, service_status in snapshot.items():
+        details = {
+            key: value for key, value in service_status.items() if key != "status"
+        }
+        details["probe_latency_histogram"] = histograms.get(service_name)
+        details["circuit_breaker"] = get_circuit_breaker(service_name).snapshot()
+        services[service_name] = {
+            "status": service_status["status"],
+            "url": getattr(settings, f"{service_name.upper()}_SERVICE_URL"),
+            "details": details,
+        }
 
     return services
@@ -3,8 +3,10 @@ from typing import Any
 
 from fastapi import APIRouter, Body, Query, status
 
+from schemas.workflow_schema import WorkflowBatchRequest
 from services import workflow_service
 from shared.utils.request_handler import process_async_request
+from utils.batch import run_batch
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -35,6 +37,45 @@ async def create_workflow(
     )
 
 
+@router.post(
+    "/batch",
+    summary="Create workflows in one request",
+    status_code=status.HTTP_207_MULTI_STATUS,
+    response_description="One result per workflow",
+)
+async def create_workflow_batch(batch: WorkflowBatchRequest):
+    """
+    Create a workflow for every item, submitting them concurrently.
+
+    At most BATCH_CONCURRENCY items are in flight downstream at once, and
+    each item gets its own result, so one failure does not fail the batch.
+
+    Args:
+        batch: Workflow creation items
+
+    Returns:
+        Per-item results with the succeeded and failed counts
+    """
+
+    async def request_handler():
+        async def submit(item):
+            return await workflow_service.create_workflow(
+                document_id=item.document_id,
+                workflow_type=item.workflow_type,
+                config=item.config,
+            )
+
+        return await run_batch(
+            batch.items, submit, success_status_code=status.HTTP_201_CREATED
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_207_MULTI_STATUS,
+        error_message="Failed to create workflows",
+    )
+
+
 @router.get(
     "/{workflow_id}",
     summary="Get workflow details",
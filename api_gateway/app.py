@@ -10,6 +10,20 @@ from slowapi.util import get_remote_address
 from api.v1.api_routes import api_router
 from core.config import settings
 from core.exceptions import register_exception_handlers
+from services.authentication_service import load_admin_password_hash
+from shared.utils.conditional import ConditionalRequestMiddleware
+from shared.utils.deadline import DeadlineMiddleware
+from shared.utils.loop_monitor import loop_monitor
+from shared.utils.metrics import MetricsMiddleware, MetricsServer
+from shared.utils.profiler import create_profiler_router
+from utils import downstream_metrics  # noqa: F401 - registers downstream metrics
+from utils.concurrency_limiter import Priority, RequestPriorityMiddleware
+from utils.health_monitor import health_monitor
+from utils.http_clients import client_registry
+from utils.password_hasher import password_hasher
+from utils.progress_stream import progress_hub
+from utils.response_cache import response_cache
+from utils.token_revocation import revocation_list
 
 logging.basicConfig(
     level=settings.LOG_LEVEL.upper(),
@@ -23,13 +37,19 @@ logging.getLogger().handlers[0].formatter = logging.Formatter(
 
 logger = logging.getLogger(__name__)
 
+metrics_server = MetricsServer(port=settings.METRICS_PORT)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Asynchronous context manager for managing the lifespan of the FastAPI application.
 
-    This context manager logs messages when the API Gateway Service starts up and shuts down.
+    This context manager logs messages when the API Gateway Service starts up and shuts down,
+    and owns the pooled HTTP clients, the background health monitor for downstream
+    services, the progress event feeds, the revoked token list sync, the password
+    hashing pool, on which the admin password is hashed once at startup, the
+    metrics endpoint and the event loop monitor.
 
     Args:
         app (FastAPI): The FastAPI application instance.
@@ -38,7 +58,27 @@ async def lifespan(app: FastAPI):
         None
     """
     logger.info("Starting up API Gateway Service")
+    if settings.ENABLE_METRICS:
+        await metrics_server.start()
+    if settings.ENABLE_LOOP_MONITOR:
+        await loop_monitor.start(
+            interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+            slow_threshold=settings.LOOP_MONITOR_SLOW_SECONDS,
+        )
+    await client_registry.start()
+    app.state.http_clients = client_registry
+    await health_monitor.start()
+    await revocation_list.start()
+    await load_admin_password_hash()
     yield
+    await revocation_list.stop()
+    password_hasher.close()
+    await progress_hub.close()
+    await health_monitor.stop()
+    await client_registry.close()
+    await response_cache.close()
+    await loop_monitor.stop()
+    await metrics_server.stop()
     logger.info("Shutting down API Gateway Service")
 
 
@@ -76,6 +116,26 @@ def create_application() -> FastAPI:
     if settings.APP_ENV == "development":
         logger.info(f"CORS enabled for origins: {settings.API_GATEWAY_CORS_ORIGINS}")
 
+    application.add_middleware(ConditionalRequestMiddleware)
+
+    application.add_middleware(
+        RequestPriorityMiddleware,
+        route_priorities={
+            f"{settings.API_GATEWAY_API_PREFIX}{path}": Priority[priority.upper()]
+            for path, priority in settings.REQUEST_PRIORITY_ROUTES.items()
+        },
+    )
+
+    application.add_middleware(
+        DeadlineMiddleware,
+        default_timeout=settings.REQUEST_DEADLINE_DEFAULT_SECONDS,
+        route_timeouts={
+            f"{settings.API_GATEWAY_API_PREFIX}{path}": timeout
+            for path, timeout in settings.REQUEST_DEADLINE_ROUTE_SECONDS.items()
+        },
+        max_timeout=settings.REQUEST_DEADLINE_MAX_SECONDS,
+    )
+
     application.add_middleware(
         CORSMiddleware,
         allow_origins=settings.API_GATEWAY_CORS_ORIGINS,
@@ -84,8 +144,20 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.ENABLE_METRICS:
+        application.add_middleware(MetricsMiddleware)
+
     application.include_router(api_router, prefix=settings.API_GATEWAY_API_PREFIX)
 
+    if settings.ADMIN_API_TOKEN:
+        application.include_router(
+            create_profiler_router(
+                settings.ADMIN_API_TOKEN, settings.PROFILER_MAX_SECONDS
+            ),
+            prefix=f"{settings.API_GATEWAY_API_PREFIX}/admin/profile",
+            tags=["Profiling"],
+        )
+
     return application
 
 
@@ -34,11 +34,118 @@ class ApiGatewaySettings(BaseAppSettings):
     ENTITY_EXTRACTION_SERVICE_URL: str
     TASK_ORCHESTRATION_SERVICE_URL: str
 
+    # Per-service request timeouts (seconds)
+    DOCUMENT_INGESTION_TIMEOUT: float = 60.0
+    DOCUMENT_PROCESSING_TIMEOUT: float = 120.0
+    ENTITY_EXTRACTION_TIMEOUT: float = 120.0
+    TASK_ORCHESTRATION_TIMEOUT: float = 30.0
+
+    # Downstream HTTP connection pools
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CLIENT_HTTP2: bool = False
+
+    # Circuit breaking
+    CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD: float = 0.5
+    CIRCUIT_BREAKER_MINIMUM_REQUESTS: int = 20
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 30.0
+    CIRCUIT_BREAKER_WINDOW_BUCKETS: int = 10
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: float = 15.0
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES: int = 3
+
+    # Background health probing
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 15.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 5.0
+
+    # Share one downstream call among concurrent identical reads
+    ENABLE_REQUEST_COALESCING: bool = True
+
+    # Response caching of immutable and slow-changing reads
+    ENABLE_RESPONSE_CACHE: bool = True
+    RESPONSE_CACHE_BACKEND: str = "local"
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    RESPONSE_CACHE_REFERENCE_TTL_SECONDS: float = 300.0
+    RESPONSE_CACHE_RESULT_TTL_SECONDS: float = 3600.0
+
+    # Server-sent progress events for workflows and jobs
+    PROGRESS_STREAM_POLL_INTERVAL_SECONDS: float = 1.0
+    PROGRESS_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    PROGRESS_STREAM_RETRY_MILLISECONDS: int = 3000
+    PROGRESS_STREAM_QUEUE_SIZE: int = 16
+
+    # Batch endpoints
+    BATCH_MAX_ITEMS: int = 100
+    BATCH_CONCURRENCY: int = 8
+    BATCH_MAX_CONTENT_LENGTH: int = 268435456
+
+    # Aggregated document view
+    DOCUMENT_VIEW_BRANCH_TIMEOUT_SECONDS: float = 5.0
+    DOCUMENT_VIEW_WORKFLOW_LIMIT: int = 10
+
+    # End-to-end request deadlines, in seconds. Routes are matched by prefix
+    # below the API prefix; None means no deadline unless the client sends one.
+    REQUEST_DEADLINE_DEFAULT_SECONDS: float = 60.0
+    REQUEST_DEADLINE_MAX_SECONDS: float = 600.0
+    REQUEST_DEADLINE_ROUTE_SECONDS: dict[str, float | None] = {
+        "/events": None,
+        "/documents/export": None,
+        "/documents/stream": 600.0,
+        "/documents/batch": 600.0,
+        "/documents/uploads": 600.0,
+    }
+
+    # Adaptive per-service concurrency limits and load shedding
+    ENABLE_ADAPTIVE_CONCURRENCY: bool = True
+    ADAPTIVE_CONCURRENCY_INITIAL_LIMIT: int = 20
+    ADAPTIVE_CONCURRENCY_MIN_LIMIT: int = 2
+    ADAPTIVE_CONCURRENCY_MAX_LIMIT: int = 200
+    ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE: float = 2.0
+    ADAPTIVE_CONCURRENCY_BACKOFF_RATIO: float = 0.9
+    ADAPTIVE_CONCURRENCY_NORMAL_SHARE: float = 0.9
+    ADAPTIVE_CONCURRENCY_BULK_SHARE: float = 0.5
+    REQUEST_PRIORITY_ROUTES: dict[str, str] = {
+        "/health": "critical",
+        "/auth": "critical",
+        "/documents/batch": "bulk",
+        "/documents/export": "bulk",
+        "/documents/stream": "bulk",
+        "/documents/uploads": "bulk",
+        "/workflows/batch": "bulk",
+        "/document-processing/batch": "bulk",
+        "/extractions/batch": "bulk",
+    }
+
+    # Verified token claims cache and revoked token list
+    TOKEN_CLAIMS_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_REVOCATION_BACKEND: str = "local"
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000
+    TOKEN_REVOCATION_BLOOM_FALSE_POSITIVE_RATE: float = 0.001
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 30.0
+
+    # Redis, used by the shared response cache tier and the revoked token list
+    REDIS_HOST: str = "redis"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str = ""
+
     # Authentication settings
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int
     ENABLE_AUTH: bool
+    ADMIN_USERNAME: str
+    ADMIN_PASSWORD: str
+    ADMIN_EMAIL: str
+
+    # Password hashing pool
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Uploads
+    MAX_CONTENT_LENGTH: int = 16777216
+    RESUMABLE_UPLOAD_MIN_CHUNK_SIZE: int = 262144
+    RESUMABLE_UPLOAD_MAX_CHUNK_SIZE: int = 16777216
 
     # Rate limiting
     ENABLE_RATE_LIMIT: bool
@@ -49,6 +156,15 @@ class ApiGatewaySettings(BaseAppSettings):
     ENABLE_METRICS: bool
     METRICS_PORT: int
 
+    # Event loop lag and blocking call detection
+    ENABLE_LOOP_MONITOR: bool = False
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_MONITOR_SLOW_SECONDS: float = 0.1
+
+    # On-demand profiling endpoints, mounted only when a token is set
+    ADMIN_API_TOKEN: str = ""
+    PROFILER_MAX_SECONDS: float = 60.0
+
     model_config = SettingsConfigDict(
         env_file=BaseAppSettings.get_env_file(Path(__file__).parent.parent),
         env_file_encoding="utf-8",
@@ -9,7 +9,9 @@ from shared.exceptions import (
     AuthenticationError,
     AuthorizationError,
     DataProcessingError,
+    DeadlineExceededError,
     NotFoundError,
+    ServiceOverloadedError,
     ServiceTimeoutError,
     ServiceUnavailableError,
     ValidationError,
@@ -171,6 +173,31 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(ServiceOverloadedError)
+    async def service_overloaded_handler(
+        request: Request, exc: ServiceOverloadedError
+    ) -> JSONResponse:
+        """
+        Handle ServiceOverloadedError exceptions.
+
+        Args:
+            request: The request that caused the exception
+            exc: The exception
+
+        Returns:
+            JSONResponse: A JSON response with error details and Retry-After
+        """
+        logger.warning(f"Load shed: {exc.message}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "error": exc.code,
+                "detail": exc.message,
+                "path": request.url.path,
+            },
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     @app.exception_handler(ServiceTimeoutError)
     async def service_timeout_handler(
         request: Request, exc: ServiceTimeoutError
@@ -195,6 +222,30 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
+    @app.exception_handler(DeadlineExceededError)
+    async def deadline_exceeded_handler(
+        request: Request, exc: DeadlineExceededError
+    ) -> JSONResponse:
+        """
+        Handle DeadlineExceededError exceptions.
+
+        Args:
+            request: The request that caused the exception
+            exc: The exception
+
+        Returns:
+            JSONResponse: A JSON response with error details
+        """
+        logger.warning(f"Deadline exceeded: {exc.message}")
+        return JSONResponse(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            content={
+                "error": exc.code,
+                "detail": exc.message,
+                "path": request.url.path,
+            },
+        )
+
     @app.exception_handler(DataProcessingError)
     async def data_processing_error_handler(
         request: Request, exc: DataProcessingError
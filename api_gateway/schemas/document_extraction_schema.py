@@ -108,3 +108,16 @@ class ExtractionJobList(BaseModel):
 
     items: list[ExtractionJob]
     pagination: dict[str, Any]
+
+
+class ExtractionBatchItem(BaseModel):
+    """Schema for one item of a batch entity extraction request."""
+
+    document_id: str
+    options: dict[str, Any] | None = None
+
+
+class ExtractionBatchRequest(BaseModel):
+    """Schema for batch entity extraction request."""
+
+    items: list[ExtractionBatchItem]
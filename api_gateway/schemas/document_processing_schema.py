@@ -70,3 +70,16 @@ class ProcessingJobList(BaseModel):
 
     items: list[ProcessingJob]
     pagination: dict[str, Any]
+
+
+class ProcessingBatchItem(BaseModel):
+    """Schema for one item of a batch document processing request."""
+
+    document_id: str
+    options: dict[str, Any] | None = None
+
+
+class ProcessingBatchRequest(BaseModel):
+    """Schema for batch document processing request."""
+
+    items: list[ProcessingBatchItem]
@@ -2,25 +2,26 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
+
+from core.config import settings
 
 
 class DocumentStatus(str, Enum):
-    """Enum for document status."""
+    """Enum for document status, as stored by the Document Ingestion Service."""
 
-    PENDING = "pending"
+    UPLOADED = "uploaded"
     PROCESSING = "processing"
     PROCESSED = "processed"
     FAILED = "failed"
-    ARCHIVED = "archived"
+    VALIDATED = "validated"
 
 
 class DocumentType(str, Enum):
-    """Enum for document types."""
+    """Enum for document types, as stored by the Document Ingestion Service."""
 
     INVOICE = "invoice"
     RECEIPT = "receipt"
-    CONTRACT = "contract"
     FORM = "form"
     ID_CARD = "id_card"
     OTHER = "other"
@@ -42,7 +43,7 @@ class DocumentBase(BaseModel):
     """Base schema for document data."""
 
     document_type: DocumentType = DocumentType.OTHER
-    status: DocumentStatus = DocumentStatus.PENDING
+    status: DocumentStatus = DocumentStatus.UPLOADED
     metadata: DocumentMetadata
 
 
@@ -90,3 +91,22 @@ class DocumentList(BaseModel):
 
     items: list[DocumentResponse]
     pagination: dict[str, Any]
+
+
+class UploadSessionCreate(BaseModel):
+    """Schema for starting a resumable upload."""
+
+    filename: str
+    file_size: int = Field(..., gt=0)
+    mime_type: str
+    chunk_size: int | None = Field(
+        None,
+        ge=settings.RESUMABLE_UPLOAD_MIN_CHUNK_SIZE,
+        le=settings.RESUMABLE_UPLOAD_MAX_CHUNK_SIZE,
+    )
+
+
+class UploadSessionComplete(BaseModel):
+    """Schema for finishing a resumable upload."""
+
+    sha256: str | None = None
@@ -40,6 +40,39 @@ class ApiGatewayStats(BaseModel):
     error_count: int
 
 
+class ConnectionPoolStats(BaseModel):
+    """Schema for downstream connection pool occupancy."""
+
+    connections: int
+    active: int
+    idle: int
+    queued: int
+    in_flight: int
+    max_connections: int
+    http2: bool
+
+
+class ConcurrencyLimitStats(BaseModel):
+    """Schema for the adaptive concurrency limit of one downstream service."""
+
+    limit: float
+    in_flight: int
+    baseline_latency_ms: float | None = None
+    smoothed_latency_ms: float | None = None
+    admitted: int
+    rejected: dict[str, int]
+    decreases: int
+
+
+class CoalescingStats(BaseModel):
+    """Schema for request coalescing counters of one resource."""
+
+    calls: int
+    executions: int
+    collapsed: int
+    in_flight: int
+
+
 class SystemStats(BaseModel):
     """Schema for system statistics."""
 
@@ -47,3 +80,11 @@ class SystemStats(BaseModel):
     system: SystemInfo
     memory: MemoryInfo
     services: dict[str, ServiceHealth]
+    connection_pools: dict[str, ConnectionPoolStats] = {}
+    concurrency_limits: dict[str, ConcurrencyLimitStats] = {}
+    request_coalescing: dict[str, CoalescingStats] = {}
+    response_cache: dict[str, Any] = {}
+    progress_streams: dict[str, Any] = {}
+    token_verification: dict[str, Any] = {}
+    password_hashing: dict[str, Any] = {}
+    event_loop: dict[str, Any] = {}
@@ -103,3 +103,17 @@ class WorkflowList(BaseModel):
 
     items: list[Workflow]
     pagination: dict[str, Any]
+
+
+class WorkflowBatchItem(BaseModel):
+    """Schema for one item of a batch workflow creation request."""
+
+    document_id: str
+    workflow_type: str
+    config: dict[str, Any] | None = None
+
+
+class WorkflowBatchRequest(BaseModel):
+    """Schema for batch workflow creation request."""
+
+    items: list[WorkflowBatchItem]
@@ -3,22 +3,25 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from core.config import settings
 from schemas.authentication_schema import TokenPayload, UserInDB, UserResponse
 from shared.exceptions.base import AuthenticationError
+from utils.claims_cache import ClaimsCache
+from utils.password_hasher import password_hasher
+from utils.token_revocation import revocation_list
 
 logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# In-memory token blacklist (in production, use Redis or similar)
-revoked_tokens: set[str] = set()
+# Hash of the configured admin password, computed once at startup
+_admin_password_hash: str | None = None
 
+claims_cache = ClaimsCache(max_entries=settings.TOKEN_CLAIMS_CACHE_MAX_ENTRIES)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a password against a hash.
+    Verify a password against a hash on the password hashing pool.
 
     Args:
         plain_password: Plain text password
@@ -26,21 +29,41 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Returns:
         True if the password matches the hash, False otherwise
+
+    Raises:
+        ServiceOverloadedError: If the password hashing pool is saturated
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await password_hasher.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """
-    Hash a password.
+    Hash a password on the password hashing pool.
 
     Args:
         password: Plain text password to hash
 
     Returns:
         Hashed password
+
+    Raises:
+        ServiceOverloadedError: If the password hashing pool is saturated
+    """
+    return await password_hasher.hash(password)
+
+
+async def load_admin_password_hash() -> str:
+    """
+    Hash the configured admin password, once.
+
+    Returns:
+        Hashed admin password
     """
-    return pwd_context.hash(password)
+    global _admin_password_hash
+    if _admin_password_hash is None:
+        _admin_password_hash = await get_password_hash(settings.ADMIN_PASSWORD)
+        logger.info("Admin password hash computed")
+    return _admin_password_hash
 
 
 def create_access_token(
@@ -84,31 +107,53 @@ def create_access_token(
     return token
 
 
-def decode_token(token: str) -> TokenPayload:
+def _verify_token(token: str) -> dict[str, Any]:
     """
-    Decode a JWT token.
+    Get the verified claims of a token, decoding it only on a cache miss.
 
     Args:
-        token: JWT token to decode
+        token: JWT token to verify
 
     Returns:
-        Decoded token payload
+        The token's claims
 
     Raises:
-        AuthenticationError: If the token is invalid or revoked
+        AuthenticationError: If the token is invalid or expired
     """
-    try:
-        if is_token_revoked(token):
-            raise AuthenticationError("Token has been revoked")
+    claims = claims_cache.get(token)
+    if claims is not None:
+        return claims
 
-        payload = jwt.decode(
+    try:
+        claims = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
         )
-        return TokenPayload(**payload)
     except JWTError as e:
         logger.error(f"Error decoding token: {e}")
         raise AuthenticationError("Invalid token")
 
+    claims_cache.set(token, claims)
+    return claims
+
+
+async def decode_token(token: str) -> TokenPayload:
+    """
+    Decode a JWT token.
+
+    Args:
+        token: JWT token to decode
+
+    Returns:
+        Decoded token payload
+
+    Raises:
+        AuthenticationError: If the token is invalid or revoked
+    """
+    claims = _verify_token(token)
+    if await is_token_revoked(claims):
+        raise AuthenticationError("Token has been revoked")
+    return TokenPayload(**claims)
+
 
 async def authenticate_user(username: str, password: str) -> dict[str, Any]:
     """
@@ -128,9 +173,8 @@ async def authenticate_user(username: str, password: str) -> dict[str, Any]:
         logger.warning(f"Authentication failed: User {username} not found")
         raise AuthenticationError("Invalid username or password")
 
-    # Use configured admin password
-    hashed_password = get_password_hash(settings.ADMIN_PASSWORD)
-    if not verify_password(password, hashed_password):
+    hashed_password = await load_admin_password_hash()
+    if not await verify_password(password, hashed_password):
         logger.warning(f"Authentication failed: Invalid password for user {username}")
         raise AuthenticationError("Invalid username or password")
 
@@ -187,41 +231,48 @@ def create_refresh_token(user_id: str) -> str:
     return token
 
 
-def revoke_token(token: str) -> None:
+async def revoke_token(token: str) -> None:
     """
-    Revoke a token by adding it to the blacklist.
+    Revoke a token until it expires.
 
     Args:
         token: Token to revoke
+
+    Raises:
+        AuthenticationError: If the token is invalid
     """
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        token_id = payload.get("jti")
-        if token_id:
-            revoked_tokens.add(token_id)
-            logger.info(f"Token {token_id[:8]}... has been revoked")
-    except JWTError:
-        logger.error("Failed to decode token for revocation")
-        raise AuthenticationError("Invalid token")
+    claims = _verify_token(token)
+    token_id = claims.get("jti")
+    if token_id:
+        await revocation_list.revoke(token_id, float(claims["exp"]))
+        logger.info(f"Token {token_id[:8]}... has been revoked")
+    # Revoked tokens fail the revocation check anyway; this worker's cached
+    # claims are dropped so that they no longer take up an entry
+    claims_cache.discard(token)
 
 
-def is_token_revoked(token: str) -> bool:
+async def is_token_revoked(claims: dict[str, Any]) -> bool:
     """
     Check if a token has been revoked.
 
     Args:
-        token: Token to check
+        claims: Verified claims of the token
 
     Returns:
         True if token is revoked, False otherwise
     """
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        token_id = payload.get("jti")
-        return token_id in revoked_tokens if token_id else False
-    except JWTError:
-        return True
+    token_id = claims.get("jti")
+    return await revocation_list.is_revoked(token_id) if token_id else False
+
+
+def token_verification_stats() -> dict[str, Any]:
+    """
+    Get claims cache and revoked token list counters.
+
+    Returns:
+        Dict with the statistics of the claims cache and the revocation list
+    """
+    return {
+        "claims_cache": claims_cache.stats(),
+        "revocation_list": revocation_list.stats(),
+    }
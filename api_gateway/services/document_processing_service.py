@@ -5,10 +5,19 @@ import httpx
 from fastapi import status
 
 from core.config import settings
-from shared.exceptions.base import ApplicationError, ServiceUnavailableError
+from shared.exceptions.base import (
+    ApplicationError,
+    NotModifiedError,
+    ServiceUnavailableError,
+)
+from shared.utils.conditional import conditional_headers
+from utils.http_clients import client_registry
+from utils.response_cache import cached, is_terminal
+from utils.single_flight import coalesce
 
 logger = logging.getLogger(__name__)
 
+SERVICE_NAME = "document_processing"
 BASE_URL = settings.DOCUMENT_PROCESSING_SERVICE_URL
 DEFAULT_TIMEOUT = settings.API_GATEWAY_DEFAULT_TIMEOUT
 
@@ -40,18 +49,18 @@ async def process_document(
         payload["options"] = options
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.post(url, json=payload)
-
-            if response.status_code == status.HTTP_202_ACCEPTED:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error processing document: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_202_ACCEPTED:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error processing document: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Document Processing Service: {exc}")
         raise ServiceUnavailableError(
@@ -60,6 +69,12 @@ async def process_document(
         )
 
 
+@cached(
+    "processing_results",
+    ttl=settings.RESPONSE_CACHE_RESULT_TTL_SECONDS,
+    cacheable=is_terminal,
+)
+@coalesce("processing_jobs")
 async def get_processing_status(job_id: str) -> dict[str, Any]:
     """
     Get the status of a document processing job.
@@ -77,23 +92,27 @@ async def get_processing_status(job_id: str) -> dict[str, Any]:
     url = f"{BASE_URL}/api/v1/process/{job_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            elif response.status_code == status.HTTP_404_NOT_FOUND:
-                raise ApplicationError(
-                    message=f"Processing job with ID {job_id} not found",
-                    status_code=status.HTTP_404_NOT_FOUND,
-                )
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error retrieving processing status: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(
+            url, headers=conditional_headers(), timeout=DEFAULT_TIMEOUT
+        )
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        elif response.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise NotModifiedError(response.headers.get("etag", ""))
+        elif response.status_code == status.HTTP_404_NOT_FOUND:
+            raise ApplicationError(
+                message=f"Processing job with ID {job_id} not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error retrieving processing status: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Document Processing Service: {exc}")
         raise ServiceUnavailableError(
@@ -134,18 +153,18 @@ async def list_processing_jobs(
         params["document_id"] = document_id
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error listing processing jobs: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error listing processing jobs: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Document Processing Service: {exc}")
         raise ServiceUnavailableError(
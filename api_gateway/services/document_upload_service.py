@@ -1,20 +1,32 @@
 import logging
-from typing import Any
+from typing import Any, AsyncIterator, BinaryIO
 
 import httpx
-from fastapi import status
+from fastapi import Request, status
+from fastapi.responses import StreamingResponse
 
 from core.config import settings
-from shared.exceptions.base import ApplicationError, ServiceUnavailableError
+from schemas.document_schema import DocumentStatus, DocumentType
+from shared.exceptions.base import (
+    ApplicationError,
+    NotModifiedError,
+    ServiceUnavailableError,
+)
+from shared.utils.conditional import conditional_headers
+from utils.http_clients import client_registry
+from utils.proxy import proxy_request, stream_proxy_response
+from utils.single_flight import coalesce
+from utils.streaming import limit_body_size
 
 logger = logging.getLogger(__name__)
 
+SERVICE_NAME = "document_ingestion"
 BASE_URL = settings.DOCUMENT_INGESTION_SERVICE_URL
 DEFAULT_TIMEOUT = settings.API_GATEWAY_DEFAULT_TIMEOUT
 
 
 async def upload_document(
-    file_content: bytes,
+    file_content: bytes | BinaryIO,
     filename: str,
     content_type: str,
     metadata: dict[str, Any] | None = None,
@@ -23,7 +35,7 @@ async def upload_document(
     Upload a document to the Document Ingestion Service.
 
     Args:
-        file_content: Binary content of the file
+        file_content: Binary content of the file, or a file object to stream from
         filename: Name of the file
         content_type: MIME type of the file
         metadata: Optional metadata for the document
@@ -44,18 +56,19 @@ async def upload_document(
         data["metadata"] = metadata
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.post(url, files=files, data=data)
-
-            if response.status_code == status.HTTP_201_CREATED:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error uploading document: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.post(
+            url, files=files, data=data, timeout=DEFAULT_TIMEOUT
+        )
+
+        if response.status_code == status.HTTP_201_CREATED:
+            return response.json()
+        else:
+            error_message = _error_message(response)
+            raise ApplicationError(
+                message=f"Error uploading document: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Document Ingestion Service: {exc}")
         raise ServiceUnavailableError(
@@ -64,6 +77,101 @@ async def upload_document(
         )
 
 
+async def stream_upload_document(
+    body: AsyncIterator[bytes],
+    content_type: str,
+    content_length: int | None = None,
+) -> dict[str, Any]:
+    """
+    Stream a multipart upload body to the Document Ingestion Service as it arrives.
+
+    The body is forwarded chunk by chunk without being parsed or buffered, so
+    memory use per upload stays bounded regardless of the file size.
+
+    Args:
+        body: Async iterator producing the raw multipart request body
+        content_type: Content-Type of the body, including the multipart boundary
+        content_length: Declared body size in bytes, if the client sent one
+
+    Returns:
+        dict containing the uploaded document information
+
+    Raises:
+        ValidationError: If the body exceeds the maximum allowed size
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    headers = {"Content-Type": content_type}
+    if content_length is not None:
+        headers["Content-Length"] = str(content_length)
+
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="POST",
+        path="/documents/upload",
+        headers=headers,
+        binary_data=limit_body_size(body, settings.MAX_CONTENT_LENGTH),
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+    if response.status_code == status.HTTP_201_CREATED:
+        return response.json()
+
+    error_message = _error_message(response)
+    raise ApplicationError(
+        message=f"Error uploading document: {error_message}",
+        status_code=response.status_code,
+    )
+
+
+async def stream_upload_documents(
+    body: AsyncIterator[bytes],
+    content_type: str,
+    content_length: int | None = None,
+) -> dict[str, Any]:
+    """
+    Stream a multipart body of several files to the Document Ingestion Service.
+
+    Ingestion stores the files concurrently and records them with one bulk
+    insert, so the whole batch costs a single downstream round trip.
+
+    Args:
+        body: Async iterator producing the raw multipart request body
+        content_type: Content-Type of the body, including the multipart boundary
+        content_length: Declared body size in bytes, if the client sent one
+
+    Returns:
+        dict containing one result per file and the succeeded and failed counts
+
+    Raises:
+        ValidationError: If the body exceeds the maximum allowed size
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    headers = {"Content-Type": content_type}
+    if content_length is not None:
+        headers["Content-Length"] = str(content_length)
+
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="POST",
+        path="/documents/batch",
+        headers=headers,
+        binary_data=limit_body_size(body, settings.BATCH_MAX_CONTENT_LENGTH),
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+    if response.status_code == status.HTTP_207_MULTI_STATUS:
+        return response.json()
+
+    error_message = _error_message(response)
+    raise ApplicationError(
+        message=f"Error uploading documents: {error_message}",
+        status_code=response.status_code,
+    )
+
+
+@coalesce("documents")
 async def get_document(document_id: str) -> dict[str, Any]:
     """
     Get document details from the Document Ingestion Service.
@@ -81,23 +189,26 @@ async def get_document(document_id: str) -> dict[str, Any]:
     url = f"{BASE_URL}/api/v1/documents/{document_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            elif response.status_code == status.HTTP_404_NOT_FOUND:
-                raise ApplicationError(
-                    message=f"Document with ID {document_id} not found",
-                    status_code=status.HTTP_404_NOT_FOUND,
-                )
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error retrieving document: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(
+            url, headers=conditional_headers(), timeout=DEFAULT_TIMEOUT
+        )
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        elif response.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise NotModifiedError(response.headers.get("etag", ""))
+        elif response.status_code == status.HTTP_404_NOT_FOUND:
+            raise ApplicationError(
+                message=f"Document with ID {document_id} not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        else:
+            error_message = _error_message(response)
+            raise ApplicationError(
+                message=f"Error retrieving document: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Document Ingestion Service: {exc}")
         raise ServiceUnavailableError(
@@ -107,52 +218,279 @@ async def get_document(document_id: str) -> dict[str, Any]:
 
 
 async def list_documents(
-    page: int = 1,
     limit: int = 10,
-    status_filter: str | None = None,
-    document_type: str | None = None,
+    cursor: str | None = None,
+    status_filter: DocumentStatus | None = None,
+    document_type: DocumentType | None = None,
 ) -> dict[str, Any]:
     """
     List documents from the Document Ingestion Service.
 
     Args:
-        page: Page number for pagination
         limit: Number of items per page
+        cursor: Cursor from the previous page, or None for the first page
         status_filter: Optional filter by document status
         document_type: Optional filter by document type
 
     Returns:
-        dict containing the list of documents and pagination info
+        dict containing the list of documents and the cursor for the next page
 
     Raises:
         ServiceUnavailableError: If the service is unavailable
         ApplicationError: If there's an error with the request
     """
-    url = f"{BASE_URL}/api/v1/documents"
-    params: dict[str, Any] = {"page": page, "limit": limit}
+    params: dict[str, Any] = {"limit": limit}
+
+    if cursor:
+        params["cursor"] = cursor
 
     if status_filter:
-        params["status"] = status_filter
+        params["status"] = status_filter.value
 
     if document_type:
-        params["type"] = document_type
+        params["type"] = document_type.value
+
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="GET",
+        path="/documents/",
+        params=params,
+        timeout=DEFAULT_TIMEOUT,
+    )
 
+    if response.status_code == status.HTTP_200_OK:
+        return response.json()
+
+    error_message = _error_message(response)
+    raise ApplicationError(
+        message=f"Error listing documents: {error_message}",
+        status_code=response.status_code,
+    )
+
+
+async def export_documents(
+    request: Request,
+    status_filter: DocumentStatus | None = None,
+    document_type: DocumentType | None = None,
+) -> StreamingResponse:
+    """
+    Stream the document catalog from the Document Ingestion Service as NDJSON.
+
+    The export is relayed chunk by chunk without being parsed, so memory use
+    stays constant regardless of the catalog size.
+
+    Args:
+        request: The incoming export request
+        status_filter: Optional filter by document status
+        document_type: Optional filter by document type
+
+    Returns:
+        StreamingResponse relaying the NDJSON export
+
+    Raises:
+        ServiceUnavailableError: If the service is unavailable
+        ServiceTimeoutError: If the service stops sending data
+    """
+    params: dict[str, Any] = {}
+
+    if status_filter:
+        params["status"] = status_filter.value
+
+    if document_type:
+        params["type"] = document_type.value
+
+    return await stream_proxy_response(
+        service_name=SERVICE_NAME,
+        request=request,
+        path="/documents/export",
+        params=params,
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+
+def _error_message(response: httpx.Response) -> str:
+    """Get the error message of a failed Document Ingestion Service response."""
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error listing documents: {error_message}",
-                    status_code=response.status_code,
-                )
-    except httpx.RequestError as exc:
-        logger.error(f"Error connecting to Document Ingestion Service: {exc}")
-        raise ServiceUnavailableError(
-            service_name="Document Ingestion Service",
-            detail="Document Ingestion Service is currently unavailable",
+        body = response.json()
+    except ValueError:
+        return "Unknown error"
+
+    detail = body.get("detail") if isinstance(body, dict) else None
+    if isinstance(detail, dict):
+        return detail.get("error", "Unknown error")
+    if isinstance(detail, list):
+        # Request validation errors, one per invalid field
+        return "; ".join(
+            error.get("msg", "Invalid value") if isinstance(error, dict) else str(error)
+            for error in detail
         )
+    if isinstance(detail, str):
+        return detail
+    return "Unknown error"
+
+
+def _upload_session_result(
+    response: httpx.Response, expected_status: int, action: str
+) -> dict[str, Any]:
+    """Return the response body of an upload session call, or raise its error."""
+    if response.status_code == expected_status:
+        return response.json()
+
+    error_message = _error_message(response)
+    raise ApplicationError(
+        message=f"Error {action}: {error_message}",
+        status_code=response.status_code,
+    )
+
+
+async def create_upload_session(session_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Start a resumable upload on the Document Ingestion Service.
+
+    Args:
+        session_data: Filename, size, MIME type and optional chunk size
+
+    Returns:
+        dict containing the upload session
+
+    Raises:
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="POST",
+        path="/documents/uploads/",
+        json_data=session_data,
+        timeout=DEFAULT_TIMEOUT,
+    )
+    return _upload_session_result(
+        response, status.HTTP_201_CREATED, "creating upload session"
+    )
+
+
+async def get_upload_session(session_id: str) -> dict[str, Any]:
+    """
+    Get the progress of a resumable upload.
+
+    Args:
+        session_id: ID of the upload session
+
+    Returns:
+        dict containing the upload session, including received and missing chunks
+
+    Raises:
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="GET",
+        path=f"/documents/uploads/{session_id}",
+        timeout=DEFAULT_TIMEOUT,
+    )
+    return _upload_session_result(
+        response, status.HTTP_200_OK, "retrieving upload session"
+    )
+
+
+async def upload_chunk(
+    session_id: str,
+    body: AsyncIterator[bytes],
+    content_range: str,
+    content_length: int | None = None,
+    checksum: str | None = None,
+) -> dict[str, Any]:
+    """
+    Stream one chunk of a resumable upload to the Document Ingestion Service.
+
+    Chunks of the same session may be sent concurrently over separate
+    connections; each one is forwarded as it arrives without buffering.
+
+    Args:
+        session_id: ID of the upload session
+        body: Async iterator producing the chunk content
+        content_range: ``Content-Range`` header locating the chunk in the file
+        content_length: Declared chunk size in bytes, if the client sent one
+        checksum: Optional hex SHA-256 of the chunk content
+
+    Returns:
+        dict containing the updated upload session
+
+    Raises:
+        ValidationError: If the chunk exceeds the maximum allowed size
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    headers = {
+        "Content-Type": "application/octet-stream",
+        "Content-Range": content_range,
+    }
+    if content_length is not None:
+        headers["Content-Length"] = str(content_length)
+    if checksum:
+        headers["X-Chunk-SHA256"] = checksum
+
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="PATCH",
+        path=f"/documents/uploads/{session_id}",
+        headers=headers,
+        binary_data=limit_body_size(body, settings.MAX_CONTENT_LENGTH),
+        timeout=DEFAULT_TIMEOUT,
+    )
+    return _upload_session_result(response, status.HTTP_200_OK, "uploading chunk")
+
+
+async def complete_upload_session(
+    session_id: str, sha256: str | None = None
+) -> dict[str, Any]:
+    """
+    Finish a resumable upload and create its document.
+
+    Args:
+        session_id: ID of the upload session
+        sha256: Optional hex SHA-256 the whole file must match
+
+    Returns:
+        dict containing the created document
+
+    Raises:
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="POST",
+        path=f"/documents/uploads/{session_id}/complete",
+        json_data={"sha256": sha256},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    return _upload_session_result(
+        response, status.HTTP_201_CREATED, "completing upload session"
+    )
+
+
+async def abort_upload_session(session_id: str) -> dict[str, Any]:
+    """
+    Abandon a resumable upload.
+
+    Args:
+        session_id: ID of the upload session
+
+    Returns:
+        dict containing the aborted upload session
+
+    Raises:
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    response = await proxy_request(
+        service_name=SERVICE_NAME,
+        method="DELETE",
+        path=f"/documents/uploads/{session_id}",
+        timeout=DEFAULT_TIMEOUT,
+    )
+    return _upload_session_result(
+        response, status.HTTP_200_OK, "aborting upload session"
+    )
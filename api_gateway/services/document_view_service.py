@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable
+
+from core.config import settings
+from services import (
+    document_processing_service,
+    document_upload_service,
+    entity_extraction_service,
+    workflow_service,
+)
+from shared.exceptions.base import (
+    ApplicationError,
+    ServiceTimeoutError,
+    ValidationError,
+)
+from shared.utils.conditional import without_validators
+from shared.utils.serialization import unwrap_envelope
+
+logger = logging.getLogger(__name__)
+
+BRANCH_TIMEOUT = settings.DOCUMENT_VIEW_BRANCH_TIMEOUT_SECONDS
+
+# Optional branches of the view and the service each one reads from
+VIEW_FIELDS = {
+    "processing": "Document Processing Service",
+    "extraction": "Entity Extraction Service",
+    "workflows": "Task Orchestration Service",
+}
+
+
+def parse_fields(fields: str | None) -> list[str]:
+    """
+    Parse a comma-separated field selection.
+
+    Args:
+        fields: Requested branches, or None for all of them
+
+    Returns:
+        The requested branch names, in VIEW_FIELDS order
+
+    Raises:
+        ValidationError: If an unknown field is requested
+    """
+    if fields is None:
+        return list(VIEW_FIELDS)
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - VIEW_FIELDS.keys()
+    if unknown:
+        raise ValidationError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed fields: {', '.join(VIEW_FIELDS)}",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    return [field for field in VIEW_FIELDS if field in requested]
+
+
+async def _latest_processing_job(document_id: str) -> dict[str, Any] | None:
+    """Get the most recent processing job of a document."""
+    jobs = unwrap_envelope(
+        await document_processing_service.list_processing_jobs(
+            limit=1, document_id=document_id
+        )
+    )
+    items = jobs.get("items") or []
+    return items[0] if items else None
+
+
+async def _latest_extraction_result(document_id: str) -> dict[str, Any] | None:
+    """Get the result of the most recent extraction job of a document."""
+    jobs = unwrap_envelope(
+        await entity_extraction_service.list_extraction_jobs(
+            limit=1, document_id=document_id
+        )
+    )
+    items = jobs.get("items") or []
+    if not items:
+        return None
+    return unwrap_envelope(
+        await entity_extraction_service.get_extraction_result(items[0]["id"])
+    )
+
+
+async def _workflows(document_id: str) -> list[dict[str, Any]]:
+    """Get the most recent workflows of a document."""
+    workflows = unwrap_envelope(
+        await workflow_service.list_workflows(
+            limit=settings.DOCUMENT_VIEW_WORKFLOW_LIMIT, document_id=document_id
+        )
+    )
+    return workflows.get("items") or []
+
+
+BRANCHES: dict[str, Callable[[str], Awaitable[Any]]] = {
+    "processing": _latest_processing_job,
+    "extraction": _latest_extraction_result,
+    "workflows": _workflows,
+}
+
+
+async def _run_branch(field: str, document_id: str) -> Any:
+    """Run one branch of the view within its time budget."""
+    try:
+        return await asyncio.wait_for(BRANCHES[field](document_id), BRANCH_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise ServiceTimeoutError(
+            service_name=VIEW_FIELDS[field],
+            detail=f"No response within {BRANCH_TIMEOUT} seconds",
+        )
+
+
+async def get_document_view(
+    document_id: str, fields: list[str] | None = None
+) -> dict[str, Any]:
+    """
+    Get a document together with its processing, extraction and workflows.
+
+    The document and every selected branch are read concurrently, each
+    branch within DOCUMENT_VIEW_BRANCH_TIMEOUT_SECONDS. A branch that fails
+    or times out is reported under ``errors`` and set to None, and the rest
+    of the view is still returned. Only the document itself is required.
+
+    Args:
+        document_id: ID of the document
+        fields: Branches to include, or None for all of them
+
+    Returns:
+        Dict with the document, each selected branch and any branch errors
+
+    Raises:
+        ServiceUnavailableError: If the document cannot be read
+        ApplicationError: If the document does not exist
+    """
+    fields = list(VIEW_FIELDS) if fields is None else fields
+
+    # The client's If-None-Match refers to the composite view, not to the
+    # resources it is built from, so it must not be forwarded downstream.
+    with without_validators():
+        results = await asyncio.gather(
+            document_upload_service.get_document(document_id),
+            *(_run_branch(field, document_id) for field in fields),
+            return_exceptions=True,
+        )
+
+    document, *branch_results = results
+    if isinstance(document, BaseException):
+        raise document
+
+    view: dict[str, Any] = {"document": unwrap_envelope(document)}
+    errors: dict[str, dict[str, Any]] = {}
+    for field, result in zip(fields, branch_results):
+        if isinstance(result, ApplicationError):
+            logger.warning(f"Document view branch {field} failed: {result}")
+            errors[field] = {"error": result.message, "status_code": result.status_code}
+            view[field] = None
+        elif isinstance(result, BaseException):
+            logger.error(f"Unexpected error in document view branch {field}: {result}")
+            errors[field] = {
+                "error": str(result),
+                "status_code": int(HTTPStatus.INTERNAL_SERVER_ERROR),
+            }
+            view[field] = None
+        else:
+            view[field] = result
+    view["errors"] = errors
+    return view
@@ -5,10 +5,18 @@ import httpx
 from fastapi import status
 
 from core.config import settings
-from shared.exceptions.base import ApplicationError, ServiceUnavailableError
+from shared.exceptions.base import (
+    ApplicationError,
+    NotModifiedError,
+    ServiceUnavailableError,
+)
+from shared.utils.conditional import conditional_headers
+from utils.http_clients import client_registry
+from utils.response_cache import cached, is_terminal
 
 logger = logging.getLogger(__name__)
 
+SERVICE_NAME = "entity_extraction"
 BASE_URL = settings.ENTITY_EXTRACTION_SERVICE_URL
 DEFAULT_TIMEOUT = settings.API_GATEWAY_DEFAULT_TIMEOUT
 
@@ -40,18 +48,18 @@ async def extract_entities(
         payload["options"] = options
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.post(url, json=payload)
-
-            if response.status_code == status.HTTP_202_ACCEPTED:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error extracting entities: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_202_ACCEPTED:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error extracting entities: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Entity Extraction Service: {exc}")
         raise ServiceUnavailableError(
@@ -60,6 +68,11 @@ async def extract_entities(
         )
 
 
+@cached(
+    "extraction_results",
+    ttl=settings.RESPONSE_CACHE_RESULT_TTL_SECONDS,
+    cacheable=is_terminal,
+)
 async def get_extraction_result(job_id: str) -> Dict[str, Any]:
     """
     Get the result of an entity extraction job.
@@ -77,23 +90,79 @@ async def get_extraction_result(job_id: str) -> Dict[str, Any]:
     url = f"{BASE_URL}/api/v1/extract/{job_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            elif response.status_code == status.HTTP_404_NOT_FOUND:
-                raise ApplicationError(
-                    message=f"Extraction job with ID {job_id} not found",
-                    status_code=status.HTTP_404_NOT_FOUND,
-                )
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error retrieving extraction results: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(
+            url, headers=conditional_headers(), timeout=DEFAULT_TIMEOUT
+        )
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        elif response.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise NotModifiedError(response.headers.get("etag", ""))
+        elif response.status_code == status.HTTP_404_NOT_FOUND:
+            raise ApplicationError(
+                message=f"Extraction job with ID {job_id} not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error retrieving extraction results: {error_message}",
+                status_code=response.status_code,
+            )
+    except httpx.RequestError as exc:
+        logger.error(f"Error connecting to Entity Extraction Service: {exc}")
+        raise ServiceUnavailableError(
+            service_name="Entity Extraction Service",
+            detail="Entity Extraction Service is currently unavailable",
+        )
+
+
+async def list_extraction_jobs(
+    page: int = 1,
+    limit: int = 10,
+    status_filter: Optional[str] = None,
+    document_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    List entity extraction jobs.
+
+    Args:
+        page: Page number for pagination
+        limit: Number of items per page
+        status_filter: Optional filter by job status
+        document_id: Optional filter by document ID
+
+    Returns:
+        Dict containing the list of extraction jobs and pagination info
+
+    Raises:
+        ServiceUnavailableError: If the service is unavailable
+        ApplicationError: If there's an error with the request
+    """
+    url = f"{BASE_URL}/api/v1/extract"
+    params: Dict[str, Any] = {"page": page, "limit": limit}
+
+    if status_filter:
+        params["status"] = status_filter
+
+    if document_id:
+        params["document_id"] = document_id
+
+    try:
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error listing extraction jobs: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Entity Extraction Service: {exc}")
         raise ServiceUnavailableError(
@@ -102,6 +171,7 @@ async def get_extraction_result(job_id: str) -> Dict[str, Any]:
         )
 
 
+@cached("entity_types", ttl=settings.RESPONSE_CACHE_REFERENCE_TTL_SECONDS)
 async def get_entity_types() -> List[Dict[str, Any]]:
     """
     Get the list of supported entity types.
@@ -116,18 +186,18 @@ async def get_entity_types() -> List[Dict[str, Any]]:
     url = f"{BASE_URL}/api/v1/entity-types"
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error retrieving entity types: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(url, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error retrieving entity types: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Entity Extraction Service: {exc}")
         raise ServiceUnavailableError(
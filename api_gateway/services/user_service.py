@@ -36,7 +36,7 @@ async def create_user(
     # This would typically involve a database operation
     # For now, we'll use a mock implementation
 
-    hashed_password = authentication_service.get_password_hash(password)
+    hashed_password = await authentication_service.get_password_hash(password)
 
     user_data = UserInDB(
         id=f"user-{username}-{datetime.now(timezone.utc).timestamp()}",
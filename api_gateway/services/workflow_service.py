@@ -5,10 +5,19 @@ import httpx
 from fastapi import status
 
 from core.config import settings
-from shared.exceptions.base import ApplicationError, ServiceUnavailableError
+from shared.exceptions.base import (
+    ApplicationError,
+    NotModifiedError,
+    ServiceUnavailableError,
+)
+from shared.utils.conditional import conditional_headers
+from utils.http_clients import client_registry
+from utils.response_cache import cached
+from utils.single_flight import coalesce
 
 logger = logging.getLogger(__name__)
 
+SERVICE_NAME = "task_orchestration"
 BASE_URL = settings.TASK_ORCHESTRATION_SERVICE_URL
 DEFAULT_TIMEOUT = settings.API_GATEWAY_DEFAULT_TIMEOUT
 
@@ -44,18 +53,18 @@ async def create_workflow(
         payload["config"] = config
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.post(url, json=payload)
-
-            if response.status_code == status.HTTP_201_CREATED:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error creating workflow: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.post(url, json=payload, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_201_CREATED:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error creating workflow: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Task Orchestration Service: {exc}")
         raise ServiceUnavailableError(
@@ -64,6 +73,7 @@ async def create_workflow(
         )
 
 
+@coalesce("workflows")
 async def get_workflow(workflow_id: str) -> dict[str, Any]:
     """
     Get workflow details.
@@ -81,23 +91,27 @@ async def get_workflow(workflow_id: str) -> dict[str, Any]:
     url = f"{BASE_URL}/api/v1/workflows/{workflow_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            elif response.status_code == status.HTTP_404_NOT_FOUND:
-                raise ApplicationError(
-                    message=f"Workflow with ID {workflow_id} not found",
-                    status_code=status.HTTP_404_NOT_FOUND,
-                )
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error retrieving workflow: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(
+            url, headers=conditional_headers(), timeout=DEFAULT_TIMEOUT
+        )
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        elif response.status_code == status.HTTP_304_NOT_MODIFIED:
+            raise NotModifiedError(response.headers.get("etag", ""))
+        elif response.status_code == status.HTTP_404_NOT_FOUND:
+            raise ApplicationError(
+                message=f"Workflow with ID {workflow_id} not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error retrieving workflow: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Task Orchestration Service: {exc}")
         raise ServiceUnavailableError(
@@ -138,18 +152,18 @@ async def list_workflows(
         params["document_id"] = document_id
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url, params=params)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error listing workflows: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(url, params=params, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error listing workflows: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Task Orchestration Service: {exc}")
         raise ServiceUnavailableError(
@@ -158,6 +172,7 @@ async def list_workflows(
         )
 
 
+@cached("workflow_types", ttl=settings.RESPONSE_CACHE_REFERENCE_TTL_SECONDS)
 async def get_workflow_types() -> list[dict[str, Any]]:
     """
     Get the list of supported workflow types.
@@ -172,18 +187,18 @@ async def get_workflow_types() -> list[dict[str, Any]]:
     url = f"{BASE_URL}/api/v1/workflow-types"
 
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            response = await client.get(url)
-
-            if response.status_code == status.HTTP_200_OK:
-                return response.json()
-            else:
-                error_detail = response.json().get("detail", {})
-                error_message = error_detail.get("error", "Unknown error")
-                raise ApplicationError(
-                    message=f"Error retrieving workflow types: {error_message}",
-                    status_code=response.status_code,
-                )
+        client = client_registry.get(SERVICE_NAME)
+        response = await client.get(url, timeout=DEFAULT_TIMEOUT)
+
+        if response.status_code == status.HTTP_200_OK:
+            return response.json()
+        else:
+            error_detail = response.json().get("detail", {})
+            error_message = error_detail.get("error", "Unknown error")
+            raise ApplicationError(
+                message=f"Error retrieving workflow types: {error_message}",
+                status_code=response.status_code,
+            )
     except httpx.RequestError as exc:
         logger.error(f"Error connecting to Task Orchestration Service: {exc}")
         raise ServiceUnavailableError(
@@ -0,0 +1,101 @@
+"""
+Concurrent fan-out of batch requests.
+
+A batch endpoint accepts many items in one request and submits each one
+downstream through the same service function as its single-item endpoint.
+At most BATCH_CONCURRENCY items are in flight at once, and every item gets
+its own result, so one failure does not fail the batch.
+"""
+import asyncio
+import logging
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+
+from core.config import settings
+from shared.exceptions.base import ApplicationError, ValidationError
+from shared.utils.serialization import unwrap_envelope
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def check_batch_size(count: int) -> None:
+    """
+    Reject empty batches and batches larger than BATCH_MAX_ITEMS.
+
+    Args:
+        count: Number of items in the batch
+
+    Raises:
+        ValidationError: If the batch is empty or too large
+    """
+    if count == 0:
+        raise ValidationError("A batch must contain at least one item")
+    if count > settings.BATCH_MAX_ITEMS:
+        raise ValidationError(
+            f"A batch may contain at most {settings.BATCH_MAX_ITEMS} items",
+            status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        )
+
+
+async def run_batch(
+    items: Sequence[T],
+    handler: Callable[[T], Awaitable[Any]],
+    success_status_code: int,
+) -> dict[str, Any]:
+    """
+    Submit every item of a batch concurrently and collect per-item results.
+
+    Args:
+        items: The batch items
+        handler: Coroutine function submitting one item downstream
+        success_status_code: Status code reported for items that succeed
+
+    Returns:
+        Dict with one result per item, in request order, and the number of
+        items that succeeded and failed
+
+    Raises:
+        ValidationError: If the batch is empty or too large
+    """
+    check_batch_size(len(items))
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def submit(index: int, item: T) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                result = await handler(item)
+            except ApplicationError as ex:
+                return _failure(index, ex.status_code, ex.message)
+            except Exception as ex:
+                logger.error(f"Unexpected error in batch item {index}: {ex}")
+                return _failure(index, HTTPStatus.INTERNAL_SERVER_ERROR, str(ex))
+        return {
+            "index": index,
+            "success": True,
+            "status_code": int(success_status_code),
+            "data": unwrap_envelope(result),
+            "error": None,
+        }
+
+    results = await asyncio.gather(
+        *(submit(index, item) for index, item in enumerate(items))
+    )
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "items": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+    }
+
+
+def _failure(index: int, status_code: int, message: str) -> dict[str, Any]:
+    """Build the result of a batch item that failed."""
+    return {
+        "index": index,
+        "success": False,
+        "status_code": int(status_code),
+        "data": None,
+        "error": message,
+    }
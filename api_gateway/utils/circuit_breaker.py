@@ -0,0 +1,326 @@
+"""
+Per-service circuit breakers for downstream calls.
+
+Each breaker tracks outcomes over a rolling time window split into buckets.
+It opens when the failure rate in the window crosses a threshold, rejects
+calls while cooling down, then lets a limited number of probe requests
+through (half-open) before deciding whether to close again.
+
+Each admitted call gets a permit naming the state it was admitted in, so a
+slow call admitted before the circuit opened cannot close or reopen it once
+it is probing; only the probes' own outcomes decide that.
+
+Breakers are enforced by CircuitBreakerTransport on every pooled client, so
+they cover all calls to a service, not only proxied ones. Health probes
+bypass them through the BYPASS_CIRCUIT_BREAKER request extension, so that
+the health monitor sees a service recover on its own and its probes do
+not change the breaker's state. Breakers are
+per-process and only mutated from the event loop without awaiting in
+between, so no locking is needed.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable
+
+import httpx
+
+from core.config import settings
+from shared.exceptions import ServiceUnavailableError
+from shared.utils.deadline import remaining_time
+
+logger = logging.getLogger(__name__)
+
+# httpx request extension that sends a call past the breaker unrecorded
+BYPASS_CIRCUIT_BREAKER = "bypass_circuit_breaker"
+
+
+class CircuitState(str, Enum):
+    """Enum for circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitPermit:
+    """Admission of one call by a circuit breaker."""
+
+    # Number of state changes the breaker had gone through when the call
+    # was admitted; outcomes from an earlier state are ignored.
+    generation: int
+    probe: bool
+
+
+class CircuitBreaker:
+    """Rolling-window failure-rate circuit breaker with half-open probing."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_rate_threshold: float,
+        minimum_requests: int,
+        window_seconds: float,
+        buckets: int,
+        cooldown_seconds: float,
+        half_open_max_probes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_probes = half_open_max_probes
+        self._clock = clock
+
+        self._bucket_count = max(buckets, 1)
+        self._bucket_width = window_seconds / self._bucket_count
+        self._bucket_epochs = [-1] * self._bucket_count
+        self._successes = [0] * self._bucket_count
+        self._failures = [0] * self._bucket_count
+
+        self._state = CircuitState.CLOSED
+        self._generation = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once cooled down."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.cooldown_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def allow_request(self) -> CircuitPermit | None:
+        """
+        Decide whether a call may be sent to the service.
+
+        Returns:
+            A permit to pass to ``record`` once the call has finished, or None
+            if the call should be rejected
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return CircuitPermit(self._generation, probe=False)
+
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._probes_in_flight + self._probe_successes
+            < self.half_open_max_probes
+        ):
+            self._probes_in_flight += 1
+            return CircuitPermit(self._generation, probe=True)
+
+        self._rejected += 1
+        return None
+
+    def record(self, permit: CircuitPermit, failed: bool | None) -> None:
+        """
+        Record the outcome of a call admitted by ``allow_request``.
+
+        Args:
+            permit: The permit the call was admitted with
+            failed: True for a failure, False for a success, None when the call
+                ended without a verdict (e.g. it was cancelled)
+        """
+        if permit.generation != self._generation:
+            # Admitted before the last state change; its outcome describes
+            # the service as it was then.
+            return
+
+        if permit.probe:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+            if failed is None:
+                return
+            if failed:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_max_probes:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if failed is None or self._state is CircuitState.OPEN:
+            return
+
+        index = self._current_bucket()
+        if failed:
+            self._failures[index] += 1
+        else:
+            self._successes[index] += 1
+
+        total, failures = self._window_totals()
+        if (
+            total >= self.minimum_requests
+            and failures / total >= self.failure_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get the breaker state for reporting.
+
+        Returns:
+            Dict describing the breaker state and window counters
+        """
+        state = self.state
+        total, failures = self._window_totals()
+        snapshot: dict[str, Any] = {
+            "state": state.value,
+            "window_requests": total,
+            "window_failures": failures,
+            "failure_rate": round(failures / total, 4) if total else 0.0,
+            "times_opened": self._times_opened,
+            "rejected": self._rejected,
+        }
+        if state is CircuitState.OPEN:
+            snapshot["retry_after_seconds"] = round(
+                max(self.cooldown_seconds - (self._clock() - self._opened_at), 0.0),
+                2,
+            )
+        elif state is CircuitState.HALF_OPEN:
+            snapshot["probes_in_flight"] = self._probes_in_flight
+            snapshot["probe_successes"] = self._probe_successes
+        return snapshot
+
+    def _current_bucket(self) -> int:
+        """Get the index of the bucket for the current time, resetting it if stale."""
+        epoch = int(self._clock() / self._bucket_width)
+        index = epoch % self._bucket_count
+        if self._bucket_epochs[index] != epoch:
+            self._bucket_epochs[index] = epoch
+            self._successes[index] = 0
+            self._failures[index] = 0
+        return index
+
+    def _window_totals(self) -> tuple[int, int]:
+        """Sum requests and failures over the buckets still inside the window."""
+        oldest_epoch = int(self._clock() / self._bucket_width) - self._bucket_count
+        total = failures = 0
+        for index, epoch in enumerate(self._bucket_epochs):
+            if epoch > oldest_epoch:
+                total += self._successes[index] + self._failures[index]
+                failures += self._failures[index]
+        return total, failures
+
+    def _reset_window(self) -> None:
+        """Forget all outcomes recorded in the rolling window."""
+        self._bucket_epochs = [-1] * self._bucket_count
+        self._successes = [0] * self._bucket_count
+        self._failures = [0] * self._bucket_count
+
+    def _transition(self, new_state: CircuitState) -> None:
+        """Move the breaker to a new state."""
+        old_state = self._state
+        self._state = new_state
+        self._generation += 1
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+        if new_state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+            self._times_opened += 1
+            logger.error(
+                f"Circuit breaker for {self.name} opened (was {old_state.value})"
+            )
+        elif new_state is CircuitState.CLOSED:
+            self._reset_window()
+            logger.info(f"Circuit breaker for {self.name} closed")
+        else:
+            logger.info(f"Circuit breaker for {self.name} half-open, probing")
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that admits calls through a CircuitBreaker.
+
+    Responses with a 5xx status, timeouts and connection errors count as
+    failures. Timeouts caused by the request's own deadline, and calls shed
+    or cancelled before an answer, give the breaker no verdict. Calls with
+    the BYPASS_CIRCUIT_BREAKER extension are neither rejected nor recorded.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, breaker: CircuitBreaker
+    ) -> None:
+        self.transport = transport
+        self.breaker = breaker
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.extensions.get(BYPASS_CIRCUIT_BREAKER):
+            return await self.transport.handle_async_request(request)
+
+        permit = self.breaker.allow_request()
+        if permit is None:
+            logger.error(
+                f"Circuit breaker is {self.breaker.state.value} for {self.breaker.name}"
+            )
+            raise ServiceUnavailableError(
+                service_name=self.breaker.name,
+                detail="Service is currently unavailable",
+            )
+
+        failed: bool | None = None
+        try:
+            response = await self.transport.handle_async_request(request)
+            failed = response.status_code >= 500
+            return response
+        except httpx.TimeoutException:
+            remaining = remaining_time()
+            failed = remaining is None or remaining > 0
+            raise
+        except httpx.TransportError:
+            failed = True
+            raise
+        finally:
+            self.breaker.record(permit, failed)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(service_name: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a service, creating it on first use.
+
+    Args:
+        service_name: Name of the downstream service
+
+    Returns:
+        The process-wide circuit breaker for the service
+    """
+    breaker = _breakers.get(service_name)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            service_name,
+            failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+            minimum_requests=settings.CIRCUIT_BREAKER_MINIMUM_REQUESTS,
+            window_seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+            buckets=settings.CIRCUIT_BREAKER_WINDOW_BUCKETS,
+            cooldown_seconds=settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+            half_open_max_probes=settings.CIRCUIT_BREAKER_HALF_OPEN_MAX_PROBES,
+        )
+        _breakers[service_name] = breaker
+    return breaker
+
+
+def circuit_breaker_states() -> dict[str, dict[str, Any]]:
+    """
+    Get a snapshot of every circuit breaker.
+
+    Returns:
+        Dict mapping service name to its breaker snapshot
+    """
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
@@ -0,0 +1,107 @@
+"""
+Cache of verified JWT claims.
+
+Verifying a token costs an HMAC and a JSON parse, and the same token is
+presented on every request of a session. Verified claims are therefore
+kept in a bounded in-process LRU keyed by a digest of the token, so the
+token itself is never stored, and each entry expires with the token's
+``exp`` claim, so a cached token is never accepted after it has expired.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def token_digest(token: str) -> str:
+    """
+    Get the cache key of a token.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class ClaimsCache:
+    """Bounded LRU of verified claims that expire with their token."""
+
+    def __init__(
+        self, max_entries: int, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """
+        Get the verified claims of a token, if they are cached and unexpired.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            The claims, or None on a miss
+        """
+        key = token_digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[1] <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        """
+        Cache the verified claims of a token until it expires.
+
+        Tokens without a numeric ``exp`` claim are not cached.
+
+        Args:
+            token: Encoded JWT
+            claims: Claims returned by a successful verification
+        """
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= self._clock():
+            return
+
+        key = token_digest(token)
+        self._entries[key] = (claims, float(expires_at))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        """
+        Drop a token's cached claims.
+
+        Args:
+            token: Encoded JWT
+        """
+        self._entries.pop(token_digest(token), None)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache occupancy and hit/miss counters.
+
+        Returns:
+            Dict with the entry count, capacity, hits, misses and hit ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,354 @@
+"""
+Adaptive per-service concurrency limits and load shedding.
+
+Each downstream service gets an AdaptiveLimiter that bounds how many calls
+may be in flight to it at once. The limit follows AIMD: it grows by one for
+every limit's worth of calls that come back quickly, and shrinks by
+ADAPTIVE_CONCURRENCY_BACKOFF_RATIO when latency rises well above the
+service's no-load baseline, or when calls time out or are answered with
+429/503. So when a service slows down, the gateway sends it less work
+instead of letting queues build up until every request times out.
+
+A call that finds its service at the limit is rejected at once with 503 and
+a Retry-After header rather than queued. Requests carry a priority taken
+from their route, and lower priorities may only use part of the limit, so
+bulk work is shed first and health checks and logins are shed last.
+"""
+import math
+import time
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Mapping
+
+import httpx
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from core.config import settings
+from shared.exceptions import ServiceOverloadedError
+from shared.utils.deadline import remaining_time
+
+# Latency must also exceed the baseline by this much before it counts as
+# congestion, so that jitter on very fast calls does not shrink the limit.
+LATENCY_SLACK_SECONDS = 0.05
+
+# Relative amount the no-load baseline may rise per uncongested sample, so
+# that it can follow a service whose normal latency has grown. Congested
+# samples never raise it, or sustained congestion would become the baseline.
+BASELINE_DRIFT = 0.01
+
+# Weight of each new sample in the smoothed latency
+LATENCY_SMOOTHING = 0.2
+
+# Calls sending larger bodies are not sampled, because their latency
+# measures the upload rather than the service.
+MAX_SAMPLED_BODY_BYTES = 64 * 1024
+
+# Statuses by which a service says it is overloaded
+OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+
+class Priority(IntEnum):
+    """Priority of a request when downstream capacity runs short."""
+
+    CRITICAL = 0
+    NORMAL = 1
+    BULK = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar(
+    "request_priority", default=Priority.NORMAL
+)
+
+
+def current_priority() -> Priority:
+    """Get the priority of the current request."""
+    return _current_priority.get()
+
+
+def set_priority(priority: Priority) -> None:
+    """Set the priority of the current task's downstream calls."""
+    _current_priority.set(priority)
+
+
+class RequestPriorityMiddleware:
+    """
+    Assign each request a priority from its path.
+
+    Args:
+        app: The ASGI application
+        route_priorities: Priorities for paths starting with a prefix; the
+            longest matching prefix wins, and other paths are NORMAL
+    """
+
+    def __init__(self, app: ASGIApp, route_priorities: Mapping[str, Priority]):
+        self.app = app
+        self.route_priorities = sorted(
+            route_priorities.items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = Priority.NORMAL
+        for prefix, route_priority in self.route_priorities:
+            if scope["path"].startswith(prefix):
+                priority = route_priority
+                break
+
+        token = _current_priority.set(priority)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_priority.reset(token)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for calls to one downstream service."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float,
+        min_limit: float,
+        max_limit: float,
+        latency_tolerance: float,
+        backoff_ratio: float,
+        priority_shares: Mapping[Priority, float],
+    ) -> None:
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.priority_shares = dict(priority_shares)
+        self.in_flight = 0
+        self.baseline_latency: float | None = None
+        self.smoothed_latency: float | None = None
+        self._last_decrease = 0.0
+        self.admitted = 0
+        self.rejected = {priority.name.lower(): 0 for priority in Priority}
+        self.decreases = 0
+
+    def try_acquire(self, priority: Priority) -> bool:
+        """
+        Take a slot for a call, unless the priority's share of the limit is used.
+
+        Args:
+            priority: Priority of the request making the call
+
+        Returns:
+            True if the call may proceed; it must then call ``release``
+        """
+        allowed = max(1.0, self.limit * self.priority_shares.get(priority, 1.0))
+        if self.in_flight >= allowed:
+            self.rejected[priority.name.lower()] += 1
+            return False
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        """Give back the slot of a finished call."""
+        self.in_flight = max(self.in_flight - 1, 0)
+
+    def record(self, latency: float | None, overloaded: bool = False) -> None:
+        """
+        Adjust the limit after a call.
+
+        Args:
+            latency: Seconds until the response headers arrived, or None if
+                the call says nothing about the service's latency
+            overloaded: Whether the call timed out or the service said it is
+                overloaded
+        """
+        if latency is not None:
+            if self.smoothed_latency is None:
+                self.smoothed_latency = latency
+            else:
+                self.smoothed_latency += LATENCY_SMOOTHING * (
+                    latency - self.smoothed_latency
+                )
+            if self.baseline_latency is None:
+                self.baseline_latency = latency
+            elif latency <= self._congestion_threshold(self.baseline_latency):
+                self.baseline_latency = min(
+                    latency, self.baseline_latency * (1 + BASELINE_DRIFT)
+                )
+
+        if overloaded or self._latency_congested():
+            self._decrease()
+        elif latency is not None and self.in_flight >= self.limit / 2:
+            # Only grow while the limit is actually being used; otherwise it
+            # would climb without bound during quiet periods.
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def retry_after(self) -> int:
+        """Get the number of seconds a rejected client should wait."""
+        return max(1, math.ceil(self.smoothed_latency or 0))
+
+    def _congestion_threshold(self, baseline: float) -> float:
+        """Get the latency above which calls count as congested."""
+        return max(baseline * self.latency_tolerance, baseline + LATENCY_SLACK_SECONDS)
+
+    def _latency_congested(self) -> bool:
+        """Whether smoothed latency is well above the no-load baseline."""
+        if self.smoothed_latency is None or self.baseline_latency is None:
+            return False
+        return self.smoothed_latency > self._congestion_threshold(self.baseline_latency)
+
+    def _decrease(self) -> None:
+        """Shrink the limit, at most once per round trip."""
+        now = time.monotonic()
+        if now - self._last_decrease < (self.smoothed_latency or 0):
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        self.decreases += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the current limit and its counters.
+
+        Returns:
+            Dict with the limit, calls in flight, latencies, admitted and
+            rejected calls, and how often the limit was decreased
+        """
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "baseline_latency_ms": _milliseconds(self.baseline_latency),
+            "smoothed_latency_ms": _milliseconds(self.smoothed_latency),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "decreases": self.decreases,
+        }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its limiter slot once it is closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class ConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that admits calls through an AdaptiveLimiter.
+
+    A call holds its slot until its response body is closed, so streamed
+    responses count against the limit for as long as they are relayed.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: AdaptiveLimiter
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.limiter.try_acquire(current_priority()):
+            raise ServiceOverloadedError(
+                service_name=self.limiter.name,
+                retry_after=self.limiter.retry_after(),
+            )
+
+        started = time.monotonic()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            remaining = remaining_time()
+            # A timeout cut short by the client's own deadline is no sign
+            # of overload.
+            if remaining is None or remaining > 0:
+                self.limiter.record(None, overloaded=True)
+            self.limiter.release()
+            raise
+        except BaseException:
+            self.limiter.release()
+            raise
+
+        self.limiter.record(
+            time.monotonic() - started if _is_sampled(request) else None,
+            overloaded=response.status_code in OVERLOAD_STATUS_CODES,
+        )
+        if isinstance(response.stream, httpx.AsyncByteStream):
+            response.stream = _ReleasingStream(response.stream, self.limiter.release)
+        else:
+            # Async transports only produce async streams; anything else
+            # cannot be tracked until it is closed
+            self.limiter.release()
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def _is_sampled(request: httpx.Request) -> bool:
+    """Whether a call's latency reflects the service rather than its upload."""
+    content_length = request.headers.get("content-length")
+    if content_length is None:
+        return "transfer-encoding" not in request.headers
+    return int(content_length) <= MAX_SAMPLED_BODY_BYTES
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(service_name: str) -> AdaptiveLimiter:
+    """
+    Get or create the concurrency limiter of a downstream service.
+
+    Args:
+        service_name: Name of the downstream service
+
+    Returns:
+        The shared AdaptiveLimiter instance
+    """
+    if service_name not in _limiters:
+        _limiters[service_name] = AdaptiveLimiter(
+            name=service_name,
+            initial_limit=settings.ADAPTIVE_CONCURRENCY_INITIAL_LIMIT,
+            min_limit=settings.ADAPTIVE_CONCURRENCY_MIN_LIMIT,
+            max_limit=settings.ADAPTIVE_CONCURRENCY_MAX_LIMIT,
+            latency_tolerance=settings.ADAPTIVE_CONCURRENCY_LATENCY_TOLERANCE,
+            backoff_ratio=settings.ADAPTIVE_CONCURRENCY_BACKOFF_RATIO,
+            priority_shares={
+                Priority.CRITICAL: 1.0,
+                Priority.NORMAL: settings.ADAPTIVE_CONCURRENCY_NORMAL_SHARE,
+                Priority.BULK: settings.ADAPTIVE_CONCURRENCY_BULK_SHARE,
+            },
+        )
+    return _limiters[service_name]
+
+
+def concurrency_limit_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get the current limit and counters of every downstream service.
+
+    Returns:
+        Dict mapping service name to its limiter statistics
+    """
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
@@ -0,0 +1,77 @@
+"""
+Metrics of the gateway's calls to downstream services.
+
+The latency and outcome of every call made through a pooled client, whether
+by ``proxy_request`` or directly, are reported by the client's transport to
+``record_downstream_call``. Connection pool occupancy, calls in flight and
+adaptive concurrency limits are kept by their own components and copied into
+gauges whenever metrics are scraped.
+"""
+from shared.utils.metrics import registry
+from utils.concurrency_limiter import concurrency_limit_stats
+from utils.http_clients import client_registry
+
+downstream_request_duration_seconds = registry.histogram(
+    "gateway_downstream_request_duration_seconds",
+    "Time until downstream services answered, by service, method and outcome",
+    ("service", "method", "outcome"),
+)
+downstream_errors_total = registry.counter(
+    "gateway_downstream_errors_total",
+    "Failed downstream calls, by service and reason",
+    ("service", "reason"),
+)
+downstream_in_flight = registry.gauge(
+    "gateway_downstream_in_flight",
+    "Downstream calls currently in flight, by service",
+    ("service",),
+)
+pool_connections = registry.gauge(
+    "gateway_pool_connections",
+    "Pooled connections to downstream services, by service and state",
+    ("service", "state"),
+)
+pool_queued = registry.gauge(
+    "gateway_pool_queued_requests",
+    "Calls waiting for a pooled connection, by service",
+    ("service",),
+)
+concurrency_limit = registry.gauge(
+    "gateway_concurrency_limit",
+    "Adaptive concurrency limit of downstream services",
+    ("service",),
+)
+
+
+def record_downstream_call(
+    service_name: str, method: str, outcome: str, duration: float
+) -> None:
+    """
+    Record the latency and outcome of a downstream call.
+
+    Args:
+        service_name: Name of the downstream service
+        method: HTTP method of the call
+        outcome: Response status code, or the reason the call failed
+        duration: Seconds until the response headers or the failure
+    """
+    downstream_request_duration_seconds.observe(
+        duration, service=service_name, method=method, outcome=outcome
+    )
+    if not outcome.isdigit() or outcome.startswith("5"):
+        downstream_errors_total.inc(service=service_name, reason=outcome)
+
+
+def _collect() -> None:
+    """Copy pool occupancy and concurrency limits into their gauges."""
+    for service_name, stats in client_registry.pool_stats().items():
+        downstream_in_flight.set(stats["in_flight"], service=service_name)
+        pool_connections.set(stats["active"], service=service_name, state="active")
+        pool_connections.set(stats["idle"], service=service_name, state="idle")
+        pool_queued.set(stats["queued"], service=service_name)
+    for service_name, stats in concurrency_limit_stats().items():
+        concurrency_limit.set(stats["limit"], service=service_name)
+
+
+client_registry.add_call_observer(record_downstream_call)
+registry.add_collector(_collect)
@@ -0,0 +1,180 @@
+"""
+Background health monitoring of downstream services.
+
+Probes every downstream service concurrently on a fixed interval and keeps
+the latest results in memory, so health and stats endpoints can answer
+from the cached snapshot instead of waiting on the network. Probes bypass
+the services' circuit breakers, so a service whose circuit is open is still
+probed and can be seen to recover.
+"""
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Any
+
+from core.config import settings
+from utils.concurrency_limiter import Priority, set_priority
+from utils.http_clients import DOWNSTREAM_SERVICES
+from utils.proxy import check_service_health
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (milliseconds) of the probe latency histogram buckets
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Histogram of probe latencies with fixed bucket bounds."""
+
+    def __init__(self, buckets: tuple[int, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total_ms = 0.0
+        self.count = 0
+
+    def observe(self, value_ms: float) -> None:
+        """Record a latency observation."""
+        self.counts[bisect_left(self.buckets, value_ms)] += 1
+        self.total_ms += value_ms
+        self.count += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the histogram in a serializable form.
+
+        Returns:
+            Dict with per-bucket counts keyed by upper bound, plus count and mean
+        """
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+        }
+
+
+async def _probe(service_name: str, timeout: float) -> dict[str, Any]:
+    """
+    Probe a single service, bounded by a hard deadline.
+
+    Args:
+        service_name: Name of the service to probe
+        timeout: Deadline for the whole probe in seconds
+
+    Returns:
+        Dict containing health status information and probe latency
+    """
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            check_service_health(service_name, timeout=timeout), timeout
+        )
+    except asyncio.TimeoutError:
+        result = {
+            "status": "unhealthy",
+            "error": f"Health check timed out after {timeout} seconds",
+        }
+    result["probe_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    result["checked_at"] = datetime.now(timezone.utc).isoformat()
+    return result
+
+
+async def probe_services(timeout: float | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Probe all downstream services concurrently.
+
+    Args:
+        timeout: Optional per-probe deadline override in seconds
+
+    Returns:
+        Dict mapping service name to its health status information
+    """
+    probe_timeout = timeout or settings.HEALTH_CHECK_TIMEOUT_SECONDS
+    results = await asyncio.gather(
+        *(_probe(service_name, probe_timeout) for service_name in DOWNSTREAM_SERVICES)
+    )
+    return dict(zip(DOWNSTREAM_SERVICES, results))
+
+
+class HealthMonitor:
+    """Periodically refreshes a cached health snapshot of downstream services."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._snapshot: dict[str, dict[str, Any]] = {}
+        self._histograms = {name: LatencyHistogram() for name in DOWNSTREAM_SERVICES}
+        self._task: asyncio.Task | None = None
+        self._refreshed_at: datetime | None = None
+
+    @property
+    def refreshed_at(self) -> datetime | None:
+        """Time of the last completed refresh."""
+        return self._refreshed_at
+
+    async def refresh(self) -> dict[str, dict[str, Any]]:
+        """
+        Probe all services now and update the cached snapshot.
+
+        Returns:
+            The new health snapshot
+        """
+        snapshot = await probe_services()
+        for service_name, result in snapshot.items():
+            self._histograms[service_name].observe(result["probe_ms"])
+        self._snapshot = snapshot
+        self._refreshed_at = datetime.now(timezone.utc)
+        return snapshot
+
+    async def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the cached health snapshot, probing once if nothing is cached yet.
+
+        Returns:
+            Dict mapping service name to its latest health status information
+        """
+        if not self._snapshot:
+            return await self.refresh()
+        return self._snapshot
+
+    def latency_histograms(self) -> dict[str, dict[str, Any]]:
+        """
+        Get probe latency histograms for every service.
+
+        Returns:
+            Dict mapping service name to its latency histogram
+        """
+        return {name: hist.to_dict() for name, hist in self._histograms.items()}
+
+    async def _run(self) -> None:
+        """Refresh the snapshot forever, sleeping between rounds."""
+        # Probes are never shed, or an overloaded service could not be seen
+        # to recover.
+        set_priority(Priority.CRITICAL)
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Health monitor refresh failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    async def start(self) -> None:
+        """Start the background refresh task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="health-monitor")
+            logger.info(f"Health monitor started (interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Health monitor stopped")
+
+
+health_monitor = HealthMonitor(interval=settings.HEALTH_CHECK_INTERVAL_SECONDS)
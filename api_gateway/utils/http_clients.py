@@ -0,0 +1,248 @@
+"""
+Process-wide pooled HTTP clients for calling downstream services.
+
+One ``httpx.AsyncClient`` is kept per downstream service so connections
+(and TLS sessions) are reused across requests instead of being re-opened
+for every call. Every call forwards the remaining request deadline and has
+its timeout capped at it, and is admitted through the service's circuit
+breaker and adaptive concurrency limit, whether it is made by
+``proxy_request`` or directly on a client from the registry. The outcome
+and latency of every call are passed to the registry's call observers.
+"""
+import logging
+import time
+from typing import Any, Callable
+
+import httpx
+
+from core.config import settings
+from shared.exceptions import ServiceOverloadedError, ServiceUnavailableError
+from shared.utils.deadline import propagate_deadline, remaining_time
+from utils.circuit_breaker import CircuitBreakerTransport, get_circuit_breaker
+from utils.concurrency_limiter import ConcurrencyLimitedTransport, get_limiter
+
+logger = logging.getLogger(__name__)
+
+DOWNSTREAM_SERVICES = (
+    "document_ingestion",
+    "document_processing",
+    "entity_extraction",
+    "task_orchestration",
+)
+
+
+# Called with the service name, HTTP method, outcome and duration of a call
+CallObserver = Callable[[str, str, str, float], None]
+
+
+class ServiceClientRegistry:
+    """Registry of long-lived ``httpx.AsyncClient`` instances keyed by service."""
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._in_flight: dict[str, int] = {}
+        self._observers: list[CallObserver] = []
+
+    def _build_client(self, service_name: str) -> httpx.AsyncClient:
+        """
+        Build a pooled client for a downstream service.
+
+        Args:
+            service_name: Name of the downstream service
+
+        Returns:
+            Configured AsyncClient bound to the service base URL
+
+        Raises:
+            ValueError: If no base URL is configured for the service
+        """
+        base_url = getattr(settings, f"{service_name.upper()}_SERVICE_URL", None)
+        if not base_url:
+            raise ValueError(f"Unknown service: {service_name}")
+
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        )
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            limits=limits, http2=settings.HTTP_CLIENT_HTTP2
+        )
+        if settings.ENABLE_ADAPTIVE_CONCURRENCY:
+            transport = ConcurrencyLimitedTransport(
+                transport, get_limiter(service_name)
+            )
+        # Outermost, so that calls rejected by an open circuit do not take a
+        # concurrency slot
+        transport = CircuitBreakerTransport(
+            transport, get_circuit_breaker(service_name)
+        )
+        transport = InstrumentedTransport(transport, self, service_name)
+        return httpx.AsyncClient(
+            base_url=base_url,
+            transport=transport,
+            timeout=settings.API_GATEWAY_DEFAULT_TIMEOUT,
+            event_hooks={"request": [propagate_deadline]},
+        )
+
+    async def start(self) -> None:
+        """Create a client for every known downstream service."""
+        for service_name in DOWNSTREAM_SERVICES:
+            self.get(service_name)
+        logger.info(
+            f"HTTP client pools ready for {len(self._clients)} services "
+            f"(max_connections={settings.HTTP_CLIENT_MAX_CONNECTIONS}, "
+            f"http2={settings.HTTP_CLIENT_HTTP2})"
+        )
+
+    async def close(self) -> None:
+        """Close every pooled client and release its connections."""
+        clients = list(self._clients.items())
+        self._clients.clear()
+        for service_name, client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client for {service_name}: {e}")
+        logger.info("HTTP client pools closed")
+
+    def get(self, service_name: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for a service, creating it on first use.
+
+        Args:
+            service_name: Name of the downstream service
+
+        Returns:
+            The shared AsyncClient for the service
+        """
+        client = self._clients.get(service_name)
+        if client is None or client.is_closed:
+            client = self._build_client(service_name)
+            self._clients[service_name] = client
+        return client
+
+    def acquire(self, service_name: str) -> None:
+        """Record the start of a request to a service."""
+        self._in_flight[service_name] = self._in_flight.get(service_name, 0) + 1
+
+    def release(self, service_name: str) -> None:
+        """Record the end of a request to a service."""
+        self._in_flight[service_name] = max(self._in_flight.get(service_name, 0) - 1, 0)
+
+    def add_call_observer(self, observer: CallObserver) -> None:
+        """
+        Register a callback told about every finished call to a service.
+
+        Args:
+            observer: Callback taking the service name, the HTTP method, the
+                response status code or the reason the call failed, and the
+                seconds until the response headers or the failure
+        """
+        self._observers.append(observer)
+
+    def notify(
+        self, service_name: str, method: str, outcome: str, duration: float
+    ) -> None:
+        """Pass the outcome of a finished call to every call observer."""
+        for observer in self._observers:
+            try:
+                observer(service_name, method, outcome, duration)
+            except Exception as e:
+                logger.warning(f"Call observer failed for {service_name}: {e}")
+
+    def pool_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get connection pool occupancy for every service.
+
+        Returns:
+            Dict mapping service name to its pool statistics
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for service_name, client in self._clients.items():
+            transport = getattr(client, "_transport", None)
+            while isinstance(
+                transport,
+                (
+                    InstrumentedTransport,
+                    CircuitBreakerTransport,
+                    ConcurrencyLimitedTransport,
+                ),
+            ):
+                transport = transport.transport
+            pool = getattr(transport, "_pool", None)
+            connections = list(getattr(pool, "connections", []) or [])
+            idle = sum(1 for conn in connections if conn.is_idle())
+            queued = sum(
+                1
+                for pending in getattr(pool, "_requests", []) or []
+                if getattr(pending, "connection", None) is None
+            )
+            stats[service_name] = {
+                "connections": len(connections),
+                "active": len(connections) - idle,
+                "idle": idle,
+                "queued": queued,
+                "in_flight": self._in_flight.get(service_name, 0),
+                "max_connections": settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                "http2": settings.HTTP_CLIENT_HTTP2,
+            }
+        return stats
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that counts a registry's calls in flight and reports outcomes.
+
+    It wraps the circuit breaker, so calls rejected by an open circuit are
+    reported too.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        registry: ServiceClientRegistry,
+        service_name: str,
+    ) -> None:
+        self.transport = transport
+        self.registry = registry
+        self.service_name = service_name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.registry.acquire(self.service_name)
+        outcome = "error"
+        started = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+            outcome = str(response.status_code)
+            return response
+        except ServiceOverloadedError:
+            outcome = "shed"
+            raise
+        except ServiceUnavailableError:
+            outcome = "circuit_open"
+            raise
+        except httpx.TimeoutException:
+            remaining = remaining_time()
+            if remaining is not None and remaining <= 0:
+                outcome = "deadline_exceeded"
+            else:
+                outcome = "timeout"
+            raise
+        except httpx.TransportError:
+            outcome = "connection_error"
+            raise
+        finally:
+            self.registry.release(self.service_name)
+            self.registry.notify(
+                self.service_name,
+                request.method,
+                outcome,
+                time.perf_counter() - started,
+            )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+client_registry = ServiceClientRegistry()
@@ -0,0 +1,173 @@
+"""
+Password hashing off the event loop.
+
+A bcrypt hash or verification takes hundreds of milliseconds of CPU. Run
+inline in a handler it blocks every other request on the worker, so a burst
+of logins would stall the whole gateway. PasswordHasher runs them on a
+dedicated, bounded thread pool instead; bcrypt releases the GIL while it
+works, so the pool hashes in parallel while the event loop keeps serving.
+
+At most PASSWORD_HASH_WORKERS operations run at once and at most
+PASSWORD_HASH_MAX_QUEUE wait for a thread. Beyond that, callers are rejected
+with 503 and a Retry-After header rather than queued without bound.
+"""
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from passlib.context import CryptContext
+
+from core.config import settings
+from shared.exceptions import ServiceOverloadedError
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Bounded thread pool for password hashing and verification.
+
+    Args:
+        context: Passlib context that hashes and verifies passwords
+        workers: Number of hashing threads
+        max_queue: Number of operations that may wait for a thread
+    """
+
+    def __init__(self, context: CryptContext, workers: int, max_queue: int) -> None:
+        self.context = context
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self.running = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+
+    def _pool(self) -> tuple[ThreadPoolExecutor, asyncio.Semaphore]:
+        """Get the thread pool and its slots, creating them on first use."""
+        if self._executor is None or self._slots is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+            self._slots = asyncio.Semaphore(self.workers)
+        return self._executor, self._slots
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing operation on the pool once a thread is free.
+
+        Raises:
+            ServiceOverloadedError: If the queue is full
+        """
+        executor, slots = self._pool()
+        if slots.locked() and self.queued >= self.max_queue:
+            self.rejected += 1
+            raise ServiceOverloadedError(
+                service_name="Password hashing", retry_after=self._retry_after()
+            )
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        enqueued = time.monotonic()
+        try:
+            await slots.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.monotonic()
+        wait = started - enqueued
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.total_run += time.monotonic() - started
+            slots.release()
+
+    def _retry_after(self) -> int:
+        """Estimate the seconds until the current queue has drained."""
+        average_run = self.total_run / self.completed if self.completed else 1.0
+        return max(1, math.ceil(average_run * (self.queued + 1) / self.workers))
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password: Plain text password to hash
+
+        Returns:
+            Hashed password
+
+        Raises:
+            ServiceOverloadedError: If too many operations are already queued
+        """
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against a hash.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password to compare against
+
+        Returns:
+            True if the password matches the hash, False otherwise
+
+        Raises:
+            ServiceOverloadedError: If too many operations are already queued
+        """
+        return await self._run(self.context.verify, plain_password, hashed_password)
+
+    def close(self) -> None:
+        """Shut the thread pool down, waiting for running operations."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._slots = None
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get pool occupancy and queueing counters.
+
+        Returns:
+            Dict with the running and queued operations, completed and
+            rejected counts, and the average and maximum queue wait and
+            average run time in milliseconds
+        """
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "average_wait_ms": _average_ms(self.total_wait, self.completed),
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "average_run_ms": _average_ms(self.total_run, self.completed),
+        }
+
+
+def _average_ms(total: float, count: int) -> float:
+    """Get the average of a total in seconds, in rounded milliseconds."""
+    return round(total / count * 1000, 2) if count else 0.0
+
+
+password_hasher = PasswordHasher(
+    CryptContext(schemes=["bcrypt"], deprecated="auto"),
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,308 @@
+"""
+Server-sent progress events for workflows and jobs.
+
+Clients that would otherwise poll a workflow or job subscribe to a feed
+instead. Each watched resource has exactly one upstream watcher per gateway
+worker, however many clients subscribe to it: the watcher reads the resource
+from its downstream service and publishes an event to every subscriber only
+when the status, progress or task states change. The feed stops as soon as
+the resource reaches a terminal state or its last subscriber disconnects.
+"""
+import asyncio
+import contextvars
+import hashlib
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from fastapi import status
+
+from core.config import settings
+from shared.exceptions.base import ApplicationError
+from shared.utils.serialization import dumps
+from utils.response_cache import TERMINAL_STATES
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressResource(str, Enum):
+    """Resources whose progress can be streamed."""
+
+    WORKFLOWS = "workflows"
+    PROCESSING_JOBS = "processing-jobs"
+    EXTRACTION_JOBS = "extraction-jobs"
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """One server-sent event."""
+
+    id: str
+    event: str
+    data: bytes
+
+    def encode(self) -> bytes:
+        """Encode the event in the ``text/event-stream`` wire format."""
+        return (
+            f"id: {self.id}\nevent: {self.event}\n".encode()
+            + b"data: "
+            + self.data
+            + b"\n\n"
+        )
+
+
+# Sentinel telling subscribers that the feed has ended
+_END = None
+
+
+def _progress_state(data: dict[str, Any]) -> dict[str, Any]:
+    """Extract the fields whose changes are published from a resource."""
+    state = {"status": data.get("status"), "progress": data.get("progress")}
+    tasks = data.get("tasks")
+    if isinstance(tasks, list):
+        state["tasks"] = [
+            (task.get("id") or task.get("name"), task.get("status"))
+            for task in tasks
+            if isinstance(task, dict)
+        ]
+    return state
+
+
+class ProgressFeed:
+    """A single upstream watcher fanned out to any number of subscribers."""
+
+    def __init__(
+        self,
+        resource: ProgressResource,
+        resource_id: str,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]],
+        on_close: Callable[["ProgressFeed"], None],
+    ) -> None:
+        self.resource = resource
+        self.resource_id = resource_id
+        self._fetch = fetch
+        self._on_close = on_close
+        self._subscribers: set[asyncio.Queue] = set()
+        self._last_state: dict[str, Any] | None = None
+        self.last_event: ProgressEvent | None = None
+        self.closed = False
+        self.polls = 0
+        self.events = 0
+        # Run the watcher in an empty context so that it does not forward the
+        # conditional headers of whichever request happened to start it.
+        self._task = asyncio.get_running_loop().create_task(
+            self._watch(), context=contextvars.Context()
+        )
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of clients currently subscribed."""
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Add a subscriber, replaying the latest event if there is one.
+
+        Returns:
+            Queue receiving the feed's events, then None when the feed ends
+        """
+        queue: asyncio.Queue = asyncio.Queue(
+            maxsize=settings.PROGRESS_STREAM_QUEUE_SIZE
+        )
+        if self.last_event is not None:
+            queue.put_nowait(self.last_event)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber, stopping the feed if it was the last one."""
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self.close()
+
+    def close(self) -> None:
+        """Stop watching and end every subscriber's stream."""
+        if self.closed:
+            return
+        self.closed = True
+        self._task.cancel()
+        for queue in self._subscribers:
+            self._offer(queue, _END)
+        self._on_close(self)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item: ProgressEvent | None) -> None:
+        """
+        Queue an item without blocking the watcher.
+
+        Subscribers only need the latest state, so a client that falls behind
+        loses its oldest undelivered event rather than holding up the others.
+        """
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    def _publish(self, event: str, payload: dict[str, Any]) -> None:
+        data = dumps(payload)
+        self.last_event = ProgressEvent(
+            id=hashlib.blake2b(data, digest_size=8).hexdigest(),
+            event=event,
+            data=data,
+        )
+        self.events += 1
+        for queue in self._subscribers:
+            self._offer(queue, self.last_event)
+
+    async def _watch(self) -> None:
+        """Poll the resource and publish its changes until it finishes."""
+        interval = settings.PROGRESS_STREAM_POLL_INTERVAL_SECONDS
+        try:
+            while True:
+                self.polls += 1
+                finished = False
+                try:
+                    result = await self._fetch(self.resource_id)
+                except ApplicationError as e:
+                    # Publish each distinct failure once; a recovery then
+                    # counts as a change and re-sends the current state.
+                    state = {"error": e.status_code}
+                    # Not "error", which browsers reserve for connection errors
+                    event = "upstream-error"
+                    payload = {"status_code": e.status_code, "message": e.message}
+                    finished = e.status_code == status.HTTP_404_NOT_FOUND
+                else:
+                    payload = result.get("data", result)
+                    state = _progress_state(payload)
+                    event = "progress"
+                    finished = state["status"] in TERMINAL_STATES
+                if state != self._last_state:
+                    self._last_state = state
+                    self._publish(event, payload)
+                if finished:
+                    return
+                await asyncio.sleep(interval)
+        except Exception as e:
+            logger.exception(
+                f"Progress feed for {self.resource.value}/{self.resource_id} "
+                f"failed: {e}"
+            )
+        finally:
+            if not self.closed:
+                asyncio.get_running_loop().call_soon(self.close)
+
+
+class ProgressHub:
+    """Registry of progress feeds, one per watched resource."""
+
+    def __init__(self) -> None:
+        self._fetchers: dict[
+            ProgressResource, Callable[[str], Awaitable[dict[str, Any]]]
+        ] = {}
+        self._feeds: dict[tuple[ProgressResource, str], ProgressFeed] = {}
+        self.feeds_started = 0
+
+    def register(
+        self,
+        resource: ProgressResource,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]],
+    ) -> None:
+        """
+        Set the service function that reads a resource by its ID.
+
+        Args:
+            resource: Kind of resource
+            fetch: Coroutine function returning the resource from its service
+        """
+        self._fetchers[resource] = fetch
+
+    def _forget(self, feed: ProgressFeed) -> None:
+        key = (feed.resource, feed.resource_id)
+        if self._feeds.get(key) is feed:
+            del self._feeds[key]
+
+    def feed(self, resource: ProgressResource, resource_id: str) -> ProgressFeed:
+        """
+        Get the live feed for a resource, starting one if needed.
+
+        Args:
+            resource: Kind of resource
+            resource_id: ID of the workflow or job
+
+        Returns:
+            The shared feed for the resource
+        """
+        key = (resource, resource_id)
+        feed = self._feeds.get(key)
+        if feed is None or feed.closed:
+            feed = ProgressFeed(
+                resource, resource_id, self._fetchers[resource], self._forget
+            )
+            self._feeds[key] = feed
+            self.feeds_started += 1
+        return feed
+
+    async def stream(
+        self,
+        resource: ProgressResource,
+        resource_id: str,
+        last_event_id: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Produce the ``text/event-stream`` body for one subscriber.
+
+        Args:
+            resource: Kind of resource
+            resource_id: ID of the workflow or job
+            last_event_id: ``Last-Event-ID`` sent by a reconnecting client; the
+                current state is not re-sent if the client already has it
+
+        Yields:
+            Encoded events, with comment lines as heartbeats while idle
+        """
+        feed = self.feed(resource, resource_id)
+        queue = feed.subscribe()
+        heartbeat = settings.PROGRESS_STREAM_HEARTBEAT_SECONDS
+        try:
+            yield f"retry: {settings.PROGRESS_STREAM_RETRY_MILLISECONDS}\n\n".encode()
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                if item is _END:
+                    return
+                if item.id == last_event_id:
+                    continue
+                yield item.encode()
+        finally:
+            feed.unsubscribe(queue)
+
+    async def close(self) -> None:
+        """End every feed, e.g. on shutdown."""
+        for feed in list(self._feeds.values()):
+            feed.close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get feed counters.
+
+        Returns:
+            Dict with live feeds and subscribers per resource kind, and the
+            number of feeds started since startup
+        """
+        resources = {
+            resource.value: {"feeds": 0, "subscribers": 0, "polls": 0, "events": 0}
+            for resource in self._fetchers
+        }
+        for feed in self._feeds.values():
+            counters = resources[feed.resource.value]
+            counters["feeds"] += 1
+            counters["subscribers"] += feed.subscriber_count
+            counters["polls"] += feed.polls
+            counters["events"] += feed.events
+        return {"feeds_started": self.feeds_started, "resources": resources}
+
+
+progress_hub = ProgressHub()
@@ -2,17 +2,37 @@
 Service proxy utility for making HTTP requests to downstream services.
 """
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
-from fastapi import Request, status
+from fastapi import Request
+from starlette.background import BackgroundTask
 from starlette.responses import StreamingResponse
 
 from core.config import settings
-from shared.exceptions import ServiceTimeoutError, ServiceUnavailableError
+from shared.exceptions import (
+    DeadlineExceededError,
+    ServiceTimeoutError,
+    ServiceUnavailableError,
+)
+from shared.utils.deadline import bound_timeout, remaining_time
+from utils.circuit_breaker import BYPASS_CIRCUIT_BREAKER
+from utils.http_clients import client_registry
 
 logger = logging.getLogger(__name__)
 
+# Headers that apply to a single connection and must not be relayed
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
 # Service timeout mapping
 SERVICE_TIMEOUTS = {
     "document_ingestion": settings.DOCUMENT_INGESTION_TIMEOUT,
@@ -21,9 +41,6 @@ SERVICE_TIMEOUTS = {
     "task_orchestration": settings.TASK_ORCHESTRATION_TIMEOUT,
 }
 
-# Health status tracker for circuit breaking
-service_health: dict[str, str] = {}
-
 
 def get_tracking_headers(request: Request | None = None) -> dict[str, str]:
     """
@@ -53,11 +70,16 @@ async def proxy_request(
     headers: dict | None = None,
     params: dict | None = None,
     json_data: dict | None = None,
-    binary_data: bytes | None = None,
+    binary_data: bytes | AsyncIterator[bytes] | None = None,
     timeout: float | None = None,
+    stream: bool = False,
+    extensions: dict[str, Any] | None = None,
 ) -> httpx.Response:
     """
-    Proxy a request to a downstream service with proper error handling and circuit breaking.
+    Proxy a request to a downstream service with proper error handling.
+
+    The service's circuit breaker and concurrency limit are applied by the
+    pooled client's transport.
 
     Args:
         service_name: Name of the service to call
@@ -67,58 +89,56 @@ async def proxy_request(
         headers: Optional request headers
         params: Optional query parameters
         json_data: Optional JSON request body
-        binary_data: Optional binary request body
+        binary_data: Optional binary request body, either as bytes or as an
+            async iterator of chunks to stream upstream
         timeout: Optional timeout override
+        stream: Return as soon as the response headers arrive, leaving the body
+            unread; the caller must close the response to release the connection
+        extensions: Optional httpx request extensions for the client's
+            transports
 
     Returns:
         Response from the downstream service
 
     Raises:
+        DeadlineExceededError: If the request's deadline has already passed
         ServiceUnavailableError: If the service is unhealthy or unreachable
         ServiceTimeoutError: If the request times out
     """
-    # Check circuit breaker status
-    if service_health.get(service_name) == "failed":
-        logger.error(f"Circuit breaker is open for {service_name}")
-        raise ServiceUnavailableError(
-            service_name=service_name,
-            detail="Service is currently unavailable",
-        )
-
-    # Get base URL for service
-    service_url = getattr(settings, f"{service_name.upper()}_SERVICE_URL")
-    if not service_url:
-        raise ValueError(f"Unknown service: {service_name}")
-
-    # Use service-specific timeout or fallback to default
-    request_timeout = timeout or SERVICE_TIMEOUTS.get(
-        service_name, settings.API_GATEWAY_DEFAULT_TIMEOUT
+    # Use service-specific timeout or fallback to default, cut short by the
+    # request deadline. Expired requests are dropped before they reach the
+    # circuit breaker, so they cannot use up its half-open probes.
+    request_timeout = bound_timeout(
+        timeout
+        or SERVICE_TIMEOUTS.get(service_name, settings.API_GATEWAY_DEFAULT_TIMEOUT)
     )
 
+    # Get the pooled client for the service
+    client = client_registry.get(service_name)
+
     # Merge tracking headers with provided headers
     request_headers = headers or {}
     request_headers.update(get_tracking_headers(request))
 
     try:
-        async with httpx.AsyncClient(timeout=request_timeout) as client:
-            response = await client.request(
-                method=method,
-                url=f"{service_url}{path}",
-                headers=request_headers,
-                params=params,
-                json=json_data,
-                content=binary_data,
-            )
-
-            # Update circuit breaker status
-            if response.is_success:
-                service_health[service_name] = "healthy"
-            elif response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
-                service_health[service_name] = "failed"
-
-            return response
+        upstream_request = client.build_request(
+            method=method,
+            url=path,
+            headers=request_headers,
+            params=params,
+            json=json_data,
+            content=binary_data,
+            timeout=request_timeout,
+            extensions=extensions,
+        )
+        return await client.send(upstream_request, stream=stream)
 
     except httpx.TimeoutException as e:
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError(
+                f"Request deadline exceeded while waiting for {service_name}"
+            )
         logger.error(
             f"Request to {service_name} timed out",
             extra={
@@ -128,8 +148,6 @@ async def proxy_request(
                 **(get_tracking_headers(request) if request else {}),
             },
         )
-        # Mark service as potentially unhealthy
-        service_health[service_name] = "degraded"
         raise ServiceTimeoutError(
             service_name=service_name,
             detail=f"Request timed out after {request_timeout} seconds",
@@ -144,20 +162,24 @@ async def proxy_request(
                 **(get_tracking_headers(request) if request else {}),
             },
         )
-        # Mark service as failed for circuit breaking
-        service_health[service_name] = "failed"
         raise ServiceUnavailableError(
             service_name=service_name,
             detail=f"Service request failed: {str(e)}",
         )
 
 
-async def check_service_health(service_name: str) -> dict[str, Any]:
+async def check_service_health(
+    service_name: str, timeout: float = 5.0
+) -> dict[str, Any]:
     """
     Check the health of a specific service.
 
+    The probe bypasses the service's circuit breaker, so it reaches the
+    service even while the circuit is open and leaves the breaker as it is.
+
     Args:
         service_name: Name of the service to check
+        timeout: Timeout for the health check request in seconds
 
     Returns:
         Dict containing health status information
@@ -167,7 +189,8 @@ async def check_service_health(service_name: str) -> dict[str, Any]:
             service_name=service_name,
             method="GET",
             path="/health",
-            timeout=5.0,  # Short timeout for health checks
+            timeout=timeout,
+            extensions={BYPASS_CIRCUIT_BREAKER: True},
         )
 
         if response.is_success:
@@ -197,13 +220,18 @@ async def stream_proxy_response(
     headers: dict[str, str] | None = None,
     params: dict | None = None,
     json_data: dict | None = None,
-    binary_data: bytes | None = None,
+    binary_data: bytes | AsyncIterator[bytes] | None = None,
     timeout: float | None = None,
 ) -> StreamingResponse:
     """
     Proxy a request to a target service and stream the response.
     Useful for file downloads or large responses.
 
+    The upstream body is relayed chunk by chunk as the client consumes it, so
+    memory use stays constant regardless of the response size. The upstream
+    connection is held until the body is fully sent or the client disconnects,
+    and is then returned to the pool.
+
     Args:
         service_name: Name of the service to call
         request: The incoming request to proxy
@@ -232,11 +260,35 @@ async def stream_proxy_response(
         json_data=json_data,
         binary_data=binary_data,
         timeout=timeout,
+        stream=True,
     )
 
+    async def relay_body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.aiter_raw():
+                yield chunk
+        except httpx.HTTPError as e:
+            logger.error(
+                f"Stream from {service_name} interrupted",
+                extra={
+                    "service": service_name,
+                    "error": str(e),
+                    **get_tracking_headers(request),
+                },
+            )
+            raise
+        finally:
+            await response.aclose()
+
     return StreamingResponse(
-        content=response.aiter_bytes(),
+        content=relay_body(),
         status_code=response.status_code,
-        headers=dict(response.headers),
+        headers={
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in HOP_BY_HOP_HEADERS
+        },
         media_type=response.headers.get("content-type"),
+        # Runs after the body is sent or the client disconnects mid-stream
+        background=BackgroundTask(response.aclose),
     )
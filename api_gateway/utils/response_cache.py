@@ -0,0 +1,356 @@
+"""
+Response caching for immutable and slow-changing downstream reads.
+
+Cached reads go through a ResponseCache with per-route TTLs and an optional
+rule deciding which results may be cached at all, e.g. only jobs that have
+reached a terminal state. Entries are stored in a pluggable backend:
+
+- ``local``: a bounded in-process LRU, private to each gateway worker
+- ``redis``: a Redis tier shared by all gateway workers, fronted by a small
+  local LRU so hot keys do not cost a network round trip
+"""
+import functools
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import orjson
+
+from core.config import settings
+from shared.config.settings import build_redis_connection_string
+from shared.exceptions.base import ConfigurationError
+from shared.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Job and workflow states after which a result no longer changes
+TERMINAL_STATES = frozenset({"completed", "failed", "canceled"})
+
+
+class CacheBackend(ABC):
+    """Storage for cached responses."""
+
+    name: str = "abstract"
+
+    @abstractmethod
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, expiry as a Unix timestamp), or None on a miss
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        """
+        Store an entry until a Unix timestamp.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            expires_at: Unix timestamp after which the entry is stale
+        """
+
+    async def close(self) -> None:
+        """Release any connections held by the backend."""
+
+    def stats(self) -> dict[str, Any]:
+        """Get backend occupancy information."""
+        return {"backend": self.name}
+
+
+class LocalCacheBackend(CacheBackend):
+    """In-process cache with a maximum number of entries and LRU eviction."""
+
+    name = "local"
+
+    def __init__(
+        self, max_entries: int, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis-backed cache shared across gateway workers.
+
+    Redis errors are logged and treated as misses, so an unavailable cache
+    only costs the downstream call it was meant to save.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, key_prefix: str = "gateway:response-cache:") -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ConfigurationError(
+                "RESPONSE_CACHE_BACKEND=redis requires the redis package"
+            ) from e
+        self._redis = redis_asyncio.from_url(url)
+        self.key_prefix = key_prefix
+        self.errors = 0
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        try:
+            raw = await self._redis.get(self.key_prefix + key)
+            if raw is None:
+                return None
+            entry = orjson.loads(raw)
+            return entry["value"], entry["expires_at"]
+        except Exception as e:
+            # A corrupt or foreign entry is a miss, like an unreachable Redis
+            self.errors += 1
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        try:
+            await self._redis.set(
+                self.key_prefix + key,
+                dumps({"value": value, "expires_at": expires_at}),
+                px=ttl_ms,
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Response cache write failed: {e}")
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.name, "errors": self.errors}
+
+
+class TieredCacheBackend(CacheBackend):
+    """A local LRU in front of a shared backend."""
+
+    def __init__(self, near: CacheBackend, far: CacheBackend) -> None:
+        self.near = near
+        self.far = far
+        self.name = f"{near.name}+{far.name}"
+
+    async def get(self, key: str) -> tuple[Any, float] | None:
+        entry = await self.near.get(key)
+        if entry is None:
+            entry = await self.far.get(key)
+            if entry is not None:
+                await self.near.set(key, *entry)
+        return entry
+
+    async def set(self, key: str, value: Any, expires_at: float) -> None:
+        await self.near.set(key, value, expires_at)
+        await self.far.set(key, value, expires_at)
+
+    async def close(self) -> None:
+        await self.near.close()
+        await self.far.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.name,
+            "near": self.near.stats(),
+            "far": self.far.stats(),
+        }
+
+
+class RouteCounters:
+    """Hit and miss counters for one cached route."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResponseCache:
+    """Read-through cache of downstream responses, keyed by route and arguments."""
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self._counters: dict[str, RouteCounters] = {}
+
+    def _route_counters(self, route: str) -> RouteCounters:
+        if route not in self._counters:
+            self._counters[route] = RouteCounters()
+        return self._counters[route]
+
+    async def get_or_fetch(
+        self,
+        route: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        cacheable: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Return a cached response, or fetch it and cache it if allowed.
+
+        Args:
+            route: Name of the cached route, used for counters and keys
+            key: Key identifying the request within the route
+            fetch: Coroutine function performing the downstream call
+            ttl: Time to live of a stored entry in seconds
+            cacheable: Optional rule deciding whether a fetched value may be
+                cached; values are always cached when omitted
+
+        Returns:
+            The cached or freshly fetched response
+        """
+        counters = self._route_counters(route)
+        cache_key = f"{route}:{key}"
+
+        entry = await self.backend.get(cache_key)
+        if entry is not None:
+            counters.hits += 1
+            return entry[0]
+
+        counters.misses += 1
+        value = await fetch()
+        if cacheable is None or cacheable(value):
+            await self.backend.set(cache_key, value, time.time() + ttl)
+        else:
+            counters.uncacheable += 1
+        return value
+
+    async def close(self) -> None:
+        """Release the backend's connections."""
+        await self.backend.close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict with backend occupancy and hit/miss counters per route
+        """
+        return {
+            "backend": self.backend.stats(),
+            "routes": {
+                route: counters.to_dict() for route, counters in self._counters.items()
+            },
+        }
+
+
+def build_cache_backend() -> CacheBackend:
+    """
+    Build the cache backend selected by RESPONSE_CACHE_BACKEND.
+
+    Returns:
+        The configured backend
+
+    Raises:
+        ConfigurationError: If the backend name is unknown
+    """
+    local = LocalCacheBackend(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+    if settings.RESPONSE_CACHE_BACKEND == "local":
+        return local
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        redis_url = build_redis_connection_string(
+            settings.REDIS_HOST,
+            settings.REDIS_PORT,
+            settings.REDIS_DB,
+            settings.REDIS_PASSWORD or None,
+        )
+        return TieredCacheBackend(near=local, far=RedisCacheBackend(redis_url))
+    raise ConfigurationError(
+        f"Unknown RESPONSE_CACHE_BACKEND: {settings.RESPONSE_CACHE_BACKEND}"
+    )
+
+
+def is_terminal(result: Any) -> bool:
+    """
+    Check whether a job or workflow response has reached a terminal state.
+
+    Args:
+        result: Response from a downstream service, with or without the
+            ``{"data": ...}`` envelope
+
+    Returns:
+        True if the status is completed, failed or canceled
+    """
+    if not isinstance(result, dict):
+        return False
+    data = result.get("data", result)
+    return isinstance(data, dict) and data.get("status") in TERMINAL_STATES
+
+
+def cached(
+    route: str, ttl: float, cacheable: Callable[[Any], bool] | None = None
+) -> Callable:
+    """
+    Decorate an async service function so its responses are cached.
+
+    Args:
+        route: Name of the cached route
+        ttl: Time to live of cached responses in seconds
+        cacheable: Optional rule deciding whether a response may be cached
+
+    Returns:
+        Decorator for the service function
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not settings.ENABLE_RESPONSE_CACHE:
+                return await func(*args, **kwargs)
+            key = ":".join(
+                [*map(str, args), *(f"{k}={v}" for k, v in sorted(kwargs.items()))]
+            )
+            return await response_cache.get_or_fetch(
+                route, key, lambda: func(*args, **kwargs), ttl, cacheable
+            )
+
+        return wrapper
+
+    return decorator
+
+
+response_cache = ResponseCache(build_cache_backend())
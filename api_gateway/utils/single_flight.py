@@ -0,0 +1,177 @@
+"""
+Request coalescing ("single flight") for idempotent downstream reads.
+
+When several callers ask for the same resource at the same time, only the
+first one calls the downstream service; the others wait for that call and
+receive the same result, or the same exception.
+
+The shared call belongs to no single caller, so it does not inherit the
+deadline and priority of the caller that started it. It runs at NORMAL
+priority under the larger of that caller's remaining budget and
+REQUEST_DEADLINE_DEFAULT_SECONDS, and each caller stops waiting for it at
+its own deadline.
+"""
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from core.config import settings
+from shared.exceptions import DeadlineExceededError
+from shared.utils.conditional import current_if_none_match
+from shared.utils.deadline import check_deadline, deadline_scope, remaining_time
+from utils.concurrency_limiter import Priority, set_priority
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+
+    @property
+    def collapsed(self) -> int:
+        """Number of calls that were served by another caller's request."""
+        return self.calls - self.executions
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``func`` for ``key``, or join the call already running for it.
+
+        The call runs in its own task, so a caller that is cancelled (for
+        example because its client disconnected, or its deadline passed) does
+        not cancel the call for everyone else waiting on it.
+
+        Args:
+            key: Identifies the request; equal keys share one call
+            func: Coroutine function performing the downstream call
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline passes first
+            Exception: Whatever the shared call raised
+        """
+        check_deadline()
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(self._run(func, _shared_budget()))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+
+        remaining = remaining_time()
+        if remaining is None:
+            return await asyncio.shield(task)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), max(remaining, 0))
+        except asyncio.TimeoutError:
+            if task.done():
+                # The shared call itself raised the timeout
+                raise
+            raise DeadlineExceededError()
+
+    @staticmethod
+    async def _run(func: Callable[[], Awaitable[T]], budget: float) -> T:
+        """Run the shared call under its own budget, at NORMAL priority."""
+        set_priority(Priority.NORMAL)
+        with deadline_scope(budget):
+            return await func()
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished call so that the next request starts a new one."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved even if every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dict with total calls, downstream executions, collapsed calls and
+            the number of calls currently in flight
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._in_flight),
+        }
+
+
+def _shared_budget() -> float:
+    """Get the budget of a shared call started by the current caller."""
+    remaining = remaining_time()
+    default = settings.REQUEST_DEADLINE_DEFAULT_SECONDS
+    return default if remaining is None else max(remaining, default)
+
+
+_groups: dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Get or create the single-flight group with the given name.
+
+    Args:
+        name: Name of the group, typically the resource being read
+
+    Returns:
+        The shared SingleFlight instance
+    """
+    if name not in _groups:
+        _groups[name] = SingleFlight(name)
+    return _groups[name]
+
+
+def single_flight_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get coalescing counters for every single-flight group.
+
+    Returns:
+        Dict mapping group name to its counters
+    """
+    return {name: group.stats() for name, group in _groups.items()}
+
+
+def coalesce(name: str) -> Callable:
+    """
+    Decorate an async service function so concurrent identical calls share one.
+
+    Calls are identical when their arguments are equal, so the decorated
+    function must be idempotent and its arguments hashable. Callers receive
+    the same result object and must not mutate it.
+
+    Args:
+        name: Name of the single-flight group to use
+
+    Returns:
+        Decorator for the service function
+    """
+    group = get_single_flight(name)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if not settings.ENABLE_REQUEST_COALESCING:
+                return await func(*args, **kwargs)
+            # The forwarded If-None-Match decides whether the downstream call
+            # answers 304, so only callers with the same validator can share it.
+            key = (args, tuple(sorted(kwargs.items())), current_if_none_match())
+            return await group.do(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
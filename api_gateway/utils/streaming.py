@@ -0,0 +1,34 @@
+"""
+Helpers for passing request and response bodies through the gateway as streams.
+"""
+from http import HTTPStatus
+from typing import AsyncIterator
+
+from shared.exceptions.base import ValidationError
+
+
+async def limit_body_size(
+    chunks: AsyncIterator[bytes], max_bytes: int
+) -> AsyncIterator[bytes]:
+    """
+    Re-yield body chunks, failing as soon as the running total exceeds a limit.
+
+    Args:
+        chunks: Async iterator producing the body chunk by chunk
+        max_bytes: Maximum number of bytes allowed through
+
+    Yields:
+        The original chunks, unchanged
+
+    Raises:
+        ValidationError: If the body grows beyond ``max_bytes``
+    """
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise ValidationError(
+                f"Request body exceeds the maximum allowed size of {max_bytes} bytes",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+        yield chunk
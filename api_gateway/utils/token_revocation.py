@@ -0,0 +1,345 @@
+"""
+Revoked token list shared by all gateway workers.
+
+Revocations are kept until the revoked token would have expired anyway, in
+a pluggable store:
+
+- ``local``: an in-process dict, private to each gateway worker
+- ``redis``: one key per revoked token ID with a TTL, plus a sorted index
+  so workers can list the revocations that are still live
+
+Each worker fronts the store with a Bloom filter of revoked token IDs. A
+token that is not in the filter is certainly not revoked, which is the
+common case and needs no network hop; a hit is confirmed with the store,
+since it may be a false positive. The filter is rebuilt from the store
+every TOKEN_REVOCATION_SYNC_SECONDS, which picks up revocations made by
+other workers and drops those that have expired.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from core.config import settings
+from shared.config.settings import build_redis_connection_string
+from shared.exceptions.base import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Args:
+        capacity: Number of items the filter is sized for
+        false_positive_rate: Target false positive rate at capacity
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2),
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        """Get the bit positions of an item by double hashing one digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevocationStore(ABC):
+    """Storage for revoked token IDs."""
+
+    name: str = "abstract"
+
+    @abstractmethod
+    async def add(self, token_id: str, expires_at: float) -> None:
+        """
+        Record a revocation until a Unix timestamp.
+
+        Args:
+            token_id: The revoked token's ``jti``
+            expires_at: Unix timestamp at which the token expires
+        """
+
+    @abstractmethod
+    async def contains(self, token_id: str) -> bool:
+        """
+        Check whether a token ID is revoked.
+
+        Args:
+            token_id: The token's ``jti``
+
+        Returns:
+            True if the token has been revoked and has not yet expired
+        """
+
+    @abstractmethod
+    async def live(self) -> list[str]:
+        """
+        List the revoked token IDs that have not yet expired.
+
+        Returns:
+            The token IDs
+        """
+
+    async def close(self) -> None:
+        """Release any connections held by the store."""
+
+    def stats(self) -> dict[str, Any]:
+        """Get store occupancy information."""
+        return {"backend": self.name}
+
+
+class LocalRevocationStore(RevocationStore):
+    """In-process revocation store, private to each worker."""
+
+    name = "local"
+
+    def __init__(self) -> None:
+        self._entries: dict[str, float] = {}
+
+    async def add(self, token_id: str, expires_at: float) -> None:
+        self._entries[token_id] = expires_at
+
+    async def contains(self, token_id: str) -> bool:
+        expires_at = self._entries.get(token_id)
+        return expires_at is not None and expires_at > time.time()
+
+    async def live(self) -> list[str]:
+        now = time.time()
+        self._entries = {
+            token_id: expires_at
+            for token_id, expires_at in self._entries.items()
+            if expires_at > now
+        }
+        return list(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.name, "entries": len(self._entries)}
+
+
+class RedisRevocationStore(RevocationStore):
+    """
+    Redis-backed revocation store shared across gateway workers.
+
+    Redis errors on lookups are logged and the token is treated as revoked,
+    so an unavailable store fails closed.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, key_prefix: str = "gateway:revoked:") -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ConfigurationError(
+                "TOKEN_REVOCATION_BACKEND=redis requires the redis package"
+            ) from e
+        self._redis = redis_asyncio.from_url(url)
+        self.key_prefix = key_prefix
+        self.index_key = f"{key_prefix}index"
+        self.errors = 0
+
+    async def add(self, token_id: str, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"{self.key_prefix}{token_id}", 1, px=ttl_ms)
+            pipe.zadd(self.index_key, {token_id: expires_at})
+            await pipe.execute()
+
+    async def contains(self, token_id: str) -> bool:
+        try:
+            return bool(await self._redis.exists(f"{self.key_prefix}{token_id}"))
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Revocation lookup failed, treating token as revoked: {e}")
+            return True
+
+    async def live(self) -> list[str]:
+        now = time.time()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(self.index_key, "-inf", now)
+            pipe.zrangebyscore(self.index_key, now, "+inf")
+            _, token_ids = await pipe.execute()
+        return [
+            token_id.decode() if isinstance(token_id, bytes) else token_id
+            for token_id in token_ids
+        ]
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.name, "errors": self.errors}
+
+
+class RevocationList:
+    """A revocation store fronted by a periodically rebuilt local Bloom filter."""
+
+    def __init__(
+        self,
+        store: RevocationStore,
+        capacity: int,
+        false_positive_rate: float,
+        sync_interval: float,
+    ) -> None:
+        self.store = store
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.sync_interval = sync_interval
+        self._filter = BloomFilter(capacity, false_positive_rate)
+        # IDs revoked by this worker while each running sync awaits the store
+        self._revoked_during_sync: list[set[str]] = []
+        self._task: asyncio.Task | None = None
+        self.filter_rejections = 0
+        self.store_lookups = 0
+
+    async def revoke(self, token_id: str, expires_at: float) -> None:
+        """
+        Revoke a token until it expires.
+
+        Args:
+            token_id: The token's ``jti``
+            expires_at: Unix timestamp at which the token expires
+        """
+        await self.store.add(token_id, expires_at)
+        self._filter.add(token_id)
+        for revoked in self._revoked_during_sync:
+            revoked.add(token_id)
+
+    async def is_revoked(self, token_id: str) -> bool:
+        """
+        Check whether a token has been revoked.
+
+        Args:
+            token_id: The token's ``jti``
+
+        Returns:
+            True if the token is revoked
+        """
+        if token_id not in self._filter:
+            self.filter_rejections += 1
+            return False
+        self.store_lookups += 1
+        return await self.store.contains(token_id)
+
+    async def sync(self) -> None:
+        """
+        Rebuild the Bloom filter from the revocations still live in the store.
+
+        Tokens this worker revokes while the store is being read may be
+        missing from its answer, so they are added to the new filter too;
+        otherwise the swap would let them through until the next sync.
+        """
+        revoked: set[str] = set()
+        self._revoked_during_sync.append(revoked)
+        try:
+            token_ids = await self.store.live()
+        finally:
+            self._revoked_during_sync.remove(revoked)
+        bloom = BloomFilter(
+            max(self.capacity, len(token_ids) + len(revoked)),
+            self.false_positive_rate,
+        )
+        for token_id in [*token_ids, *revoked]:
+            bloom.add(token_id)
+        self._filter = bloom
+
+    async def _run(self) -> None:
+        """Rebuild the filter forever, sleeping between rounds."""
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error(f"Revocation list sync failed: {e}", exc_info=True)
+            await asyncio.sleep(self.sync_interval)
+
+    async def start(self) -> None:
+        """Start the background sync task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="revocation-sync")
+
+    async def stop(self) -> None:
+        """Stop the background sync task and release the store."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.store.close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get revocation list counters.
+
+        Returns:
+            Dict with store occupancy, filter size, and how many checks the
+            filter answered on its own
+        """
+        return {
+            "store": self.store.stats(),
+            "filter_items": self._filter.count,
+            "filter_bits": self._filter.size,
+            "filter_rejections": self.filter_rejections,
+            "store_lookups": self.store_lookups,
+        }
+
+
+def build_revocation_store() -> RevocationStore:
+    """
+    Build the revocation store selected by TOKEN_REVOCATION_BACKEND.
+
+    Returns:
+        The configured store
+
+    Raises:
+        ConfigurationError: If the backend name is unknown
+    """
+    if settings.TOKEN_REVOCATION_BACKEND == "local":
+        return LocalRevocationStore()
+    if settings.TOKEN_REVOCATION_BACKEND == "redis":
+        redis_url = build_redis_connection_string(
+            settings.REDIS_HOST,
+            settings.REDIS_PORT,
+            settings.REDIS_DB,
+            settings.REDIS_PASSWORD or None,
+        )
+        return RedisRevocationStore(redis_url)
+    raise ConfigurationError(
+        f"Unknown TOKEN_REVOCATION_BACKEND: {settings.TOKEN_REVOCATION_BACKEND}"
+    )
+
+
+revocation_list = RevocationList(
+    build_revocation_store(),
+    capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+    false_positive_rate=settings.TOKEN_REVOCATION_BLOOM_FALSE_POSITIVE_RATE,
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+)
@@ -1,11 +1,19 @@
 from fastapi import APIRouter
 
-from api.v1.endpoints import document_uploads, document_validation, health
+from api.v1.endpoints import (
+    document_uploads,
+    document_validation,
+    health,
+    upload_sessions,
+)
 
 api_router = APIRouter()
 
 
 api_router.include_router(health.router, prefix="/health", tags=["health"])
+api_router.include_router(
+    upload_sessions.router, prefix="/documents/uploads", tags=["uploads"]
+)
 api_router.include_router(
     document_uploads.router, prefix="/documents", tags=["documents"]
 )
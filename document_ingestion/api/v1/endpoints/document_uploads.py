@@ -1,16 +1,19 @@
 from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
-from schemas.document_schema import DocumentResponse
-from services.document_service import DocumentService
+from schemas.document_schema import (
+    DocumentBatchResponse,
+    DocumentPage,
+    DocumentResponse,
+    DocumentStatus,
+    DocumentType,
+)
+from services.document_service import DocumentService, get_document_service
 from shared.utils.request_handler import process_async_request
 
 router = APIRouter()
 
 
-def get_document_service() -> DocumentService:
-    return DocumentService()
-
-
 @router.post(
     "/upload", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED
 )
@@ -28,12 +31,45 @@ async def upload_document(
     )
 
 
+@router.post(
+    "/batch",
+    response_model=DocumentBatchResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def upload_documents(
+    files: list[UploadFile] = File(...),
+    document_service: DocumentService = Depends(get_document_service),
+):
+    async def request_handler():
+        return await document_service.upload_documents(files)
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_207_MULTI_STATUS,
+        error_message="Failed to upload documents",
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_documents(
+    status_filter: DocumentStatus | None = Query(None, alias="status"),
+    document_type: DocumentType | None = Query(None, alias="type"),
+    document_service: DocumentService = Depends(get_document_service),
+):
+    return StreamingResponse(
+        document_service.export_documents(
+            status=status_filter, document_type=document_type
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: str, document_service: DocumentService = Depends(get_document_service)
 ):
     async def request_handler():
-        return document_service.get_document(document_id)
+        return await document_service.get_document(document_id)
 
     return await process_async_request(
         request_handler=request_handler,
@@ -41,14 +77,21 @@ async def get_document(
     )
 
 
-@router.get("/", response_model=list[DocumentResponse])
+@router.get("/", response_model=DocumentPage)
 async def list_documents(
-    skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    status_filter: DocumentStatus | None = Query(None, alias="status"),
+    document_type: DocumentType | None = Query(None, alias="type"),
     document_service: DocumentService = Depends(get_document_service),
 ):
     async def request_handler():
-        return document_service.list_documents(skip=skip, limit=limit)
+        return await document_service.list_documents(
+            limit=limit,
+            cursor=cursor,
+            status=status_filter,
+            document_type=document_type,
+        )
 
     return await process_async_request(
         request_handler=request_handler, error_message="Failed to retrieve documents"
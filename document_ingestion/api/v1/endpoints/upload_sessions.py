@@ -0,0 +1,100 @@
+from fastapi import APIRouter, Depends, Header, Request, status
+
+from schemas.document_schema import DocumentResponse
+from schemas.upload_session_schema import (
+    UploadSessionComplete,
+    UploadSessionCreate,
+    UploadSessionResponse,
+)
+from services.upload_session_service import (
+    UploadSessionService,
+    get_upload_session_service,
+)
+from shared.utils.request_handler import process_async_request
+
+router = APIRouter()
+
+
+@router.post(
+    "/", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_upload_session(
+    session_request: UploadSessionCreate,
+    upload_service: UploadSessionService = Depends(get_upload_session_service),
+):
+    async def request_handler():
+        return await upload_service.create_session(session_request)
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_201_CREATED,
+        error_message="Failed to create upload session",
+    )
+
+
+@router.get("/{session_id}", response_model=UploadSessionResponse)
+async def get_upload_session(
+    session_id: str,
+    upload_service: UploadSessionService = Depends(get_upload_session_service),
+):
+    async def request_handler():
+        return await upload_service.get_session(session_id)
+
+    return await process_async_request(
+        request_handler=request_handler,
+        error_message=f"Upload session with ID {session_id} not found",
+    )
+
+
+@router.patch("/{session_id}", response_model=UploadSessionResponse)
+async def upload_chunk(
+    session_id: str,
+    request: Request,
+    content_range: str | None = Header(None),
+    x_chunk_sha256: str | None = Header(None),
+    upload_service: UploadSessionService = Depends(get_upload_session_service),
+):
+    async def request_handler():
+        return await upload_service.write_chunk(
+            session_id,
+            content_range=content_range,
+            body=request.stream(),
+            checksum=x_chunk_sha256,
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        error_message=f"Failed to upload chunk for session {session_id}",
+    )
+
+
+@router.post("/{session_id}/complete", response_model=DocumentResponse)
+async def complete_upload_session(
+    session_id: str,
+    completion: UploadSessionComplete | None = None,
+    upload_service: UploadSessionService = Depends(get_upload_session_service),
+):
+    async def request_handler():
+        return await upload_service.complete_session(
+            session_id, sha256=completion.sha256 if completion else None
+        )
+
+    return await process_async_request(
+        request_handler=request_handler,
+        success_status_code=status.HTTP_201_CREATED,
+        error_message=f"Failed to complete upload session {session_id}",
+    )
+
+
+@router.delete("/{session_id}", response_model=UploadSessionResponse)
+async def abort_upload_session(
+    session_id: str,
+    upload_service: UploadSessionService = Depends(get_upload_session_service),
+):
+    async def request_handler():
+        return await upload_service.abort_session(session_id)
+
+    return await process_async_request(
+        request_handler=request_handler,
+        error_message=f"Failed to abort upload session {session_id}",
+    )
@@ -1,4 +1,5 @@
 import logging
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -6,6 +7,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from api.v1.api_routes import api_router
 from core.config import settings
+from services.document_service import get_document_service
+from services.upload_session_service import get_upload_session_service
+from shared.database.mongodb import close_mongo_connection, connect_to_mongo
+from shared.utils.conditional import ConditionalRequestMiddleware
+from shared.utils.deadline import DeadlineMiddleware
+from shared.utils.loop_monitor import loop_monitor
+from shared.utils.metrics import MetricsMiddleware, MetricsServer
+from shared.utils.profiler import create_profiler_router
 
 logging.basicConfig(
     level=settings.LOG_LEVEL.upper(),
@@ -13,13 +22,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+metrics_server = MetricsServer(port=settings.METRICS_PORT)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Asynchronous context manager for managing the lifespan of the FastAPI application.
 
-    This context manager logs messages when the Document Ingestion Service starts up and shuts down.
+    This context manager logs messages when the Document Ingestion Service starts up and shuts down,
+    owns the process-wide MongoDB connection pool, creates the document and upload
+    session indexes, and runs the sweeper that aborts expired upload sessions.
 
     Args:
         app (FastAPI): The FastAPI application instance.
@@ -28,7 +41,38 @@ async def lifespan(app: FastAPI):
         None
     """
     logger.info("Starting up Document Ingestion Service")
+    if settings.ENABLE_METRICS:
+        await metrics_server.start()
+    if settings.ENABLE_LOOP_MONITOR:
+        await loop_monitor.start(
+            interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+            slow_threshold=settings.LOOP_MONITOR_SLOW_SECONDS,
+        )
+    os.makedirs(settings.UPLOAD_FOLDER, exist_ok=True)
+    await connect_to_mongo(
+        settings.MONGO_URI,
+        min_pool_size=settings.MONGO_MIN_POOL_SIZE,
+        max_pool_size=settings.MONGO_MAX_POOL_SIZE,
+        max_idle_time_ms=settings.MONGO_MAX_IDLE_TIME_MS,
+        server_selection_timeout_ms=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    )
+    try:
+        await get_document_service().ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Could not create document indexes: {e}")
+    upload_session_service = get_upload_session_service()
+    try:
+        await upload_session_service.ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Could not create upload session indexes: {e}")
+    await upload_session_service.start_sweeper(
+        settings.RESUMABLE_UPLOAD_SWEEP_INTERVAL_SECONDS
+    )
     yield
+    await upload_session_service.stop_sweeper()
+    await close_mongo_connection()
+    await loop_monitor.stop()
+    await metrics_server.stop()
     logger.info("Shutting down Document Ingestion Service")
 
 
@@ -48,6 +92,10 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    application.add_middleware(ConditionalRequestMiddleware)
+
+    application.add_middleware(DeadlineMiddleware)
+
     application.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -56,11 +104,23 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.ENABLE_METRICS:
+        application.add_middleware(MetricsMiddleware)
+
     application.include_router(
         api_router,
         prefix=settings.API_V1_PREFIX,
     )
 
+    if settings.ADMIN_API_TOKEN:
+        application.include_router(
+            create_profiler_router(
+                settings.ADMIN_API_TOKEN, settings.PROFILER_MAX_SECONDS
+            ),
+            prefix=f"{settings.API_V1_PREFIX}/admin/profile",
+            tags=["Profiling"],
+        )
+
     return application
 
 
@@ -22,20 +22,48 @@ class Settings(BaseSettings):
     UPLOAD_FOLDER: str
     MAX_CONTENT_LENGTH: int
     ALLOWED_EXTENSIONS: list[str]
+    UPLOAD_CHUNK_SIZE: int = 1048576
+    UPLOAD_FSYNC_POLICY: str = "on_close"
+    CONTENT_ADDRESSED_STORAGE: bool = False
+    RESUMABLE_UPLOAD_MAX_SIZE: int = 1073741824
+    RESUMABLE_UPLOAD_CHUNK_SIZE: int = 8388608
+    RESUMABLE_UPLOAD_MIN_CHUNK_SIZE: int = 262144
+    RESUMABLE_UPLOAD_MAX_CHUNK_SIZE: int = 16777216
+    RESUMABLE_UPLOAD_SESSION_TTL_SECONDS: int = 86400
+    RESUMABLE_UPLOAD_SWEEP_INTERVAL_SECONDS: float = 300.0
+    DOCUMENT_BATCH_MAX_FILES: int = 100
+    DOCUMENT_BATCH_CONCURRENCY: int = 8
 
     MONGO_HOST: str
     MONGO_PORT: int
     MONGO_DATABASE: str
     MONGO_COLLECTION: str
+    MONGO_BLOB_COLLECTION: str = "document_blobs"
+    MONGO_UPLOAD_SESSION_COLLECTION: str = "upload_sessions"
+    DOCUMENT_EXPORT_BATCH_SIZE: int = 1000
     MONGO_USERNAME: str
     MONGO_PASSWORD: str
     MONGO_URI: str
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MAX_IDLE_TIME_MS: int = 300000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5000
 
     MIN_IMAGE_RESOLUTION: int
     MAX_IMAGE_SIZE: int
 
     CORS_ORIGINS: list[str]
 
+    ENABLE_METRICS: bool = False
+    METRICS_PORT: int = 9091
+    ENABLE_LOOP_MONITOR: bool = False
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_MONITOR_SLOW_SECONDS: float = 0.1
+
+    # On-demand profiling endpoints, mounted only when a token is set
+    ADMIN_API_TOKEN: str = ""
+    PROFILER_MAX_SECONDS: float = 60.0
+
     model_config = SettingsConfigDict(
         env_file=BaseAppSettings.get_env_file(Path(__file__).parent.parent),
         env_file_encoding="utf-8",
@@ -34,6 +34,9 @@ class DocumentCreate(DocumentBase):
     )
     status: DocumentStatus = DocumentStatus.UPLOADED
     document_type: DocumentType | None = None
+    sha256: str | None = None
+    is_duplicate: bool = False
+    duplicate_of: str | None = None
 
 
 class DocumentResponse(DocumentBase):
@@ -45,11 +48,43 @@ class DocumentResponse(DocumentBase):
     processing_timestamp: datetime | None = None
     storage_path: str
     preview_url: str | None = None
+    sha256: str | None = None
+    is_duplicate: bool = False
+    duplicate_of: str | None = None
 
     class Config:
         from_attributes = True
 
 
+class DocumentSummary(DocumentBase):
+    id: str
+    original_filename: str
+    upload_timestamp: datetime
+    status: DocumentStatus
+    document_type: DocumentType | None = None
+
+
+class DocumentPage(BaseModel):
+    items: list[DocumentSummary]
+    next_cursor: str | None = None
+    limit: int
+
+
+class DocumentBatchItem(BaseModel):
+    index: int
+    filename: str | None = None
+    success: bool
+    status_code: int
+    data: DocumentResponse | None = None
+    error: str | None = None
+
+
+class DocumentBatchResponse(BaseModel):
+    items: list[DocumentBatchItem]
+    succeeded: int
+    failed: int
+
+
 class ValidationResult(BaseModel):
     is_valid: bool
     errors: list[str] = []
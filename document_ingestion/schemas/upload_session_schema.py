@@ -0,0 +1,48 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from core.config import settings
+
+
+class UploadSessionStatus(str, Enum):
+    UPLOADING = "uploading"
+    COMPLETING = "completing"
+    COMPLETED = "completed"
+    ABORTED = "aborted"
+
+
+class UploadSessionCreate(BaseModel):
+    filename: str
+    file_size: int = Field(..., gt=0)
+    mime_type: str
+    chunk_size: int | None = Field(
+        None,
+        ge=settings.RESUMABLE_UPLOAD_MIN_CHUNK_SIZE,
+        le=settings.RESUMABLE_UPLOAD_MAX_CHUNK_SIZE,
+    )
+
+
+class UploadSessionComplete(BaseModel):
+    sha256: str | None = None
+
+
+class UploadSessionResponse(BaseModel):
+    id: str
+    filename: str
+    file_size: int
+    mime_type: str
+    chunk_size: int
+    total_chunks: int
+    status: UploadSessionStatus
+    offset: int
+    received_bytes: int
+    received_chunks: list[int]
+    missing_chunk_count: int
+    # Runs of missing chunks as [first, last] index pairs, both inclusive
+    missing_chunk_ranges: list[tuple[int, int]]
+    chunk_checksums: dict[int, str]
+    document_id: str | None = None
+    created_at: datetime
+    expires_at: datetime
@@ -0,0 +1,181 @@
+import asyncio
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from shared.utils.file_utils import WrittenFile, remove_if_exists
+
+# How often a commit re-checks a blob whose last reference is being deleted
+DELETION_POLL_SECONDS = 0.05
+
+# A deletion still unfinished after this long was interrupted, e.g. by a
+# crash, and is completed by the next commit of the same content
+DELETION_TIMEOUT = timedelta(seconds=60)
+
+
+@dataclass
+class StoredBlob:
+    """A content-addressed blob and its reference count after an operation."""
+
+    sha256: str
+    storage_path: str
+    size: int
+    ref_count: int
+    first_document_id: str
+
+    @property
+    def is_duplicate(self) -> bool:
+        """Whether the blob was already stored by an earlier document."""
+        return self.ref_count > 1
+
+
+class ContentAddressedStore:
+    """
+    Store document content once per SHA-256 digest.
+
+    Blobs live under ``<root>/blobs/<aa>/<bb>/<sha256>`` and a Mongo record per
+    digest counts how many documents reference the blob. Uploads are first
+    streamed to ``<root>/tmp`` (hashing as they go) and then either moved into
+    place or discarded if the blob already exists.
+
+    Releasing the last reference marks the record as ``deleting`` before the
+    file is removed, and the record is only deleted once the file is gone.
+    A commit of the same content waits for such a record to disappear, so it
+    never takes a reference to a blob whose file is about to be removed.
+    """
+
+    def __init__(self, root: str, collection: AsyncIOMotorCollection):
+        self.root = root
+        self.collection = collection
+
+    def temp_path(self) -> str:
+        """Get a fresh path for streaming an upload before its digest is known."""
+        temp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(temp_dir, exist_ok=True)
+        return os.path.join(temp_dir, uuid.uuid4().hex)
+
+    def blob_path(self, sha256: str) -> str:
+        """Get the sharded storage path for a digest."""
+        return os.path.join(self.root, "blobs", sha256[:2], sha256[2:4], sha256)
+
+    async def commit(self, written: WrittenFile, document_id: str) -> StoredBlob:
+        """
+        Take ownership of a streamed temp file and reference its blob.
+
+        Args:
+            written: The temp file written by ``save_upload``
+            document_id: ID of the document referencing the blob
+
+        Returns:
+            The stored blob, with its reference count including this document
+        """
+        storage_path = self.blob_path(written.sha256)
+
+        # Take the reference before touching the file so a concurrent release
+        # of the last reference cannot delete the blob from under us.
+        while True:
+            try:
+                record = await self.collection.find_one_and_update(
+                    {"_id": written.sha256, "deleting": {"$ne": True}},
+                    {
+                        "$inc": {"ref_count": 1},
+                        "$setOnInsert": {
+                            "storage_path": storage_path,
+                            "size": written.size,
+                            "first_document_id": document_id,
+                            "created_at": datetime.now(timezone.utc),
+                        },
+                    },
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+                break
+            except DuplicateKeyError:
+                # The record is being deleted, or a concurrent commit has
+                # just inserted it
+                await self._wait_for_deletion(written.sha256)
+
+        try:
+            await asyncio.to_thread(_move_into_place, written.path, storage_path)
+        except Exception:
+            await self.release(written.sha256)
+            raise
+
+        return StoredBlob(
+            sha256=written.sha256,
+            storage_path=storage_path,
+            size=written.size,
+            ref_count=record["ref_count"],
+            first_document_id=record["first_document_id"],
+        )
+
+    async def release(self, sha256: str) -> None:
+        """
+        Drop one reference to a blob, deleting it when no references remain.
+
+        Args:
+            sha256: Digest of the blob
+        """
+        record = await self.collection.find_one_and_update(
+            {"_id": sha256, "deleting": {"$ne": True}},
+            {"$inc": {"ref_count": -1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not record or record["ref_count"] > 0:
+            return
+
+        # A commit that took a reference since then keeps the blob alive
+        claimed = await self.collection.find_one_and_update(
+            {"_id": sha256, "ref_count": {"$lte": 0}, "deleting": {"$ne": True}},
+            {"$set": {"deleting": True, "deleting_since": datetime.now(timezone.utc)}},
+        )
+        if claimed:
+            await self._finish_deletion(sha256, claimed["storage_path"])
+
+    async def _finish_deletion(self, sha256: str, storage_path: str) -> None:
+        """Remove the file of a blob marked as deleting, then its record."""
+        try:
+            await asyncio.to_thread(remove_if_exists, storage_path)
+        finally:
+            # If removal failed the file is left in place, which is harmless:
+            # the next commit of the same content reuses it
+            await self.collection.delete_one({"_id": sha256, "deleting": True})
+
+    async def _wait_for_deletion(self, sha256: str) -> None:
+        """
+        Wait for a blob record being deleted to go away.
+
+        A deletion that has been pending for longer than DELETION_TIMEOUT was
+        interrupted; it is claimed and completed here instead.
+
+        Args:
+            sha256: Digest of the blob
+        """
+        now = datetime.now(timezone.utc)
+        stale = await self.collection.find_one_and_update(
+            {
+                "_id": sha256,
+                "deleting": True,
+                "deleting_since": {"$lt": now - DELETION_TIMEOUT},
+            },
+            {"$set": {"deleting_since": now}},
+        )
+        if stale:
+            await self._finish_deletion(sha256, stale["storage_path"])
+            return
+        if await self.collection.count_documents({"_id": sha256, "deleting": True}):
+            await asyncio.sleep(DELETION_POLL_SECONDS)
+
+
+def _move_into_place(temp_path: str, storage_path: str) -> None:
+    """Move a temp file to its blob path, or discard it if the blob exists."""
+    if os.path.exists(storage_path):
+        remove_if_exists(temp_path)
+        return
+    os.makedirs(os.path.dirname(storage_path), exist_ok=True)
+    os.replace(temp_path, storage_path)
@@ -1,30 +1,133 @@
+import asyncio
+import base64
+import binascii
+import json
+import logging
 import os
-import shutil
 import uuid
+from datetime import datetime
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Any, AsyncIterator
 
 from fastapi import UploadFile
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError
 
 from core.config import settings
 from schemas.document_schema import (
+    DocumentBatchItem,
+    DocumentBatchResponse,
     DocumentCreate,
+    DocumentPage,
     DocumentResponse,
     DocumentStatus,
+    DocumentSummary,
     DocumentType,
     ValidationResult,
 )
-from shared.exceptions.base import DataProcessingError, NotFoundError, ValidationError
+from services.blob_store import ContentAddressedStore, StoredBlob
+from shared.database.mongodb import get_database
+from shared.exceptions.base import (
+    ApplicationError,
+    DataProcessingError,
+    NotFoundError,
+    ValidationError,
+)
+from shared.utils.file_utils import WrittenFile, remove_if_exists, save_upload
+
+logger = logging.getLogger(__name__)
+
+# Listings are ordered newest first; _id breaks ties between equal timestamps.
+LISTING_SORT = [("upload_timestamp", DESCENDING), ("_id", DESCENDING)]
+
+# One index per listing query shape: unfiltered, by status, by type, and both.
+# The filter fields come first so each index also serves the sort.
+DOCUMENT_INDEXES = [
+    IndexModel(LISTING_SORT, name="upload_timestamp_id"),
+    IndexModel(
+        [("status", ASCENDING), *LISTING_SORT], name="status_upload_timestamp_id"
+    ),
+    IndexModel(
+        [("document_type", ASCENDING), *LISTING_SORT],
+        name="document_type_upload_timestamp_id",
+    ),
+    IndexModel(
+        [("status", ASCENDING), ("document_type", ASCENDING), *LISTING_SORT],
+        name="status_document_type_upload_timestamp_id",
+    ),
+]
+
+# MIME type recorded for uploads whose client declared none
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+# Fields fetched for listings, matching DocumentSummary
+SUMMARY_PROJECTION = {
+    "filename": 1,
+    "original_filename": 1,
+    "file_size": 1,
+    "mime_type": 1,
+    "file_extension": 1,
+    "upload_timestamp": 1,
+    "status": 1,
+    "document_type": 1,
+}
+
+
+def encode_cursor(document: dict) -> str:
+    """
+    Encode the listing position just after a document as an opaque cursor.
+
+    Args:
+        document: The last document of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    position = [document["upload_timestamp"].isoformat(), document["_id"]]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (upload_timestamp, _id) of the last document already returned
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        timestamp, document_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(timestamp), str(document_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValidationError(
+            f"Invalid cursor: {str(e)}", status_code=HTTPStatus.BAD_REQUEST
+        )
 
 
 class DocumentService:
-    def __init__(self):
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection | None = None,
+        blob_store: ContentAddressedStore | None = None,
+    ):
         self.settings = settings
-        self.client = MongoClient(self.settings.MONGO_URI)
-        self.db = self.client[self.settings.MONGO_DATABASE]
-        self.collection = self.db[self.settings.MONGO_COLLECTION]
-
-        # Ensure upload directory exists
-        os.makedirs(self.settings.UPLOAD_FOLDER, exist_ok=True)
+        if collection is None:
+            database = get_database(self.settings.MONGO_DATABASE)
+            collection = database[self.settings.MONGO_COLLECTION]
+        self.collection = collection
+        self.blob_store = blob_store
+        if self.blob_store is None and self.settings.CONTENT_ADDRESSED_STORAGE:
+            self.blob_store = ContentAddressedStore(
+                self.settings.UPLOAD_FOLDER,
+                self.collection.database[self.settings.MONGO_BLOB_COLLECTION],
+            )
 
     def _is_allowed_file(self, filename: str) -> bool:
         """Check if the file extension is allowed."""
@@ -33,108 +136,426 @@ class DocumentService:
             and filename.rsplit(".", 1)[1].lower() in self.settings.ALLOWED_EXTENSIONS
         )
 
+    @staticmethod
+    def _to_response(document: dict) -> DocumentResponse:
+        """Build a DocumentResponse from a stored document."""
+        return DocumentResponse(
+            id=document["_id"],
+            filename=document["filename"],
+            original_filename=document["original_filename"],
+            file_size=document["file_size"],
+            mime_type=document["mime_type"],
+            file_extension=document["file_extension"],
+            upload_timestamp=document["upload_timestamp"],
+            status=DocumentStatus(document["status"]),
+            storage_path=document["storage_path"],
+            document_type=DocumentType(document["document_type"])
+            if document.get("document_type")
+            else None,
+            processing_timestamp=document.get("processing_timestamp"),
+            preview_url=document.get("preview_url"),
+            sha256=document.get("sha256"),
+            is_duplicate=document.get("is_duplicate", False),
+            duplicate_of=document.get("duplicate_of"),
+        )
+
+    @staticmethod
+    def _to_summary(document: dict) -> DocumentSummary:
+        """Build a DocumentSummary from a projected document."""
+        return DocumentSummary(
+            id=document["_id"],
+            filename=document["filename"],
+            original_filename=document["original_filename"],
+            file_size=document["file_size"],
+            mime_type=document["mime_type"],
+            file_extension=document["file_extension"],
+            upload_timestamp=document["upload_timestamp"],
+            status=DocumentStatus(document["status"]),
+            document_type=DocumentType(document["document_type"])
+            if document.get("document_type")
+            else None,
+        )
+
+    def validate_filename(self, filename: str | None) -> str:
+        """Validate an upload filename and get its lowercase extension."""
+        if not filename:
+            raise ValidationError("No file provided")
+
+        if not self._is_allowed_file(filename):
+            raise ValidationError(
+                f"File extension not allowed. Allowed extensions: {self.settings.ALLOWED_EXTENSIONS}"
+            )
+
+        return filename.rsplit(".", 1)[1].lower()
+
+    def staging_path(self) -> str:
+        """Get a fresh path for writing an upload before it becomes a document."""
+        if self.blob_store is not None:
+            return self.blob_store.temp_path()
+        staging_dir = os.path.join(self.settings.UPLOAD_FOLDER, "tmp")
+        os.makedirs(staging_dir, exist_ok=True)
+        return os.path.join(staging_dir, uuid.uuid4().hex)
+
+    async def _save_upload(self, file: UploadFile) -> WrittenFile:
+        """Write an upload to a fresh staging file."""
+        try:
+            return await save_upload(
+                file,
+                self.staging_path(),
+                chunk_size=self.settings.UPLOAD_CHUNK_SIZE,
+                fsync_policy=self.settings.UPLOAD_FSYNC_POLICY,
+                max_size=self.settings.MAX_CONTENT_LENGTH,
+            )
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise DataProcessingError(f"Failed to upload document: {str(e)}")
+
     async def upload_document(self, file: UploadFile) -> DocumentResponse:
         """Upload a document and save metadata to database."""
         if not file or not file.filename:
             raise ValidationError("No file provided")
+        self.validate_filename(file.filename)
 
-        if not self._is_allowed_file(file.filename):
+        written = await self._save_upload(file)
+
+        return await self.create_document_from_file(
+            written,
+            original_filename=file.filename,
+            mime_type=file.content_type or DEFAULT_MIME_TYPE,
+        )
+
+    async def upload_documents(self, files: list[UploadFile]) -> DocumentBatchResponse:
+        """
+        Upload several documents and save their metadata with one insert.
+
+        Files are written to storage concurrently, at most
+        DOCUMENT_BATCH_CONCURRENCY at a time, and the metadata of every stored
+        file is written with a single unordered ``insert_many``. A file that
+        fails does not affect the others; each one gets its own result.
+
+        Args:
+            files: The uploaded files
+
+        Returns:
+            Per-file results, in upload order
+
+        Raises:
+            ValidationError: If no files, or more than DOCUMENT_BATCH_MAX_FILES
+                files, were provided
+        """
+        if not files:
+            raise ValidationError("No files provided")
+        max_files = self.settings.DOCUMENT_BATCH_MAX_FILES
+        if len(files) > max_files:
             raise ValidationError(
-                f"File extension not allowed. Allowed extensions: {self.settings.ALLOWED_EXTENSIONS}"
+                f"A batch may contain at most {max_files} files",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
             )
 
-        file_extension = (
-            file.filename.rsplit(".", 1)[1].lower()
-            if file.filename and "." in file.filename
-            else ""
+        semaphore = asyncio.Semaphore(self.settings.DOCUMENT_BATCH_CONCURRENCY)
+
+        async def store(file: UploadFile) -> tuple[dict, StoredBlob | None]:
+            async with semaphore:
+                # An empty filename is rejected by validate_filename
+                filename = file.filename or ""
+                file_extension = self.validate_filename(filename)
+                written = await self._save_upload(file)
+                return await self._store_file(
+                    written,
+                    filename,
+                    file.content_type or DEFAULT_MIME_TYPE,
+                    file_extension,
+                )
+
+        outcomes: list[Any] = await asyncio.gather(
+            *(store(file) for file in files), return_exceptions=True
+        )
+        stored = [
+            (index, outcome)
+            for index, outcome in enumerate(outcomes)
+            if not isinstance(outcome, BaseException)
+        ]
+
+        if stored:
+            failed: dict[int, str] = {}
+            try:
+                await self.collection.insert_many(
+                    [document_dict for _, (document_dict, _) in stored], ordered=False
+                )
+            except BulkWriteError as e:
+                for error in e.details.get("writeErrors", []):
+                    failed[error["index"]] = error.get("errmsg", "Write failed")
+            except Exception as e:
+                failed = {position: str(e) for position in range(len(stored))}
+
+            for position, message in failed.items():
+                index, (document_dict, blob) = stored[position]
+                await self._discard_stored(blob, document_dict["storage_path"])
+                outcomes[index] = DataProcessingError(
+                    f"Failed to upload document: {message}"
+                )
+
+        items = [
+            self._to_batch_item(index, file.filename, outcome)
+            for index, (file, outcome) in enumerate(zip(files, outcomes))
+        ]
+        succeeded = sum(1 for item in items if item.success)
+        return DocumentBatchResponse(
+            items=items, succeeded=succeeded, failed=len(items) - succeeded
+        )
+
+    def _to_batch_item(
+        self, index: int, filename: str | None, outcome: Any
+    ) -> DocumentBatchItem:
+        """Build the batch result of one file from its document or its error."""
+        if isinstance(outcome, ApplicationError):
+            return DocumentBatchItem(
+                index=index,
+                filename=filename,
+                success=False,
+                status_code=outcome.status_code,
+                error=outcome.message,
+            )
+        if isinstance(outcome, BaseException):
+            logger.error(f"Unexpected error uploading {filename}: {outcome}")
+            return DocumentBatchItem(
+                index=index,
+                filename=filename,
+                success=False,
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                error=f"Failed to upload document: {str(outcome)}",
+            )
+        document_dict, _ = outcome
+        return DocumentBatchItem(
+            index=index,
+            filename=filename,
+            success=True,
+            status_code=HTTPStatus.CREATED,
+            data=self._to_response(document_dict),
         )
-        unique_filename = f"{uuid.uuid4()}.{file_extension}"
-        file_path = os.path.join(self.settings.UPLOAD_FOLDER, unique_filename)
 
+    async def create_document_from_file(
+        self, written: WrittenFile, original_filename: str, mime_type: str
+    ) -> DocumentResponse:
+        """
+        Take ownership of a fully written staging file and record it as a document.
+
+        Args:
+            written: The staging file, as returned by ``save_upload``
+            original_filename: Filename the client uploaded
+            mime_type: MIME type the client declared
+
+        Returns:
+            The created document
+
+        Raises:
+            ValidationError: If the filename is not allowed
+            DataProcessingError: If the file cannot be stored or recorded
+        """
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            file_extension = self.validate_filename(original_filename)
+        except ValidationError:
+            await asyncio.to_thread(remove_if_exists, written.path)
+            raise
+
+        document_dict, blob = await self._store_file(
+            written, original_filename, mime_type, file_extension
+        )
+
+        try:
+            await self.collection.insert_one(document_dict)
+        except Exception as e:
+            await self._discard_stored(blob, document_dict["storage_path"])
+            raise DataProcessingError(f"Failed to upload document: {str(e)}")
+
+        return self._to_response(document_dict)
+
+    async def _store_file(
+        self,
+        written: WrittenFile,
+        original_filename: str,
+        mime_type: str,
+        file_extension: str,
+    ) -> tuple[dict, StoredBlob | None]:
+        """
+        Move a staging file into storage and build its document record.
+
+        The record is not inserted; if inserting it fails, the caller must
+        undo the storage with ``_discard_stored``.
+
+        Args:
+            written: The staging file, as returned by ``save_upload``
+            original_filename: Filename the client uploaded
+            mime_type: MIME type the client declared
+            file_extension: Validated lowercase extension of the filename
+
+        Returns:
+            Tuple of (document record, blob it references if content addressed)
+
+        Raises:
+            DataProcessingError: If the file cannot be stored
+        """
+        document_id = str(uuid.uuid4())
+        blob: StoredBlob | None = None
+        file_path: str | None = None
+
+        try:
+            if self.blob_store is not None:
+                blob = await self.blob_store.commit(written, document_id)
+                stored_filename = f"{blob.sha256}.{file_extension}"
+                file_path = blob.storage_path
+            else:
+                stored_filename = f"{uuid.uuid4()}.{file_extension}"
+                file_path = os.path.join(self.settings.UPLOAD_FOLDER, stored_filename)
+                await asyncio.to_thread(os.replace, written.path, file_path)
 
             document = DocumentCreate(
-                filename=unique_filename,
-                original_filename=file.filename,
-                file_size=os.path.getsize(file_path),
-                mime_type=file.content_type,
+                filename=stored_filename,
+                original_filename=original_filename,
+                file_size=written.size,
+                mime_type=mime_type,
                 file_extension=file_extension,
+                sha256=written.sha256,
+                is_duplicate=blob.is_duplicate if blob else False,
+                duplicate_of=blob.first_document_id
+                if blob and blob.is_duplicate
+                else None,
             )
 
             document_dict = document.model_dump()
-            document_dict["_id"] = str(uuid.uuid4())
+            document_dict["_id"] = document_id
             document_dict["storage_path"] = file_path
-
-            self.collection.insert_one(document_dict)
-
-            return DocumentResponse(
-                id=document_dict["_id"],
-                filename=document.filename,
-                original_filename=document.original_filename,
-                file_size=document.file_size,
-                mime_type=document.mime_type,
-                file_extension=document.file_extension,
-                upload_timestamp=document.upload_timestamp,
-                status=document.status,
-                storage_path=file_path,
-                document_type=document.document_type,
-            )
+            return document_dict, blob
         except Exception as e:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            await self._discard_stored(blob, file_path)
+            await asyncio.to_thread(remove_if_exists, written.path)
             raise DataProcessingError(f"Failed to upload document: {str(e)}")
 
-    def get_document(self, document_id: str) -> DocumentResponse:
+    async def _discard_stored(
+        self, blob: StoredBlob | None, file_path: str | None
+    ) -> None:
+        """Undo ``_store_file`` for a document that was not recorded."""
+        if blob is not None:
+            assert self.blob_store is not None
+            await self.blob_store.release(blob.sha256)
+        elif file_path is not None:
+            await asyncio.to_thread(remove_if_exists, file_path)
+
+    async def get_document(self, document_id: str) -> DocumentResponse:
         """Get document by ID."""
-        document = self.collection.find_one({"_id": document_id})
+        document = await self.collection.find_one({"_id": document_id})
         if not document:
             raise NotFoundError("Document", document_id)
 
-        return DocumentResponse(
-            id=document["_id"],
-            filename=document["filename"],
-            original_filename=document["original_filename"],
-            file_size=document["file_size"],
-            mime_type=document["mime_type"],
-            file_extension=document["file_extension"],
-            upload_timestamp=document["upload_timestamp"],
-            status=DocumentStatus(document["status"]),
-            storage_path=document["storage_path"],
-            document_type=DocumentType(document["document_type"])
-            if document.get("document_type")
-            else None,
-            processing_timestamp=document.get("processing_timestamp"),
-            preview_url=document.get("preview_url"),
+        return self._to_response(document)
+
+    async def list_documents(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        status: DocumentStatus | None = None,
+        document_type: DocumentType | None = None,
+    ) -> DocumentPage:
+        """
+        List documents newest first using keyset pagination.
+
+        Each page resumes from the (upload_timestamp, _id) position encoded in
+        the cursor instead of skipping over earlier documents, so every page
+        is a bounded index range scan however deep it is.
+
+        Args:
+            limit: Maximum number of documents to return
+            cursor: Cursor from the previous page, or None for the first page
+            status: Optional status filter
+            document_type: Optional document type filter
+
+        Returns:
+            The page of document summaries and the cursor for the next page
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        query: dict[str, Any] = {}
+        if status:
+            query["status"] = status.value
+        if document_type:
+            query["document_type"] = document_type.value
+        if cursor:
+            timestamp, document_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"upload_timestamp": {"$lt": timestamp}},
+                {"upload_timestamp": timestamp, "_id": {"$lt": document_id}},
+            ]
+
+        # Fetch one extra document to learn whether another page exists.
+        documents = (
+            await self.collection.find(query, SUMMARY_PROJECTION)
+            .sort(LISTING_SORT)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
         )
+        has_more = len(documents) > limit
+        documents = documents[:limit]
 
-    def list_documents(self, skip: int = 0, limit: int = 100) -> list[DocumentResponse]:
-        """List all documents with pagination."""
-        documents = list(self.collection.find().skip(skip).limit(limit))
-        return [
-            DocumentResponse(
-                id=doc["_id"],
-                filename=doc["filename"],
-                original_filename=doc["original_filename"],
-                file_size=doc["file_size"],
-                mime_type=doc["mime_type"],
-                file_extension=doc["file_extension"],
-                upload_timestamp=doc["upload_timestamp"],
-                status=DocumentStatus(doc["status"]),
-                storage_path=doc["storage_path"],
-                document_type=DocumentType(doc["document_type"])
-                if doc.get("document_type")
-                else None,
-                processing_timestamp=doc.get("processing_timestamp"),
-                preview_url=doc.get("preview_url"),
-            )
-            for doc in documents
-        ]
+        return DocumentPage(
+            items=[self._to_summary(doc) for doc in documents],
+            next_cursor=encode_cursor(documents[-1]) if has_more else None,
+            limit=limit,
+        )
+
+    async def export_documents(
+        self,
+        status: DocumentStatus | None = None,
+        document_type: DocumentType | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream document summaries as newline-delimited JSON.
+
+        Documents are read from a single Mongo cursor in batches of
+        DOCUMENT_EXPORT_BATCH_SIZE, and each batch is yielded as one chunk of
+        NDJSON rows, so memory use is bounded by the batch size rather than
+        the catalog size.
+
+        Args:
+            status: Optional status filter
+            document_type: Optional document type filter
 
-    def validate_document(self, document_id: str) -> ValidationResult:
+        Yields:
+            Chunks of NDJSON, one DocumentSummary per line
+        """
+        query: dict[str, Any] = {}
+        if status:
+            query["status"] = status.value
+        if document_type:
+            query["document_type"] = document_type.value
+
+        batch_size = self.settings.DOCUMENT_EXPORT_BATCH_SIZE
+        cursor = (
+            self.collection.find(query, SUMMARY_PROJECTION)
+            .sort(LISTING_SORT)
+            .batch_size(batch_size)
+        )
+
+        rows: list[bytes] = []
+        try:
+            async for document in cursor:
+                rows.append(self._to_summary(document).model_dump_json().encode())
+                if len(rows) >= batch_size:
+                    yield b"\n".join(rows) + b"\n"
+                    rows = []
+            if rows:
+                yield b"\n".join(rows) + b"\n"
+        finally:
+            await cursor.close()
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes used by document listings, if they are missing."""
+        await self.collection.create_indexes(DOCUMENT_INDEXES)
+
+    async def validate_document(self, document_id: str) -> ValidationResult:
         """Validate a document and return validation results."""
-        document = self.collection.find_one({"_id": document_id})
+        document = await self.collection.find_one({"_id": document_id})
         if not document:
             raise NotFoundError("Document", document_id)
 
@@ -156,7 +577,7 @@ class DocumentService:
         # - Required fields detection
 
         # Update document status
-        self.collection.update_one(
+        await self.collection.update_one(
             {"_id": document_id}, {"$set": {"status": DocumentStatus.VALIDATED.value}}
         )
 
@@ -166,3 +587,9 @@ class DocumentService:
             document_type=DocumentType.OTHER,
             confidence_score=0.8,
         )
+
+
+@lru_cache
+def get_document_service() -> DocumentService:
+    """Get the DocumentService bound to the process-wide MongoDB client."""
+    return DocumentService()
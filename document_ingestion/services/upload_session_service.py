@@ -0,0 +1,533 @@
+import asyncio
+import logging
+import math
+import os
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http import HTTPStatus
+from typing import AsyncIterator
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+
+from core.config import settings
+from schemas.document_schema import DocumentResponse
+from schemas.upload_session_schema import (
+    UploadSessionCreate,
+    UploadSessionResponse,
+    UploadSessionStatus,
+)
+from services.document_service import DocumentService, get_document_service
+from shared.database.mongodb import get_database
+from shared.exceptions.base import DataProcessingError, NotFoundError, ValidationError
+from shared.utils.file_utils import (
+    FsyncPolicy,
+    copy_file,
+    preallocate_file,
+    remove_if_exists,
+    write_range,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+# Expired unfinished sessions are found by the sweeper, which must also
+# remove their part files; finished sessions are deleted by MongoDB itself
+# once they expire.
+UPLOAD_SESSION_INDEXES = [
+    IndexModel(
+        [("status", ASCENDING), ("expires_at", ASCENDING)], name="status_expires_at"
+    ),
+    IndexModel(
+        [("expires_at", ASCENDING)],
+        name="finished_expires_at_ttl",
+        expireAfterSeconds=0,
+        partialFilterExpression={
+            "status": {
+                "$in": [
+                    UploadSessionStatus.COMPLETED.value,
+                    UploadSessionStatus.ABORTED.value,
+                ]
+            }
+        },
+    ),
+]
+
+
+def parse_content_range(header: str | None) -> tuple[int, int, int]:
+    """
+    Parse a ``Content-Range: bytes <start>-<end>/<total>`` header.
+
+    Args:
+        header: Raw header value
+
+    Returns:
+        Tuple of (start, end, total), with ``end`` inclusive
+
+    Raises:
+        ValidationError: If the header is missing or malformed
+    """
+    match = CONTENT_RANGE_PATTERN.match(header or "")
+    if not match:
+        raise ValidationError(
+            "Content-Range header must have the form 'bytes <start>-<end>/<total>'",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    start, end, total = (int(value) for value in match.groups())
+    if end < start:
+        raise ValidationError(
+            "Content-Range end must not be before its start",
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+    return start, end, total
+
+
+def missing_ranges(received: list[int], total_chunks: int) -> list[tuple[int, int]]:
+    """
+    Get the runs of chunks that have not been received yet.
+
+    Args:
+        received: Sorted indexes of the received chunks
+        total_chunks: Number of chunks in the upload
+
+    Returns:
+        List of (first, last) index pairs, both inclusive, in order
+    """
+    ranges = []
+    expected = 0
+    for index in received:
+        if index > expected:
+            ranges.append((expected, index - 1))
+        expected = index + 1
+    if expected < total_chunks:
+        ranges.append((expected, total_chunks - 1))
+    return ranges
+
+
+class UploadSessionService:
+    """
+    Resumable uploads of large files as independently sent chunks.
+
+    A session preallocates a part file of the declared size. Chunks of a fixed
+    size arrive as byte ranges, in any order and possibly in parallel. Each
+    chunk is written at its offset and its SHA-256 is recorded on the session.
+    Completing the session copies the part file into a regular document.
+
+    Sessions left unfinished past their expiry are aborted, and their part
+    files removed, by a sweeper task that runs every
+    RESUMABLE_UPLOAD_SWEEP_INTERVAL_SECONDS.
+    """
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection | None = None,
+        document_service: DocumentService | None = None,
+    ):
+        self.settings = settings
+        self.collection = (
+            collection
+            if collection is not None
+            else get_database(self.settings.MONGO_DATABASE)[
+                self.settings.MONGO_UPLOAD_SESSION_COLLECTION
+            ]
+        )
+        self.document_service = document_service or get_document_service()
+        self.session_folder = os.path.join(self.settings.UPLOAD_FOLDER, "sessions")
+        self._sweeper: asyncio.Task | None = None
+
+    @staticmethod
+    def _to_response(session: dict) -> UploadSessionResponse:
+        """Build an UploadSessionResponse from a stored session."""
+        checksums = {int(index): sha for index, sha in session["chunks"].items()}
+        received = sorted(checksums)
+        total_chunks = session["total_chunks"]
+        missing = missing_ranges(received, total_chunks)
+
+        chunk_size = session["chunk_size"]
+        file_size = session["file_size"]
+        contiguous = missing[0][0] if missing else total_chunks
+
+        return UploadSessionResponse(
+            id=session["_id"],
+            filename=session["filename"],
+            file_size=file_size,
+            mime_type=session["mime_type"],
+            chunk_size=chunk_size,
+            total_chunks=total_chunks,
+            status=UploadSessionStatus(session["status"]),
+            offset=min(contiguous * chunk_size, file_size),
+            received_bytes=sum(
+                min(chunk_size, file_size - i * chunk_size) for i in received
+            ),
+            received_chunks=received,
+            missing_chunk_count=total_chunks - len(received),
+            missing_chunk_ranges=missing,
+            chunk_checksums=checksums,
+            document_id=session.get("document_id"),
+            created_at=session["created_at"],
+            expires_at=session["expires_at"],
+        )
+
+    async def _load(self, session_id: str) -> dict:
+        """Get a live session, discarding it if it has expired."""
+        session = await self.collection.find_one({"_id": session_id})
+        if not session:
+            raise NotFoundError("Upload session", session_id)
+
+        expires_at = session["expires_at"]
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if session[
+            "status"
+        ] == UploadSessionStatus.UPLOADING and expires_at <= datetime.now(timezone.utc):
+            await self._discard(session)
+            raise NotFoundError("Upload session", session_id)
+
+        return session
+
+    async def _discard(self, session: dict) -> bool:
+        """
+        Mark an uploading session aborted and remove its part file.
+
+        Args:
+            session: The stored session
+
+        Returns:
+            False if the session had already left the uploading state
+        """
+        result = await self.collection.update_one(
+            {"_id": session["_id"], "status": UploadSessionStatus.UPLOADING.value},
+            {"$set": {"status": UploadSessionStatus.ABORTED.value}},
+        )
+        if not result.modified_count:
+            return False
+        await asyncio.to_thread(remove_if_exists, session["part_path"])
+        return True
+
+    async def _reopen(self, session_id: str) -> None:
+        """Return a session claimed for completion to the uploading state."""
+        await self.collection.update_one(
+            {"_id": session_id, "status": UploadSessionStatus.COMPLETING.value},
+            {"$set": {"status": UploadSessionStatus.UPLOADING.value}},
+        )
+
+    @staticmethod
+    def _require_status(session: dict, expected: UploadSessionStatus) -> None:
+        """Reject operations on a session that is not in the expected state."""
+        if session["status"] != expected:
+            raise ValidationError(
+                f"Upload session {session['_id']} is {session['status']}",
+                status_code=HTTPStatus.CONFLICT,
+            )
+
+    async def create_session(
+        self, request: UploadSessionCreate
+    ) -> UploadSessionResponse:
+        """
+        Start a resumable upload and preallocate its part file.
+
+        Args:
+            request: Name, size and MIME type of the file, and optionally the
+                chunk size the client wants to send
+
+        Returns:
+            The new upload session
+
+        Raises:
+            ValidationError: If the file or chunk size is not allowed
+        """
+        self.document_service.validate_filename(request.filename)
+
+        if request.file_size > self.settings.RESUMABLE_UPLOAD_MAX_SIZE:
+            raise ValidationError(
+                "File exceeds the maximum allowed size of "
+                f"{self.settings.RESUMABLE_UPLOAD_MAX_SIZE} bytes",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        chunk_size = request.chunk_size or self.settings.RESUMABLE_UPLOAD_CHUNK_SIZE
+        min_chunk_size = self.settings.RESUMABLE_UPLOAD_MIN_CHUNK_SIZE
+        max_chunk_size = self.settings.RESUMABLE_UPLOAD_MAX_CHUNK_SIZE
+        if not min_chunk_size <= chunk_size <= max_chunk_size:
+            raise ValidationError(
+                f"Chunk size must be between {min_chunk_size} and "
+                f"{max_chunk_size} bytes"
+            )
+
+        session_id = str(uuid.uuid4())
+        part_path = os.path.join(self.session_folder, f"{session_id}.part")
+        await asyncio.to_thread(os.makedirs, self.session_folder, exist_ok=True)
+        await asyncio.to_thread(preallocate_file, part_path, request.file_size)
+
+        now = datetime.now(timezone.utc)
+        session = {
+            "_id": session_id,
+            "filename": request.filename,
+            "file_size": request.file_size,
+            "mime_type": request.mime_type,
+            "chunk_size": chunk_size,
+            "total_chunks": math.ceil(request.file_size / chunk_size),
+            "part_path": part_path,
+            "status": UploadSessionStatus.UPLOADING.value,
+            "chunks": {},
+            "created_at": now,
+            "expires_at": now
+            + timedelta(seconds=self.settings.RESUMABLE_UPLOAD_SESSION_TTL_SECONDS),
+        }
+
+        try:
+            await self.collection.insert_one(session)
+        except Exception as e:
+            await asyncio.to_thread(remove_if_exists, part_path)
+            raise DataProcessingError(f"Failed to create upload session: {str(e)}")
+
+        return self._to_response(session)
+
+    async def get_session(self, session_id: str) -> UploadSessionResponse:
+        """Get the progress of an upload session."""
+        return self._to_response(await self._load(session_id))
+
+    async def write_chunk(
+        self,
+        session_id: str,
+        content_range: str | None,
+        body: AsyncIterator[bytes],
+        checksum: str | None = None,
+    ) -> UploadSessionResponse:
+        """
+        Write one chunk of an upload at its offset.
+
+        Args:
+            session_id: ID of the upload session
+            content_range: ``Content-Range`` header locating the chunk
+            body: Async iterator producing the chunk content
+            checksum: Optional hex SHA-256 the chunk content must match
+
+        Returns:
+            The session, including the recorded chunk
+
+        Raises:
+            NotFoundError: If the session does not exist or has expired
+            ValidationError: If the range does not cover exactly one chunk, or
+                the content does not match its length or checksum
+        """
+        session = await self._load(session_id)
+        self._require_status(session, UploadSessionStatus.UPLOADING)
+
+        start, end, total = parse_content_range(content_range)
+        chunk_size = session["chunk_size"]
+        file_size = session["file_size"]
+        index, remainder = divmod(start, chunk_size)
+        expected_end = min(start + chunk_size, file_size) - 1
+
+        if total != file_size or remainder or end != expected_end:
+            raise ValidationError(
+                f"Content-Range must cover exactly one {chunk_size}-byte chunk "
+                f"of the {file_size}-byte file",
+                status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            )
+
+        try:
+            written = await write_range(
+                body,
+                session["part_path"],
+                start,
+                end - start + 1,
+                fsync_policy=self.settings.UPLOAD_FSYNC_POLICY,
+            )
+        except FileNotFoundError:
+            # Completed or aborted since it was loaded
+            raise ValidationError(
+                f"Upload session {session_id} is no longer accepting chunks",
+                status_code=HTTPStatus.CONFLICT,
+            )
+
+        if checksum and checksum.lower() != written.sha256:
+            raise ValidationError(
+                f"Checksum mismatch for chunk {index}: received {written.sha256}"
+            )
+
+        # Each chunk sets its own key, so parallel writers never clash. A chunk
+        # that raced a completion is rejected here; its bytes only reached the
+        # part file, never the copy the document was created from.
+        updated = await self.collection.find_one_and_update(
+            {"_id": session_id, "status": UploadSessionStatus.UPLOADING.value},
+            {"$set": {f"chunks.{index}": written.sha256}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not updated:
+            raise ValidationError(
+                f"Upload session {session_id} is no longer accepting chunks",
+                status_code=HTTPStatus.CONFLICT,
+            )
+        return self._to_response(updated)
+
+    async def complete_session(
+        self, session_id: str, sha256: str | None = None
+    ) -> DocumentResponse:
+        """
+        Finish an upload once every chunk has arrived and create its document.
+
+        Args:
+            session_id: ID of the upload session
+            sha256: Optional hex SHA-256 the whole file must match
+
+        Returns:
+            The created document
+
+        Raises:
+            NotFoundError: If the session does not exist or has expired
+            ValidationError: If chunks are missing, the session is not
+                uploading, or the file does not match its checksum
+        """
+        session = await self._load(session_id)
+        self._require_status(session, UploadSessionStatus.UPLOADING)
+
+        missing = self._to_response(session).missing_chunk_count
+        if missing:
+            raise ValidationError(
+                f"Upload session {session_id} is missing {missing} chunk(s)",
+                status_code=HTTPStatus.CONFLICT,
+            )
+
+        # Claim the session so that concurrent completions cannot both succeed.
+        claimed = await self.collection.find_one_and_update(
+            {"_id": session_id, "status": UploadSessionStatus.UPLOADING.value},
+            {"$set": {"status": UploadSessionStatus.COMPLETING.value}},
+        )
+        if not claimed:
+            raise ValidationError(
+                f"Upload session {session_id} is already being completed",
+                status_code=HTTPStatus.CONFLICT,
+            )
+
+        # Chunks that passed _load before the claim may still be writing to
+        # the part file, so it is copied rather than moved into storage: late
+        # writes cannot alter a stored (possibly shared) blob, and the digest
+        # covers exactly the bytes that were stored.
+        staging_path = self.document_service.staging_path()
+        try:
+            written = await asyncio.to_thread(
+                copy_file,
+                session["part_path"],
+                staging_path,
+                self.settings.UPLOAD_CHUNK_SIZE,
+                FsyncPolicy(self.settings.UPLOAD_FSYNC_POLICY) != FsyncPolicy.NEVER,
+            )
+        except Exception as e:
+            await asyncio.to_thread(remove_if_exists, staging_path)
+            await self._reopen(session_id)
+            raise DataProcessingError(f"Failed to complete upload session: {str(e)}")
+
+        if sha256 and sha256.lower() != written.sha256:
+            await asyncio.to_thread(remove_if_exists, staging_path)
+            await self._reopen(session_id)
+            raise ValidationError(
+                f"Checksum mismatch for upload session {session_id}: "
+                f"received {written.sha256}"
+            )
+
+        try:
+            document = await self.document_service.create_document_from_file(
+                written,
+                original_filename=session["filename"],
+                mime_type=session["mime_type"],
+            )
+        except Exception:
+            await self.collection.update_one(
+                {"_id": session_id},
+                {"$set": {"status": UploadSessionStatus.ABORTED.value}},
+            )
+            await asyncio.to_thread(remove_if_exists, session["part_path"])
+            raise
+
+        await asyncio.to_thread(remove_if_exists, session["part_path"])
+
+        await self.collection.update_one(
+            {"_id": session_id},
+            {
+                "$set": {
+                    "status": UploadSessionStatus.COMPLETED.value,
+                    "document_id": document.id,
+                }
+            },
+        )
+        return document
+
+    async def abort_session(self, session_id: str) -> UploadSessionResponse:
+        """Abandon an upload session and remove its part file."""
+        session = await self._load(session_id)
+        self._require_status(session, UploadSessionStatus.UPLOADING)
+        if not await self._discard(session):
+            raise ValidationError(
+                f"Upload session {session_id} is no longer uploading",
+                status_code=HTTPStatus.CONFLICT,
+            )
+        session["status"] = UploadSessionStatus.ABORTED.value
+        return self._to_response(session)
+
+    async def sweep_expired(self) -> int:
+        """
+        Abort every expired session that is still uploading.
+
+        Returns:
+            Number of sessions aborted
+        """
+        expired = self.collection.find(
+            {
+                "status": UploadSessionStatus.UPLOADING.value,
+                "expires_at": {"$lte": datetime.now(timezone.utc)},
+            },
+            {"part_path": 1},
+        )
+        swept = 0
+        async for session in expired:
+            if await self._discard(session):
+                swept += 1
+        return swept
+
+    async def _sweep(self, interval: float) -> None:
+        """Abort expired sessions forever, sleeping between rounds."""
+        while True:
+            try:
+                swept = await self.sweep_expired()
+                if swept:
+                    logger.info(f"Aborted {swept} expired upload session(s)")
+            except Exception as e:
+                logger.error(f"Upload session sweep failed: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+    async def start_sweeper(self, interval: float) -> None:
+        """
+        Start the background task that aborts expired sessions.
+
+        Args:
+            interval: Seconds between sweeps
+        """
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(
+                self._sweep(interval), name="upload-session-sweeper"
+            )
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background sweeper task."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes used to expire sessions, if they are missing."""
+        await self.collection.create_indexes(UPLOAD_SESSION_INDEXES)
+
+
+@lru_cache
+def get_upload_session_service() -> UploadSessionService:
+    """Get the process-wide upload session service."""
+    return UploadSessionService()
@@ -4,4 +4,13 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     """Service-specific settings."""
 
-    pass
+    # Monitoring
+    ENABLE_METRICS: bool = False
+    METRICS_PORT: int = 9092
+    ENABLE_LOOP_MONITOR: bool = False
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_MONITOR_SLOW_SECONDS: float = 0.1
+
+    # On-demand profiling endpoints, mounted only when a token is set
+    ADMIN_API_TOKEN: str = ""
+    PROFILER_MAX_SECONDS: float = 60.0
@@ -6,6 +6,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from api.v1.api_routes import api_router
 from core.config import settings
+from shared.utils.deadline import DeadlineMiddleware
+from shared.utils.loop_monitor import loop_monitor
+from shared.utils.metrics import MetricsMiddleware, MetricsServer
+from shared.utils.profiler import create_profiler_router
 
 logging.basicConfig(
     level=settings.LOG_LEVEL.upper(),
@@ -13,6 +17,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+metrics_server = MetricsServer(port=settings.METRICS_PORT)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,7 +34,16 @@ async def lifespan(app: FastAPI):
         None
     """
     logger.info("Starting up Entity Extraction Service")
+    if settings.ENABLE_METRICS:
+        await metrics_server.start()
+    if settings.ENABLE_LOOP_MONITOR:
+        await loop_monitor.start(
+            interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+            slow_threshold=settings.LOOP_MONITOR_SLOW_SECONDS,
+        )
     yield
+    await loop_monitor.stop()
+    await metrics_server.stop()
     logger.info("Shutting down Entity Extraction Service")
 
 
@@ -48,6 +63,8 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    application.add_middleware(DeadlineMiddleware)
+
     # Add CORS middleware
     application.add_middleware(
         CORSMiddleware,
@@ -57,10 +74,22 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.ENABLE_METRICS:
+        application.add_middleware(MetricsMiddleware)
+
     application.include_router(
         api_router, prefix=settings.API_V1_PREFIX, tags=["entity_extraction"]
     )
 
+    if settings.ADMIN_API_TOKEN:
+        application.include_router(
+            create_profiler_router(
+                settings.ADMIN_API_TOKEN, settings.PROFILER_MAX_SECONDS
+            ),
+            prefix=f"{settings.API_V1_PREFIX}/admin/profile",
+            tags=["Profiling"],
+        )
+
     return application
 
 
@@ -35,6 +35,17 @@ class EntityExtractionSettings(BaseAppSettings):
     BATCH_SIZE: int = 32
     MAX_SEQUENCE_LENGTH: int = 512
 
+    # Monitoring
+    ENABLE_METRICS: bool = False
+    METRICS_PORT: int = 9093
+    ENABLE_LOOP_MONITOR: bool = False
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_MONITOR_SLOW_SECONDS: float = 0.1
+
+    # On-demand profiling endpoints, mounted only when a token is set
+    ADMIN_API_TOKEN: str = ""
+    PROFILER_MAX_SECONDS: float = 60.0
+
     model_config = SettingsConfigDict(
         env_file=BaseAppSettings.get_env_file(Path(__file__).parent.parent),
         env_file_encoding="utf-8",
@@ -1,5 +1,100 @@
-# MongoDB connection module
 """
-Placeholder for MongoDB connection module.
-To be implemented later.
+MongoDB connection module.
+
+Provides a single process-wide asyncio (Motor) client so that every request
+in a service shares one connection pool instead of opening its own. The
+client is created and closed from the service's application lifespan.
 """
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from shared.exceptions.base import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+_client: AsyncIOMotorClient | None = None
+
+
+async def connect_to_mongo(
+    uri: str,
+    *,
+    min_pool_size: int = 0,
+    max_pool_size: int = 100,
+    max_idle_time_ms: int | None = None,
+    server_selection_timeout_ms: int = 30000,
+) -> AsyncIOMotorClient:
+    """
+    Create the process-wide MongoDB client.
+
+    Args:
+        uri: MongoDB connection string
+        min_pool_size: Minimum number of pooled connections per server
+        max_pool_size: Maximum number of pooled connections per server
+        max_idle_time_ms: How long a pooled connection may stay idle before
+            being closed, or None to keep idle connections open
+        server_selection_timeout_ms: How long to wait for a suitable server
+
+    Returns:
+        The shared Motor client
+    """
+    global _client
+
+    if _client is not None:
+        return _client
+
+    _client = AsyncIOMotorClient(
+        uri,
+        minPoolSize=min_pool_size,
+        maxPoolSize=max_pool_size,
+        maxIdleTimeMS=max_idle_time_ms,
+        serverSelectionTimeoutMS=server_selection_timeout_ms,
+    )
+
+    try:
+        await _client.admin.command("ping")
+        logger.info(f"Connected to MongoDB (pool size {min_pool_size}-{max_pool_size})")
+    except Exception as e:
+        # The driver reconnects on demand, so a cold database should not
+        # prevent the service from starting.
+        logger.warning(f"MongoDB is not reachable yet: {e}")
+
+    return _client
+
+
+async def close_mongo_connection() -> None:
+    """Close the process-wide MongoDB client, if one was created."""
+    global _client
+
+    if _client is not None:
+        _client.close()
+        _client = None
+        logger.info("MongoDB connection closed")
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """
+    Get the process-wide MongoDB client.
+
+    Returns:
+        The shared Motor client
+
+    Raises:
+        ConfigurationError: If connect_to_mongo has not been called yet
+    """
+    if _client is None:
+        raise ConfigurationError("MongoDB client has not been initialized")
+    return _client
+
+
+def get_database(name: str) -> AsyncIOMotorDatabase:
+    """
+    Get a database handle from the process-wide MongoDB client.
+
+    Args:
+        name: Name of the database
+
+    Returns:
+        The Motor database handle
+    """
+    return get_mongo_client()[name]
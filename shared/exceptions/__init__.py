@@ -6,7 +6,9 @@ from shared.exceptions.base import (
     AuthorizationError,
     ServiceError,
     ServiceUnavailableError,
+    ServiceOverloadedError,
     ServiceTimeoutError,
+    DeadlineExceededError,
     DataProcessingError,
     ConfigurationError,
 )
@@ -19,7 +21,9 @@ __all__ = [
     "AuthorizationError",
     "ServiceError",
     "ServiceUnavailableError",
+    "ServiceOverloadedError",
     "ServiceTimeoutError",
+    "DeadlineExceededError",
     "DataProcessingError",
     "ConfigurationError",
 ]
@@ -110,6 +110,23 @@ class ServiceUnavailableError(ServiceError):
         super().__init__(message, code or "SERVICE_UNAVAILABLE_ERROR", status_code)
 
 
+class ServiceOverloadedError(ServiceUnavailableError):
+    """Exception raised when a call is shed because a service is at capacity."""
+
+    def __init__(
+        self,
+        service_name: str,
+        retry_after: int = 1,
+        detail: str | None = "Too many requests in flight, retry later",
+        code: str | None = None,
+        status_code: int | HTTPStatus = HTTPStatus.SERVICE_UNAVAILABLE,
+    ):
+        self.retry_after = retry_after
+        super().__init__(
+            service_name, detail, code or "SERVICE_OVERLOADED_ERROR", status_code
+        )
+
+
 class ServiceTimeoutError(ServiceError):
     """Exception raised when a service request times out."""
 
@@ -126,6 +143,18 @@ class ServiceTimeoutError(ServiceError):
         super().__init__(message, code or "SERVICE_TIMEOUT_ERROR", status_code)
 
 
+class DeadlineExceededError(ApplicationError):
+    """Exception raised when a request's end-to-end deadline has passed."""
+
+    def __init__(
+        self,
+        message: str = "Request deadline exceeded",
+        code: str | None = None,
+        status_code: int | HTTPStatus = HTTPStatus.GATEWAY_TIMEOUT,
+    ):
+        super().__init__(message, code or "DEADLINE_EXCEEDED", status_code)
+
+
 class DataProcessingError(ApplicationError):
     """Exception raised when data processing fails."""
 
@@ -160,3 +189,17 @@ class RateLimitExceededError(ApplicationError):
         status_code: int | HTTPStatus = HTTPStatus.TOO_MANY_REQUESTS,
     ):
         super().__init__(message, code or "RATE_LIMIT_EXCEEDED_ERROR", status_code)
+
+
+class NotModifiedError(ApplicationError):
+    """Exception raised when the client's cached representation is still current."""
+
+    def __init__(
+        self,
+        etag: str,
+        message: str = "Not modified",
+        code: str | None = None,
+        status_code: int | HTTPStatus = HTTPStatus.NOT_MODIFIED,
+    ):
+        self.etag = etag
+        super().__init__(message, code or "NOT_MODIFIED", status_code)
@@ -0,0 +1,129 @@
+"""
+Conditional GET support.
+
+Successful GET responses carry an ``ETag`` derived from their data, and a
+request whose ``If-None-Match`` matches it is answered with 304 Not Modified
+and no body. The envelope metadata is excluded from the ETag because its
+timestamp changes on every response.
+
+ConditionalRequestMiddleware makes the incoming ``If-None-Match`` header
+available to request handlers and outgoing service calls through a context
+variable, so it can be checked locally and forwarded downstream.
+"""
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass(frozen=True)
+class ConditionalRequest:
+    """Validators sent with the current request."""
+
+    if_none_match: str | None = None
+
+
+_current_request: ContextVar[ConditionalRequest | None] = ContextVar(
+    "conditional_request", default=None
+)
+
+
+class ConditionalRequestMiddleware:
+    """Expose the conditional headers of GET and HEAD requests to handlers."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in CONDITIONAL_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        token = _current_request.set(
+            ConditionalRequest(if_none_match=headers.get("if-none-match"))
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
+
+
+def is_conditional_request() -> bool:
+    """Whether the current request is one that ETags are computed for."""
+    return _current_request.get() is not None
+
+
+def current_if_none_match() -> str | None:
+    """Get the ``If-None-Match`` header of the current request, if any."""
+    request = _current_request.get()
+    return request.if_none_match if request else None
+
+
+def conditional_headers() -> dict[str, str]:
+    """
+    Get the conditional headers to forward to a downstream service.
+
+    Returns:
+        Dict containing ``If-None-Match`` if the current request sent one
+    """
+    if_none_match = current_if_none_match()
+    return {"If-None-Match": if_none_match} if if_none_match else {}
+
+
+@contextmanager
+def without_validators() -> Iterator[None]:
+    """
+    Stop forwarding the current request's validators to downstream calls.
+
+    Used when a response is composed from several downstream reads: the
+    client's ``If-None-Match`` matches the composite ETag, not theirs. ETags
+    are still computed for the composite response itself.
+    """
+    request = _current_request.get()
+    token = _current_request.set(ConditionalRequest() if request else None)
+    try:
+        yield
+    finally:
+        _current_request.reset(token)
+
+
+def compute_etag(data: bytes) -> str:
+    """
+    Compute a strong ETag for serialized response data.
+
+    Args:
+        data: The serialized ``data`` member of a response
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.blake2b(data, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an ``If-None-Match`` header against an ETag using weak comparison.
+
+    Args:
+        if_none_match: Raw header value, possibly a comma-separated list
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in if_none_match.split(",")
+    )
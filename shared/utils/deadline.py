@@ -0,0 +1,240 @@
+"""
+End-to-end request deadlines.
+
+A request's time budget is set once, at the edge: from the client's
+``X-Request-Timeout-Ms`` header, or else from a default for the route. Every
+service converts the remaining budget it receives into an absolute deadline
+on its own monotonic clock, and forwards what is left of it with each
+downstream call. Budgets are passed as durations rather than timestamps so
+that clock skew between hosts does not matter.
+
+DeadlineMiddleware rejects requests that arrive with no budget left and makes
+the deadline available to handlers and outgoing calls through a context
+variable. Outgoing HTTP calls shrink their timeouts to the remaining budget,
+and work is dropped rather than started once the deadline has passed.
+"""
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http import HTTPStatus
+from typing import Any, Iterator, Mapping
+
+import httpx
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from shared.exceptions.base import DeadlineExceededError
+
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+
+_current_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+class DeadlineMiddleware:
+    """
+    Set the deadline of each HTTP request and refuse requests already past it.
+
+    Args:
+        app: The ASGI application
+        default_timeout: Budget in seconds of requests without the header, or
+            None for no deadline
+        route_timeouts: Default budgets overriding ``default_timeout`` for
+            paths starting with a prefix; the longest matching prefix wins,
+            and None disables the default deadline for the route
+        max_timeout: Optional cap on the budget a client may ask for
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float | None = None,
+        route_timeouts: Mapping[str, float | None] | None = None,
+        max_timeout: float | None = None,
+    ) -> None:
+        self.app = app
+        self.default_timeout = default_timeout
+        self.route_timeouts = sorted(
+            (route_timeouts or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.max_timeout = max_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self._timeout(scope)
+        if timeout is not None and timeout <= 0:
+            await _send_deadline_exceeded(send)
+            return
+
+        token = _current_deadline.set(
+            time.monotonic() + timeout if timeout is not None else None
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_deadline.reset(token)
+
+    def _timeout(self, scope: Scope) -> float | None:
+        """Get the budget of a request in seconds, or None for no deadline."""
+        header = Headers(scope=scope).get(DEADLINE_HEADER)
+        if header is not None:
+            try:
+                timeout = int(header) / 1000
+            except ValueError:
+                # A malformed header falls back to the route's budget
+                pass
+            else:
+                if self.max_timeout is not None:
+                    timeout = min(timeout, self.max_timeout)
+                return timeout
+
+        path = scope["path"]
+        for prefix, route_timeout in self.route_timeouts:
+            if path.startswith(prefix):
+                return route_timeout
+        return self.default_timeout
+
+
+async def _send_deadline_exceeded(send: Send) -> None:
+    """Answer a request that arrived after its deadline without running it."""
+    body = json.dumps(
+        {
+            "detail": {
+                "error": "Request deadline exceeded",
+                "code": "DEADLINE_EXCEEDED",
+            }
+        }
+    ).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": HTTPStatus.GATEWAY_TIMEOUT,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def remaining_time() -> float | None:
+    """
+    Get the time left until the current request's deadline.
+
+    Returns:
+        Seconds remaining, negative once the deadline has passed, or None if
+        the request has no deadline
+    """
+    deadline = _current_deadline.get()
+    return deadline - time.monotonic() if deadline is not None else None
+
+
+def check_deadline() -> None:
+    """
+    Refuse to start work for a request whose deadline has passed.
+
+    Raises:
+        DeadlineExceededError: If the current request's deadline has passed
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError()
+
+
+def bound_timeout(timeout: float | None) -> float | None:
+    """
+    Shrink a timeout so it does not outlast the current request's deadline.
+
+    Args:
+        timeout: The timeout that would otherwise apply, or None for none
+
+    Returns:
+        The smaller of ``timeout`` and the remaining budget
+
+    Raises:
+        DeadlineExceededError: If the current request's deadline has passed
+    """
+    check_deadline()
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def deadline_headers() -> dict[str, str]:
+    """
+    Get the header forwarding the remaining budget to a downstream service.
+
+    Returns:
+        Dict containing the deadline header if the current request has one
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return {}
+    return {DEADLINE_HEADER: str(max(int(remaining * 1000), 0))}
+
+
+@contextmanager
+def deadline_scope(timeout: float | None) -> Iterator[None]:
+    """
+    Run a block of work under its own budget, or with no deadline at all.
+
+    Args:
+        timeout: Budget in seconds, or None to clear the deadline
+    """
+    token = _current_deadline.set(
+        time.monotonic() + timeout if timeout is not None else None
+    )
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+async def propagate_deadline(request: httpx.Request) -> None:
+    """
+    httpx request hook applying the current deadline to an outgoing call.
+
+    The remaining budget is forwarded in the deadline header, and every
+    phase of the call's timeout is capped at it.
+
+    Args:
+        request: The outgoing request
+
+    Raises:
+        DeadlineExceededError: If the current request's deadline has passed
+    """
+    check_deadline()
+    remaining = remaining_time()
+    if remaining is None:
+        return
+    request.headers.update(deadline_headers())
+    timeouts: dict[str, Any] = request.extensions.get("timeout", {})
+    request.extensions["timeout"] = {
+        phase: remaining if value is None else min(value, remaining)
+        for phase, value in timeouts.items()
+    }
+
+
+def task_deadline_options() -> dict[str, Any]:
+    """
+    Get Celery ``apply_async`` options carrying the current deadline.
+
+    A task sent with ``expires`` is discarded by the worker instead of run if
+    it has not started before the deadline.
+
+    Returns:
+        Dict with ``expires`` in seconds if the current request has a deadline
+
+    Raises:
+        DeadlineExceededError: If the current request's deadline has passed
+    """
+    check_deadline()
+    remaining = remaining_time()
+    return {"expires": remaining} if remaining is not None else {}
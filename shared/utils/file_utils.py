@@ -1,5 +1,304 @@
-# File utilities
 """
-Placeholder for file utilities.
-To be implemented later.
+File utilities.
+
+Provides an asynchronous file sink that writes uploaded content to disk in
+large chunks on a worker thread, computing the size and SHA-256 digest in
+the same pass so the event loop is never blocked on disk I/O. Byte ranges
+of a preallocated file can be written the same way, at their offsets.
 """
+import asyncio
+import hashlib
+import os
+from dataclasses import dataclass
+from enum import Enum
+from http import HTTPStatus
+from typing import IO, AsyncIterator, Protocol
+
+from shared.exceptions.base import ValidationError
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class FsyncPolicy(str, Enum):
+    """When written data is flushed to stable storage."""
+
+    NEVER = "never"
+    ON_CLOSE = "on_close"
+    ALWAYS = "always"
+
+
+class AsyncReadable(Protocol):
+    """Anything with an awaitable ``read(size)``, such as FastAPI's UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes:
+        ...
+
+
+@dataclass
+class WrittenFile:
+    """Result of writing a file through an AsyncFileSink."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+class AsyncFileSink:
+    """
+    Write a file chunk by chunk without blocking the event loop.
+
+    Each chunk is written and hashed on a worker thread. If the sink is exited
+    with an exception, the partially written file is removed.
+
+    Example:
+        async with AsyncFileSink(path) as sink:
+            await sink.write(chunk)
+        written = sink.result()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        fsync_policy: FsyncPolicy | str = FsyncPolicy.ON_CLOSE,
+        max_size: int | None = None,
+    ) -> None:
+        self.path = path
+        self.fsync_policy = FsyncPolicy(fsync_policy)
+        self.max_size = max_size
+        self.size = 0
+        self._hasher = hashlib.sha256()
+        self._file: IO[bytes] | None = None
+
+    async def __aenter__(self) -> "AsyncFileSink":
+        self._file = await asyncio.to_thread(open, self.path, "wb")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await asyncio.to_thread(self._close, exc_type is None)
+        if exc_type is not None:
+            await asyncio.to_thread(remove_if_exists, self.path)
+
+    async def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk to the file and the running digest.
+
+        Args:
+            chunk: Bytes to write
+
+        Raises:
+            ValidationError: If the file grows beyond ``max_size``
+        """
+        if not chunk:
+            return
+        if self.max_size is not None and self.size + len(chunk) > self.max_size:
+            raise ValidationError(
+                f"File exceeds the maximum allowed size of {self.max_size} bytes",
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            )
+        await asyncio.to_thread(self._write_chunk, chunk)
+        self.size += len(chunk)
+
+    def result(self) -> WrittenFile:
+        """
+        Get the path, size and digest of the written file.
+
+        Returns:
+            WrittenFile describing what was written
+        """
+        return WrittenFile(
+            path=self.path, size=self.size, sha256=self._hasher.hexdigest()
+        )
+
+    def _write_chunk(self, chunk: bytes) -> None:
+        """Write and hash a chunk. Runs on a worker thread."""
+        assert self._file is not None
+        self._file.write(chunk)
+        self._hasher.update(chunk)
+        if self.fsync_policy is FsyncPolicy.ALWAYS:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _close(self, completed: bool) -> None:
+        """Flush, optionally fsync, and close the file. Runs on a worker thread."""
+        if self._file is None:
+            return
+        try:
+            if completed and self.fsync_policy is not FsyncPolicy.NEVER:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+
+
+async def save_upload(
+    source: AsyncReadable,
+    path: str,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fsync_policy: FsyncPolicy | str = FsyncPolicy.ON_CLOSE,
+    max_size: int | None = None,
+) -> WrittenFile:
+    """
+    Copy an async readable source to a file in large chunks.
+
+    Args:
+        source: Object with an awaitable ``read(size)``, e.g. an UploadFile
+        path: Destination file path
+        chunk_size: Number of bytes to read and write per chunk
+        fsync_policy: When to fsync the written data
+        max_size: Optional maximum file size in bytes
+
+    Returns:
+        WrittenFile with the path, size and SHA-256 digest of the file
+
+    Raises:
+        ValidationError: If the source is larger than ``max_size``
+    """
+    async with AsyncFileSink(
+        path, fsync_policy=fsync_policy, max_size=max_size
+    ) as sink:
+        while chunk := await source.read(chunk_size):
+            await sink.write(chunk)
+    return sink.result()
+
+
+def remove_if_exists(path: str) -> None:
+    """Remove a file, ignoring it if it does not exist."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def preallocate_file(path: str, size: int) -> None:
+    """
+    Create a file of a fixed size, reserving disk space where supported.
+
+    Args:
+        path: File path to create
+        size: Size of the file in bytes
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if size and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        else:
+            os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def hash_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Compute the SHA-256 digest of a file. Blocking; run it on a worker thread.
+
+    Args:
+        path: File path to hash
+        chunk_size: Number of bytes to read per chunk
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def copy_file(
+    source: str,
+    destination: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fsync: bool = True,
+) -> WrittenFile:
+    """
+    Copy a file, hashing its content on the way. Blocking; run it on a worker thread.
+
+    The digest is computed over exactly the bytes written to ``destination``,
+    even if ``source`` is modified while it is copied.
+
+    Args:
+        source: File path to copy
+        destination: File path to create
+        chunk_size: Number of bytes to read per chunk
+        fsync: Whether to flush the copy to stable storage before returning
+
+    Returns:
+        WrittenFile with the path, size and SHA-256 digest of the copy
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        while chunk := src.read(chunk_size):
+            dst.write(chunk)
+            hasher.update(chunk)
+            size += len(chunk)
+        if fsync:
+            dst.flush()
+            os.fsync(dst.fileno())
+    return WrittenFile(path=destination, size=size, sha256=hasher.hexdigest())
+
+
+async def write_range(
+    chunks: AsyncIterator[bytes],
+    path: str,
+    offset: int,
+    length: int,
+    *,
+    fsync_policy: FsyncPolicy | str = FsyncPolicy.ON_CLOSE,
+) -> WrittenFile:
+    """
+    Write a byte range into an existing file at its offset.
+
+    Writes go through ``os.pwrite`` on a worker thread, so several ranges of
+    the same file can be written concurrently.
+
+    Args:
+        chunks: Async iterator producing the range content
+        path: Path of the preallocated file
+        offset: Position of the first byte of the range
+        length: Exact number of bytes the range must contain
+        fsync_policy: When to fsync the written data
+
+    Returns:
+        WrittenFile with the path, size and SHA-256 digest of the range
+
+    Raises:
+        ValidationError: If the content is shorter or longer than ``length``
+    """
+    fsync_policy = FsyncPolicy(fsync_policy)
+    hasher = hashlib.sha256()
+    written = 0
+    fd = await asyncio.to_thread(os.open, path, os.O_WRONLY)
+    try:
+        async for chunk in chunks:
+            if written + len(chunk) > length:
+                raise ValidationError(
+                    f"Range content exceeds the declared length of {length} bytes"
+                )
+            await asyncio.to_thread(_pwrite_all, fd, chunk, offset + written)
+            hasher.update(chunk)
+            written += len(chunk)
+            if fsync_policy is FsyncPolicy.ALWAYS:
+                await asyncio.to_thread(os.fsync, fd)
+        if written != length:
+            raise ValidationError(
+                f"Range content is {written} bytes, expected {length} bytes"
+            )
+        if fsync_policy is FsyncPolicy.ON_CLOSE:
+            await asyncio.to_thread(os.fsync, fd)
+    finally:
+        await asyncio.to_thread(os.close, fd)
+    return WrittenFile(path=path, size=written, sha256=hasher.hexdigest())
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    """Write all of ``data`` at ``offset``. Runs on a worker thread."""
+    view = memoryview(data)
+    while view:
+        count = os.pwrite(fd, view, offset)
+        view = view[count:]
+        offset += count
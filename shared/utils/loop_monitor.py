@@ -0,0 +1,203 @@
+"""
+Event loop lag and blocking call detection.
+
+A synchronous call inside a coroutine, such as a pymongo query, a bcrypt
+hash or a psutil probe, holds up every other request on the worker for as
+long as it runs. LoopMonitor makes such stalls visible:
+
+- A probe task sleeps for a fixed interval and measures how late it wakes
+  up. The delay is the loop's lag; it is recorded in a histogram and its
+  recent percentiles are exported as gauges.
+- A watchdog thread checks that the probe keeps waking up. When the loop
+  has been stuck for longer than the slow threshold, the watchdog takes a
+  snapshot of the loop thread's stack, which shows the call that is
+  blocking it, and logs it with the stall.
+
+The monitor is opt-in: each service starts it from its ``lifespan`` when
+ENABLE_LOOP_MONITOR is set. The probe and the watchdog cost one timer
+wake-up per interval.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any
+
+from shared.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Percentiles of recent lag exported as gauges
+LAG_QUANTILES = (0.5, 0.9, 0.99)
+
+event_loop_lag_seconds = registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay between when the event loop should have woken a timer and when it did",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+event_loop_lag_quantile_seconds = registry.gauge(
+    "event_loop_lag_quantile_seconds",
+    "Percentiles of event loop lag over the recent window",
+    ("quantile",),
+)
+event_loop_stalls_total = registry.counter(
+    "event_loop_stalls_total",
+    "Times the event loop was blocked for longer than the slow threshold",
+)
+
+
+class LoopMonitor:
+    """
+    Measure event loop lag and report calls that block the loop.
+
+    Args:
+        window: Number of recent lag samples percentiles are computed over
+        max_reports: Number of recent stall reports kept for ``stats``
+    """
+
+    def __init__(self, window: int = 600, max_reports: int = 20) -> None:
+        self.interval = 0.1
+        self.slow_threshold = 0.1
+        self._samples: deque[float] = deque(maxlen=window)
+        self._reports: deque[dict[str, Any]] = deque(maxlen=max_reports)
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: int | None = None
+        self._last_tick = time.monotonic()
+        self._reported_tick: float | None = None
+        self.stalls = 0
+        registry.add_collector(self._collect)
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor has been started and not stopped."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self, interval: float, slow_threshold: float) -> None:
+        """
+        Start the probe task and the watchdog thread.
+
+        Args:
+            interval: Seconds between lag probes
+            slow_threshold: Seconds the loop may be blocked before the stall
+                is reported with a stack snapshot
+        """
+        if self.running:
+            return
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._probe(), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            f"Event loop monitor started: probing every {interval}s, "
+            f"reporting stalls over {slow_threshold}s"
+        )
+
+    async def stop(self) -> None:
+        """Stop the probe task and the watchdog thread."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _probe(self) -> None:
+        """Measure how late the loop wakes a timer, forever."""
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - expected, 0.0)
+            self._last_tick = now
+            self._samples.append(lag)
+            event_loop_lag_seconds.observe(lag)
+
+    def _watch(self) -> None:
+        """Snapshot the loop thread's stack whenever the loop is stuck."""
+        check_interval = max(self.slow_threshold / 2, 0.01)
+        while not self._stopped.wait(check_interval):
+            last_tick = self._last_tick
+            blocked = time.monotonic() - last_tick - self.interval
+            if blocked > self.slow_threshold and self._reported_tick != last_tick:
+                # Report each stall once, however long it lasts
+                self._reported_tick = last_tick
+                self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        """Log a stall together with what the loop thread is running."""
+        thread_id = self._loop_thread_id
+        frame = sys._current_frames().get(thread_id) if thread_id is not None else None
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        self.stalls += 1
+        event_loop_stalls_total.inc()
+        self._reports.append(
+            {
+                "detected_at": time.time(),
+                "blocked_ms": round(blocked * 1000, 2),
+                "stack": stack,
+            }
+        )
+        logger.warning(
+            f"Event loop blocked for at least {blocked * 1000:.0f} ms in:\n{stack}"
+        )
+
+    def percentiles(self) -> dict[str, float]:
+        """
+        Get percentiles of recent lag.
+
+        Returns:
+            Dict mapping each quantile in LAG_QUANTILES, and ``max``, to the lag
+            in seconds
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+        result = {
+            str(quantile): samples[min(int(quantile * len(samples)), len(samples) - 1)]
+            for quantile in LAG_QUANTILES
+        }
+        result["max"] = samples[-1]
+        return result
+
+    def _collect(self) -> None:
+        """Copy recent lag percentiles into their gauges."""
+        for quantile, lag in self.percentiles().items():
+            if quantile != "max":
+                event_loop_lag_quantile_seconds.set(lag, quantile=quantile)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get recent lag and stall reports.
+
+        Returns:
+            Dict with whether the monitor runs, lag percentiles in
+            milliseconds, the stall count and the most recent stall reports
+        """
+        return {
+            "running": self.running,
+            "lag_ms": {
+                quantile: round(lag * 1000, 2)
+                for quantile, lag in self.percentiles().items()
+            },
+            "stalls": self.stalls,
+            "recent_stalls": list(self._reports),
+        }
+
+
+loop_monitor = LoopMonitor()
@@ -0,0 +1,388 @@
+"""
+Prometheus-compatible metrics for the InsightDocs services.
+
+Counters, gauges and histograms are kept in plain dicts keyed by label values
+and rendered in the Prometheus text exposition format on demand, so
+recording a sample costs a dict lookup and an addition. Metrics are updated
+from the event loop only and need no locking.
+
+Each service installs MetricsMiddleware in its ``create_application`` to
+record request counts, latencies and in-flight requests per route, method
+and status, and starts a MetricsServer from its ``lifespan`` to serve
+``/metrics`` on METRICS_PORT, away from the public API. Values are per
+process: with several workers only the first to bind the port serves it.
+"""
+import asyncio
+import bisect
+import logging
+import math
+import time
+from typing import Callable, Iterable, TypeVar, cast
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from fast cache hits to slow document work
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+M = TypeVar("M", bound="_Metric")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route label of requests that matched no route, so that scanners probing
+# random paths cannot create a label per path
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Format label names and values as ``{name="value",...}``."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the exposition format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    """A named metric with a fixed set of labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Get the label values of a sample in label name order."""
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _samples(self) -> Iterable[str]:
+        """Render the samples of the metric."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric in the exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the count of a label set."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def values(self) -> dict[tuple[str, ...], float]:
+        """Get the count of every label set."""
+        return dict(self._values)
+
+    def _samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the value of a label set."""
+        self._values[self._key(labels)] = float(value)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the value of a label set."""
+        self.inc(-amount, **labels)
+
+    def clear(self) -> None:
+        """Drop every label set, before refilling the gauge from a snapshot."""
+        self._values.clear()
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: a count per bucket plus one for +Inf, then the sum
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for a label set."""
+        key = self._key(labels)
+        series = self._values.get(key)
+        if series is None:
+            series = self._values[key] = [0.0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def _samples(self) -> Iterable[str]:
+        names = (*self.label_names, "le")
+        for key, series in self._values.items():
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, math.inf), series):
+                cumulative += count
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {_format_value(cumulative)}"
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {_format_value(series[-1])}"
+            yield f"{self.name}_count{labels} {_format_value(cumulative)}"
+
+
+class MetricsRegistry:
+    """The metrics of a process, and callbacks that refresh them on scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def _register(self, metric: M) -> M:
+        """Register a metric, or return the one already registered by its name."""
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric {metric.name} is already registered")
+            return cast(M, existing)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Iterable[str] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Register a callback that refreshes gauges just before each scrape.
+
+        Args:
+            collector: Callback that sets gauges from a snapshot of state
+                kept elsewhere, such as connection pool occupancy
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text
+        """
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.error(f"Metrics collector failed: {e}", exc_info=True)
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests handled, by route, method and status",
+    ("route", "method", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Time to handle HTTP requests, by route, method and status",
+    ("route", "method", "status"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled, by method",
+    ("method",),
+)
+
+
+def request_totals() -> tuple[int, int]:
+    """
+    Get the number of requests handled and how many of them failed.
+
+    Returns:
+        Tuple of the request count and the count of 5xx responses
+    """
+    total = errors = 0.0
+    for (_, _, status), count in http_requests_total.values().items():
+        total += count
+        if status.startswith("5"):
+            errors += count
+    return int(total), int(errors)
+
+
+class MetricsMiddleware:
+    """
+    Record the count, latency and concurrency of HTTP requests.
+
+    Requests are labelled with the path template of the route that handled
+    them, such as ``/api/v1/documents/{document_id}``, rather than the raw
+    path, so the number of series stays bounded.
+
+    Args:
+        app: The ASGI application
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            http_requests_in_flight.dec(method=method)
+            # The router records the matched route in the request scope
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            labels = {"route": route, "method": method, "status": str(status_code)}
+            http_requests_total.inc(**labels)
+            http_request_duration_seconds.observe(duration, **labels)
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing ``/metrics`` on a dedicated port.
+
+    Args:
+        port: Port to listen on
+        host: Interface to listen on
+        metrics: Registry to expose
+    """
+
+    def __init__(
+        self, port: int, host: str = "0.0.0.0", metrics: MetricsRegistry = registry
+    ) -> None:
+        self.port = port
+        self.host = host
+        self.metrics = metrics
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        """Start listening, or log a warning if the port is taken."""
+        try:
+            self._server = await asyncio.start_server(
+                self._handle, self.host, self.port
+            )
+        except OSError as e:
+            logger.warning(f"Metrics not served on port {self.port}: {e}")
+            return
+        logger.info(f"Serving metrics on {self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer one request and close the connection."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), 5.0)
+            while (await asyncio.wait_for(reader.readline(), 5.0)) not in (
+                b"\r\n",
+                b"\n",
+                b"",
+            ):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+            if len(parts) > 1 and parts[0] == "GET" and path == "/metrics":
+                status, content_type = "200 OK", CONTENT_TYPE
+                body = self.metrics.render().encode()
+            else:
+                status, content_type = "404 Not Found", "text/plain; charset=utf-8"
+                body = b"Not Found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
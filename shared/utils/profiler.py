@@ -0,0 +1,296 @@
+"""
+On-demand profiling of a running service.
+
+Two profiles can be taken from a live worker without restarting it:
+
+- CPU: a statistical sampler that records the stack of every thread (or of
+  the event loop thread only) at a fixed interval for a number of seconds.
+  Stacks are returned collapsed, one ``frame;frame;frame count`` line per
+  distinct stack, ready for flamegraph.pl or speedscope, or as JSON. The
+  sampler runs on its own thread, so the worker keeps serving while it is
+  profiled; its cost is one stack walk per thread per interval.
+- Memory: tracemalloc snapshots taken at the start and end of a window, and
+  the source lines whose allocations grew the most in between. Tracing is
+  only enabled for the duration of the window.
+
+Only one profile runs at a time per process. The endpoints are mounted by
+each service's ``create_application`` under ``/admin/profile`` when
+ADMIN_API_TOKEN is set, and require that token in the ``X-Admin-Token``
+header.
+"""
+import asyncio
+import secrets
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from http import HTTPStatus
+from pathlib import Path
+from types import FrameType
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from shared.exceptions.base import ApplicationError
+from shared.utils.request_handler import process_async_request
+from shared.utils.serialization import ORJSONResponse
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+# Frames kept per allocation traceback while tracing memory
+TRACEMALLOC_FRAMES = 10
+
+_profile_lock = asyncio.Lock()
+
+
+class ProfileInProgressError(ApplicationError):
+    """Raised when a profile is requested while another one is running."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Another profile is already running in this process",
+            "PROFILE_IN_PROGRESS",
+            HTTPStatus.CONFLICT,
+        )
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Get the collapsed-stack label of a frame."""
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name})".replace(";", ":")
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Collapse a stack into ``root;...;leaf`` form."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _sample(
+    seconds: float, interval: float, thread_id: int | None
+) -> tuple[Counter[str], int]:
+    """
+    Sample thread stacks on the calling thread.
+
+    Args:
+        seconds: How long to sample for
+        interval: Seconds between samples
+        thread_id: Only sample this thread, or None for all threads
+
+    Returns:
+        Tuple of the count of every collapsed stack and the number of samples
+    """
+    own_id = threading.get_ident()
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    stacks: Counter[str] = Counter()
+    samples = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == own_id or (thread_id is not None and ident != thread_id):
+                continue
+            thread_name = names.get(ident) or str(ident)
+            stacks[f"{thread_name};{_collapse(frame)}"] += 1
+        samples += 1
+        time.sleep(interval)
+    return stacks, samples
+
+
+async def sample_cpu(
+    seconds: float, interval: float, loop_only: bool = False
+) -> dict[str, Any]:
+    """
+    Sample the stacks of the process's threads for a number of seconds.
+
+    Args:
+        seconds: How long to sample for
+        interval: Seconds between samples
+        loop_only: Only sample the thread running the event loop
+
+    Returns:
+        Dict with the sampling parameters, the number of samples and the
+        count of every collapsed stack, most frequent first
+
+    Raises:
+        ProfileInProgressError: If another profile is running
+    """
+    if _profile_lock.locked():
+        raise ProfileInProgressError()
+    async with _profile_lock:
+        thread_id = threading.get_ident() if loop_only else None
+        stacks, samples = await asyncio.to_thread(_sample, seconds, interval, thread_id)
+    return {
+        "seconds": seconds,
+        "interval": interval,
+        "samples": samples,
+        "stacks": dict(stacks.most_common()),
+    }
+
+
+def collapsed_stacks(profile: dict[str, Any]) -> str:
+    """
+    Render a CPU profile in the collapsed stack format.
+
+    Args:
+        profile: Profile returned by ``sample_cpu``
+
+    Returns:
+        One ``frame;frame;frame count`` line per distinct stack
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in profile["stacks"].items())
+
+
+async def trace_memory(seconds: float, top: int) -> dict[str, Any]:
+    """
+    Find the source lines whose allocations grew most over a window.
+
+    Args:
+        seconds: Length of the window
+        top: Number of source lines to report
+
+    Returns:
+        Dict with the window length, the traced memory at its end and the
+        lines with the largest growth in allocated size
+
+    Raises:
+        ProfileInProgressError: If another profile is running
+    """
+    if _profile_lock.locked():
+        raise ProfileInProgressError()
+    async with _profile_lock:
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        try:
+            before = tracemalloc.take_snapshot()
+            await asyncio.sleep(seconds)
+            after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            if started_here:
+                tracemalloc.stop()
+
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    differences = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "lineno"
+    )
+    return {
+        "seconds": seconds,
+        "traced_bytes": current,
+        "peak_traced_bytes": peak,
+        "top": [
+            {
+                "location": str(difference.traceback[0]),
+                "size_diff": difference.size_diff,
+                "size": difference.size,
+                "count_diff": difference.count_diff,
+                "count": difference.count,
+            }
+            for difference in differences[:top]
+        ],
+    }
+
+
+def create_profiler_router(admin_token: str, max_seconds: float) -> APIRouter:
+    """
+    Create the profiling endpoints of a service.
+
+    Args:
+        admin_token: Token callers must send in the ``X-Admin-Token`` header
+        max_seconds: Longest profile a caller may ask for
+
+    Returns:
+        Router with ``GET /cpu`` and ``GET /memory``
+    """
+
+    async def require_admin(
+        x_admin_token: str | None = Header(None, alias=ADMIN_TOKEN_HEADER)
+    ) -> None:
+        if x_admin_token is None or not secrets.compare_digest(
+            x_admin_token.encode(), admin_token.encode()
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={"error": "Invalid admin token", "code": "AUTHENTICATION_ERROR"},
+            )
+
+    router = APIRouter(dependencies=[Depends(require_admin)])
+
+    @router.get(
+        "/cpu",
+        summary="Sample CPU stacks",
+        status_code=status.HTTP_200_OK,
+        response_description="Collapsed stacks or JSON profile",
+    )
+    async def profile_cpu(
+        seconds: float = Query(10.0, gt=0, le=max_seconds),
+        interval: float = Query(0.01, ge=0.001, le=1.0),
+        threads: Literal["all", "loop"] = Query("all"),
+        format: Literal["collapsed", "json"] = Query("collapsed"),
+    ):
+        """
+        Sample the stacks of this worker's threads for a number of seconds.
+
+        Args:
+            seconds: How long to sample for
+            interval: Seconds between samples
+            threads: Sample every thread, or only the event loop thread
+            format: Collapsed stacks as text, or the profile as JSON
+
+        Returns:
+            The profile
+        """
+
+        async def request_handler():
+            return await sample_cpu(seconds, interval, loop_only=threads == "loop")
+
+        if format == "json":
+            return await process_async_request(
+                request_handler=request_handler,
+                error_message="CPU profile failed",
+            )
+
+        try:
+            profile = await request_handler()
+        except ApplicationError as ex:
+            return ORJSONResponse(
+                status_code=ex.status_code,
+                content={"detail": {"error": ex.message, "code": ex.code}},
+            )
+        return PlainTextResponse(collapsed_stacks(profile))
+
+    @router.get(
+        "/memory",
+        summary="Trace allocation growth",
+        status_code=status.HTTP_200_OK,
+        response_description="Source lines with the largest allocation growth",
+    )
+    async def profile_memory(
+        seconds: float = Query(10.0, gt=0, le=max_seconds),
+        top: int = Query(25, ge=1, le=500),
+    ):
+        """
+        Trace allocations for a number of seconds and report the largest growth.
+
+        Args:
+            seconds: Length of the tracing window
+            top: Number of source lines to report
+
+        Returns:
+            The source lines whose allocations grew most
+        """
+
+        async def request_handler():
+            return await trace_memory(seconds, top)
+
+        return await process_async_request(
+            request_handler=request_handler,
+            error_message="Memory profile failed",
+        )
+
+    return router
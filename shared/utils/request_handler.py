@@ -1,11 +1,27 @@
 import logging
-from datetime import datetime, timezone
 from typing import Any, Callable
 
-from fastapi import status
+from fastapi import Response, status
 from fastapi.responses import JSONResponse, RedirectResponse
 
-from shared.exceptions.base import ApplicationError
+from shared.exceptions.base import (
+    ApplicationError,
+    NotModifiedError,
+    ServiceOverloadedError,
+)
+from shared.utils.conditional import (
+    compute_etag,
+    current_if_none_match,
+    etag_matches,
+    is_conditional_request,
+)
+from shared.utils.deadline import check_deadline
+from shared.utils.serialization import (
+    ORJSONResponse,
+    dumps,
+    serialize_data,
+    wrap_envelope,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +31,15 @@ async def process_async_request(
     success_status_code: int = status.HTTP_200_OK,
     error_message: str = "Resource not found",
     request_id: str | None = None,
-) -> JSONResponse | RedirectResponse:
+) -> JSONResponse | RedirectResponse | Response:
     """
     Process an asynchronous API request with standardized error handling.
 
+    Successful responses to GET requests carry an ETag computed from their
+    data, and are answered with 304 Not Modified when it matches the
+    request's ``If-None-Match`` header. A request whose end-to-end deadline
+    has already passed is answered with 504 without running the handler.
+
     Args:
         request_handler: Async function containing the business logic to execute
         success_status_code: HTTP status code to return on successful execution
@@ -26,96 +47,99 @@ async def process_async_request(
         request_id: Optional identifier for tracing this request in logs
 
     Returns:
-        JSONResponse with appropriate status code and formatted content
+        JSONResponse with appropriate status code and formatted content, encoded
+        in a single pass, or an empty 304 response
     """
     log_prefix = f"[Request: {request_id}] " if request_id else ""
 
     try:
+        check_deadline()
         response = await request_handler()
 
         if isinstance(response, RedirectResponse):
             return response
 
         if response is None:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": {"error": error_message}},
             )
 
-        formatted_response = _format_response(response)
-        return JSONResponse(status_code=success_status_code, content=formatted_response)
+        data, etag_source = _serialize(response)
+        headers = None
+        if is_conditional_request():
+            etag = compute_etag(etag_source)
+            if etag_matches(current_if_none_match(), etag):
+                return _not_modified(etag)
+            headers = {"ETag": etag}
+
+        return ORJSONResponse(
+            status_code=success_status_code,
+            content=wrap_envelope(data),
+            headers=headers,
+        )
 
+    except NotModifiedError as ex:
+        return _not_modified(ex.etag)
+    except ServiceOverloadedError as ex:
+        logger.warning(f"{log_prefix}Load shed: {str(ex)}")
+        return ORJSONResponse(
+            status_code=ex.status_code,
+            content={"detail": {"error": ex.message, "code": ex.code}},
+            headers={"Retry-After": str(ex.retry_after)},
+        )
     except ApplicationError as ex:
         logger.error(f"{log_prefix}Application error: {str(ex)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=ex.status_code,
             content={"detail": {"error": ex.message, "code": ex.code}},
         )
     except TypeError as ex:
         # Handle type errors (often due to None values or wrong types)
         logger.error(f"{log_prefix}Type error: {str(ex)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": {"error": error_message, "message": str(ex)}},
         )
     except SyntaxError as ex:
         # Handle syntax errors (often from parsing operations)
         logger.error(f"{log_prefix}Syntax error in persistence layer: {str(ex)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"detail": {"error": "Invalid format", "message": str(ex)}},
         )
     except ValueError as ex:
         # Handle value errors (invalid parameters)
         logger.error(f"{log_prefix}Value error: {str(ex)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"detail": {"error": "Invalid value", "message": str(ex)}},
         )
 
 
-def _format_response(response: Any, include_metadata: bool = True) -> dict[str, Any]:
+def _serialize(response: Any) -> tuple[bytes, bytes]:
     """
-    Format API responses in a consistent structure.
+    Encode response data and select the bytes its ETag is derived from.
+
+    A response relayed from another service is itself an envelope; its own
+    metadata is left out of the ETag so that unchanged data keeps its ETag.
 
     Args:
-        response: The data to format (can be a Pydantic model, dict, list, or primitive)
-        include_metadata: Whether to include metadata in the response
+        response: The data returned by the request handler
 
     Returns:
-        A formatted response dictionary
+        Tuple of (encoded data, bytes to compute the ETag from)
     """
-    formatted_response: dict = {}
-
-    if response is None:
-        formatted_response["data"] = None
-    elif hasattr(response, "model_dump"):
-        formatted_response["data"] = response.model_dump()
-    elif hasattr(response, "dict"):
-        formatted_response["data"] = response.dict()
-    elif isinstance(response, dict):
-        formatted_response["data"] = response
-    elif isinstance(response, list):
-        # If list contains Pydantic models, convert them
-        if response and hasattr(response[0], "model_dump"):
-            formatted_response["data"] = [item.model_dump() for item in response]
-        elif response and hasattr(response[0], "dict"):
-            formatted_response["data"] = [item.dict() for item in response]
-        else:
-            formatted_response["data"] = response
-    elif isinstance(response, (str, int, float, bool)):
-        formatted_response["data"] = {"value": response}
-    else:
-        # For any other types, try to convert to dict or use str representation
-        try:
-            formatted_response["data"] = dict(response)
-        except (TypeError, ValueError):
-            formatted_response["data"] = {"value": str(response)}
-
-    if include_metadata:
-        formatted_response["metadata"] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "version": "1.0",
-        }
-
-    return formatted_response
+    if isinstance(response, dict) and response.keys() == {"data", "metadata"}:
+        inner = dumps(response["data"])
+        return (
+            b'{"data":' + inner + b',"metadata":' + dumps(response["metadata"]) + b"}",
+            inner,
+        )
+    data = serialize_data(response)
+    return data, data
+
+
+def _not_modified(etag: str) -> Response:
+    """Build an empty 304 response for an unchanged representation."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
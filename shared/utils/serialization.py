@@ -0,0 +1,157 @@
+"""
+Fast JSON serialization for API responses.
+
+Pydantic models are serialized straight to JSON bytes by pydantic-core,
+without first being dumped to Python dicts, and everything else is encoded
+with orjson. The standard response envelope is assembled from pre-encoded
+byte fragments, so each response body is encoded exactly once.
+"""
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import GenericAlias
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+RESPONSE_VERSION = "1.0"
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a value as JSON with orjson.
+
+    Types orjson does not know natively, such as Pydantic models, fall back
+    to pydantic-core's JSON-compatible conversion.
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(value, default=to_jsonable_python, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson. Pre-encoded bytes are sent as they are."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@lru_cache(maxsize=512)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    """Get a cached TypeAdapter, since building one compiles a serializer."""
+    return TypeAdapter(annotation)
+
+
+def serialize_data(data: Any) -> bytes:
+    """
+    Encode response data as JSON.
+
+    Args:
+        data: The data to encode (can be a Pydantic model, dict, list, or primitive)
+
+    Returns:
+        UTF-8 encoded JSON for the ``data`` member of the response envelope
+    """
+    if data is None:
+        return b"null"
+    if isinstance(data, BaseModel):
+        return _type_adapter(type(data)).dump_json(data)
+    if isinstance(data, list):
+        if data and isinstance(data[0], BaseModel):
+            item_type = type(data[0])
+            if all(type(item) is item_type for item in data):
+                # Built at runtime, since item_type is a value, not a static type
+                return _type_adapter(GenericAlias(list, (item_type,))).dump_json(data)
+        return dumps(data)
+    if isinstance(data, dict):
+        return dumps(data)
+    if isinstance(data, (str, int, float, bool)):
+        return dumps({"value": data})
+    if hasattr(data, "dict"):
+        return dumps(data.dict())
+    # For any other types, try to convert to dict or use str representation
+    try:
+        return dumps(dict(data))
+    except (TypeError, ValueError):
+        return dumps({"value": str(data)})
+
+
+class _MetadataCache:
+    """
+    Encoded envelope metadata, rebuilt at most once per second.
+
+    The timestamp therefore has one-second resolution, which is all clients
+    use it for, and the metadata is not re-encoded on every response.
+    """
+
+    def __init__(self) -> None:
+        self._second = -1
+        self._encoded = b""
+
+    def get(self) -> bytes:
+        second = int(time.time())
+        if second != self._second:
+            timestamp = datetime.fromtimestamp(second, timezone.utc).isoformat()
+            self._encoded = dumps({"timestamp": timestamp, "version": RESPONSE_VERSION})
+            self._second = second
+        return self._encoded
+
+
+_metadata = _MetadataCache()
+
+
+def render_envelope(data: Any, include_metadata: bool = True) -> bytes:
+    """
+    Encode data in the standard ``{"data": ..., "metadata": ...}`` envelope.
+
+    Args:
+        data: The data to encode
+        include_metadata: Whether to include metadata in the response
+
+    Returns:
+        UTF-8 encoded JSON response body
+    """
+    return wrap_envelope(serialize_data(data), include_metadata)
+
+
+def unwrap_envelope(response: Any) -> Any:
+    """
+    Get the data member of a response relayed from another service.
+
+    Args:
+        response: Decoded downstream response body
+
+    Returns:
+        The ``data`` member if the response is an envelope, else the response
+    """
+    if isinstance(response, dict) and response.keys() == {"data", "metadata"}:
+        return response["data"]
+    return response
+
+
+def wrap_envelope(data: bytes, include_metadata: bool = True) -> bytes:
+    """
+    Wrap already encoded data in the standard response envelope.
+
+    Args:
+        data: Encoded JSON for the ``data`` member
+        include_metadata: Whether to include metadata in the response
+
+    Returns:
+        UTF-8 encoded JSON response body
+    """
+    body = b'{"data":' + data
+    if include_metadata:
+        body += b',"metadata":' + _metadata.get()
+    return body + b"}"
@@ -1,13 +1,16 @@
 import logging
 from contextlib import asynccontextmanager
 
-# Initialize Celery
-from celery import Celery
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.v1.api_routes import api_router
+from core.celery_app import celery_app  # noqa: F401
 from core.config import settings
+from shared.utils.deadline import DeadlineMiddleware
+from shared.utils.loop_monitor import loop_monitor
+from shared.utils.metrics import MetricsMiddleware, MetricsServer
+from shared.utils.profiler import create_profiler_router
 
 logging.basicConfig(
     level=settings.LOG_LEVEL.upper(),
@@ -15,6 +18,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+metrics_server = MetricsServer(port=settings.METRICS_PORT)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,7 +35,16 @@ async def lifespan(app: FastAPI):
         None
     """
     logger.info("Starting up Task Orchestration Service")
+    if settings.ENABLE_METRICS:
+        await metrics_server.start()
+    if settings.ENABLE_LOOP_MONITOR:
+        await loop_monitor.start(
+            interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+            slow_threshold=settings.LOOP_MONITOR_SLOW_SECONDS,
+        )
     yield
+    await loop_monitor.stop()
+    await metrics_server.stop()
     logger.info("Shutting down Task Orchestration Service")
 
 
@@ -50,6 +64,8 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    application.add_middleware(DeadlineMiddleware)
+
     application.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -58,30 +74,30 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if settings.ENABLE_METRICS:
+        application.add_middleware(MetricsMiddleware)
+
     application.include_router(
         api_router,
         prefix=settings.API_V1_PREFIX,
         tags=["task_orchestration"],
     )
 
+    if settings.ADMIN_API_TOKEN:
+        application.include_router(
+            create_profiler_router(
+                settings.ADMIN_API_TOKEN, settings.PROFILER_MAX_SECONDS
+            ),
+            prefix=f"{settings.API_V1_PREFIX}/admin/profile",
+            tags=["Profiling"],
+        )
+
     return application
 
 
 app = create_application()
 
 
-celery_app = Celery(
-    "task_orchestration",
-    broker="amqp://rabbitmq:5672",
-    backend="redis://redis:6379/0",
-)
-
-
-celery_app.conf.task_routes = {
-    "tasks.document_processing.*": {"queue": "document_processing"},
-    "tasks.entity_extraction.*": {"queue": "entity_extraction"},
-}
-
 app.include_router(api_router, prefix="/api/v1")
 
 
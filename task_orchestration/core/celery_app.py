@@ -0,0 +1,16 @@
+"""
+Celery application used to dispatch pipeline tasks to the workers.
+"""
+from celery import Celery
+
+celery_app = Celery(
+    "task_orchestration",
+    broker="amqp://rabbitmq:5672",
+    backend="redis://redis:6379/0",
+)
+
+
+celery_app.conf.task_routes = {
+    "tasks.document_processing.*": {"queue": "document_processing"},
+    "tasks.entity_extraction.*": {"queue": "entity_extraction"},
+}
@@ -0,0 +1,51 @@
+"""
+Dispatch of pipeline tasks to the Celery workers.
+
+The orchestration service does not send any tasks yet: its workflow
+endpoints are still to be written. They are meant to send every task
+through ``dispatch_task``, so that queued work inherits the deadline of the
+request that created it.
+"""
+import logging
+from typing import Any
+
+from celery.result import AsyncResult
+
+from core.celery_app import celery_app
+from shared.utils.deadline import task_deadline_options
+
+logger = logging.getLogger(__name__)
+
+
+def dispatch_task(
+    name: str,
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
+    **options: Any,
+) -> AsyncResult:
+    """
+    Send a pipeline task to its queue within the current request's deadline.
+
+    The task expires at the request deadline, so a worker that only picks it
+    up after the client has given up discards it instead of running it.
+
+    Args:
+        name: Registered name of the task
+        args: Positional arguments of the task
+        kwargs: Keyword arguments of the task
+        **options: Further ``apply_async`` options
+
+    Returns:
+        The AsyncResult of the sent task
+
+    Raises:
+        DeadlineExceededError: If the request's deadline has already passed
+    """
+    deadline_options = task_deadline_options()
+    if "expires" in deadline_options and "expires" in options:
+        deadline_options["expires"] = min(
+            deadline_options["expires"], options.pop("expires")
+        )
+    return celery_app.send_task(
+        name, args=args, kwargs=kwargs or {}, **options, **deadline_options
+    )
@@ -3,6 +3,7 @@ import logging
 import httpx
 
 from core.config import settings
+from shared.utils.deadline import propagate_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +11,9 @@ logger = logging.getLogger(__name__)
 async def upload_document(file_content, filename, content_type, metadata=None):
     """Upload a document to the document ingestion service."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(
+            event_hooks={"request": [propagate_deadline]}
+        ) as client:
             files = {"file": (filename, file_content, content_type)}
             form_data = {}
             if metadata:
@@ -30,7 +33,9 @@ async def upload_document(file_content, filename, content_type, metadata=None):
 async def create_workflow(document_id):
     """Create a document processing workflow."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(
+            event_hooks={"request": [propagate_deadline]}
+        ) as client:
             response = await client.post(
                 f"{settings.TASK_ORCHESTRATION_SERVICE_URL}/api/v1/workflows/",
                 json={"document_id": document_id},
@@ -44,7 +49,9 @@ async def create_workflow(document_id):
 async def get_workflow_status(workflow_id):
     """Get the status of a workflow."""
     try:
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(
+            event_hooks={"request": [propagate_deadline]}
+        ) as client:
             response = await client.get(
                 f"{settings.TASK_ORCHESTRATION_SERVICE_URL}/api/v1/workflows/{workflow_id}"
             )
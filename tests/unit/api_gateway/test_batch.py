@@ -0,0 +1,70 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+
+from core.config import settings
+from shared.exceptions.base import NotFoundError, ValidationError
+from utils.batch import run_batch
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_reports_each_item_in_order():
+    async def handler(item: int):
+        if item == 1:
+            raise NotFoundError("Document", "doc-1")
+        if item == 2:
+            raise RuntimeError("connection reset")
+        return {"data": {"id": item}, "metadata": {"version": "1.0"}}
+
+    result = await run_batch([0, 1, 2, 3], handler, HTTPStatus.CREATED)
+
+    assert result["succeeded"] == 2
+    assert result["failed"] == 2
+    items = result["items"]
+    assert [item["index"] for item in items] == [0, 1, 2, 3]
+    assert items[0] == {
+        "index": 0,
+        "success": True,
+        "status_code": 201,
+        "data": {"id": 0},
+        "error": None,
+    }
+    assert items[1]["success"] is False
+    assert items[1]["status_code"] == 404
+    assert items[2]["status_code"] == 500
+    assert items[2]["error"] == "connection reset"
+    assert items[3]["data"] == {"id": 3}
+
+
+@pytest.mark.asyncio
+async def test_items_run_at_most_batch_concurrency_at_once(monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_CONCURRENCY", 2)
+    running = peak = 0
+
+    async def handler(item: int):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return item
+
+    result = await run_batch(list(range(6)), handler, HTTPStatus.OK)
+
+    assert result["succeeded"] == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_and_oversized_batches_are_rejected():
+    async def handler(item: int):
+        return item
+
+    with pytest.raises(ValidationError):
+        await run_batch([], handler, HTTPStatus.OK)
+    with pytest.raises(ValidationError) as error:
+        await run_batch(
+            list(range(settings.BATCH_MAX_ITEMS + 1)), handler, HTTPStatus.OK
+        )
+    assert error.value.status_code == 413
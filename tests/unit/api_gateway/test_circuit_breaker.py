@@ -0,0 +1,231 @@
+import httpx
+import pytest
+
+from shared.exceptions import ServiceOverloadedError, ServiceUnavailableError
+from utils.circuit_breaker import (
+    BYPASS_CIRCUIT_BREAKER,
+    CircuitBreaker,
+    CircuitBreakerTransport,
+    CircuitState,
+)
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: Clock, **overrides) -> CircuitBreaker:
+    options = {
+        "failure_rate_threshold": 0.5,
+        "minimum_requests": 4,
+        "window_seconds": 10.0,
+        "buckets": 5,
+        "cooldown_seconds": 30.0,
+        "half_open_max_probes": 2,
+        "clock": clock,
+    }
+    options.update(overrides)
+    return CircuitBreaker("test", **options)
+
+
+def call(breaker: CircuitBreaker, failed: bool | None) -> None:
+    permit = breaker.allow_request()
+    assert permit is not None
+    breaker.record(permit, failed)
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        call(breaker, True)
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_opens_when_failure_rate_crosses_threshold():
+    breaker = make_breaker(Clock())
+
+    call(breaker, False)
+    call(breaker, True)
+    call(breaker, False)
+    assert breaker.state is CircuitState.CLOSED
+
+    call(breaker, True)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow_request() is None
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_needs_minimum_requests_before_opening():
+    breaker = make_breaker(Clock())
+
+    for _ in range(3):
+        call(breaker, True)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_outcomes_age_out_of_the_window():
+    clock = Clock()
+    breaker = make_breaker(clock)
+
+    for _ in range(3):
+        call(breaker, True)
+    clock.now += 11
+    call(breaker, True)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_after_cooldown_and_limits_probes():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    trip(breaker)
+
+    clock.now += 30
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request() is not None
+    assert breaker.allow_request() is not None
+    assert breaker.allow_request() is None
+
+
+def test_successful_probes_close_the_circuit():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    trip(breaker)
+    clock.now += 30
+
+    call(breaker, False)
+    assert breaker.state is CircuitState.HALF_OPEN
+    call(breaker, False)
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.snapshot()["window_requests"] == 0
+
+
+def test_failed_probe_reopens_the_circuit():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    trip(breaker)
+    clock.now += 30
+
+    call(breaker, True)
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.snapshot()["times_opened"] == 2
+
+
+def test_probe_without_verdict_frees_its_slot():
+    clock = Clock()
+    breaker = make_breaker(clock, half_open_max_probes=1)
+    trip(breaker)
+    clock.now += 30
+
+    call(breaker, None)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow_request() is not None
+
+
+def test_stale_calls_do_not_decide_a_probing_circuit():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    stale_success = breaker.allow_request()
+    stale_failure = breaker.allow_request()
+    assert stale_success is not None and stale_failure is not None
+    trip(breaker)
+    clock.now += 30
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.record(stale_success, False)
+    breaker.record(stale_success, False)
+    breaker.record(stale_failure, True)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.snapshot()["probe_successes"] == 0
+
+
+def test_stale_calls_do_not_count_after_closing():
+    clock = Clock()
+    breaker = make_breaker(clock, minimum_requests=1)
+    stale = breaker.allow_request()
+    assert stale is not None
+    call(breaker, True)
+    clock.now += 30
+    call(breaker, False)
+    call(breaker, False)
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record(stale, True)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def make_transport(handler, breaker: CircuitBreaker) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url="http://test",
+        transport=CircuitBreakerTransport(httpx.MockTransport(handler), breaker),
+    )
+
+
+@pytest.mark.asyncio
+async def test_transport_counts_server_errors_and_rejects_when_open():
+    breaker = make_breaker(Clock())
+    client = make_transport(lambda request: httpx.Response(500), breaker)
+
+    for _ in range(4):
+        response = await client.get("/")
+        assert response.status_code == 500
+
+    with pytest.raises(ServiceUnavailableError):
+        await client.get("/")
+
+
+@pytest.mark.asyncio
+async def test_transport_counts_connection_errors():
+    def refuse(request):
+        raise httpx.ConnectError("refused")
+
+    breaker = make_breaker(Clock())
+    client = make_transport(refuse, breaker)
+
+    for _ in range(4):
+        with pytest.raises(httpx.ConnectError):
+            await client.get("/")
+
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_transport_gives_no_verdict_for_shed_calls():
+    def shed(request):
+        raise ServiceOverloadedError(service_name="test")
+
+    breaker = make_breaker(Clock())
+    client = make_transport(shed, breaker)
+
+    for _ in range(4):
+        with pytest.raises(ServiceOverloadedError):
+            await client.get("/")
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.snapshot()["window_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bypassing_calls_reach_an_open_circuit_unrecorded():
+    clock = Clock()
+    breaker = make_breaker(clock)
+    trip(breaker)
+    client = make_transport(lambda request: httpx.Response(500), breaker)
+
+    response = await client.get("/health", extensions={BYPASS_CIRCUIT_BREAKER: True})
+
+    assert response.status_code == 500
+    clock.now += 30
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.snapshot()["rejected"] == 0
@@ -0,0 +1,155 @@
+import httpx
+import pytest
+
+from shared.exceptions import ServiceOverloadedError
+from utils.concurrency_limiter import (
+    AdaptiveLimiter,
+    ConcurrencyLimitedTransport,
+    Priority,
+)
+
+
+class Body(httpx.AsyncByteStream):
+    """Response body that is only read when the client consumes it."""
+
+    def __init__(self, content: bytes = b"") -> None:
+        self.content = content
+
+    async def __aiter__(self):
+        yield self.content
+
+
+def make_limiter(**overrides) -> AdaptiveLimiter:
+    options = {
+        "name": "test",
+        "initial_limit": 10,
+        "min_limit": 2,
+        "max_limit": 20,
+        "latency_tolerance": 2.0,
+        "backoff_ratio": 0.5,
+        "priority_shares": {
+            Priority.CRITICAL: 1.0,
+            Priority.NORMAL: 0.8,
+            Priority.BULK: 0.5,
+        },
+    }
+    options.update(overrides)
+    return AdaptiveLimiter(**options)
+
+
+def fill(limiter: AdaptiveLimiter, count: int) -> None:
+    for _ in range(count):
+        assert limiter.try_acquire(Priority.CRITICAL)
+
+
+def test_lower_priorities_get_a_share_of_the_limit():
+    limiter = make_limiter()
+    fill(limiter, 5)
+
+    assert not limiter.try_acquire(Priority.BULK)
+    assert limiter.try_acquire(Priority.NORMAL)
+    fill(limiter, 2)
+    assert not limiter.try_acquire(Priority.NORMAL)
+    fill(limiter, 2)
+    assert not limiter.try_acquire(Priority.CRITICAL)
+    assert limiter.rejected == {"critical": 1, "normal": 1, "bulk": 1}
+
+
+def test_limit_grows_additively_while_in_use():
+    limiter = make_limiter()
+    fill(limiter, 6)
+
+    for _ in range(10):
+        limiter.record(0.01)
+
+    assert 10.9 < limiter.limit < 11.0
+
+
+def test_limit_does_not_grow_while_underused():
+    limiter = make_limiter()
+    fill(limiter, 1)
+
+    for _ in range(100):
+        limiter.record(0.01)
+
+    assert limiter.limit == 10
+
+
+def test_overload_halves_the_limit_once_per_round_trip():
+    limiter = make_limiter()
+    limiter.record(1.0)
+
+    limiter.record(None, overloaded=True)
+    limiter.record(None, overloaded=True)
+
+    assert limiter.limit == 5
+    assert limiter.decreases == 1
+
+
+def test_limit_never_drops_below_minimum():
+    limiter = make_limiter()
+
+    for _ in range(10):
+        limiter.record(None, overloaded=True)
+
+    assert limiter.limit == 2
+
+
+def test_rising_latency_shrinks_the_limit():
+    limiter = make_limiter()
+    limiter.record(0.01)
+
+    for _ in range(10):
+        limiter.record(0.5)
+
+    assert limiter.limit < 10
+    assert limiter.baseline_latency == 0.01
+
+
+def test_baseline_follows_uncongested_latency_only():
+    limiter = make_limiter()
+    limiter.record(0.1)
+
+    for _ in range(100):
+        limiter.record(1.0)
+    assert limiter.baseline_latency == 0.1
+
+    for _ in range(100):
+        limiter.record(0.15)
+    assert limiter.baseline_latency == pytest.approx(0.15)
+
+    limiter.record(0.05)
+    assert limiter.baseline_latency == 0.05
+
+
+@pytest.mark.asyncio
+async def test_transport_holds_slot_until_body_is_closed():
+    limiter = make_limiter(initial_limit=1, min_limit=1, max_limit=1)
+    transport = ConcurrencyLimitedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200, stream=Body(b"ok"))),
+        limiter,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "http://test/") as response:
+            assert limiter.in_flight == 1
+            with pytest.raises(ServiceOverloadedError):
+                await client.get("http://test/")
+            await response.aread()
+        assert limiter.in_flight == 0
+        assert (await client.get("http://test/")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_transport_counts_overload_statuses():
+    limiter = make_limiter()
+    transport = ConcurrencyLimitedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(503, stream=Body())),
+        limiter,
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("http://test/")
+
+    assert limiter.limit == 5
+    assert limiter.in_flight == 0
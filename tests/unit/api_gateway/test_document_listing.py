@@ -0,0 +1,81 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.endpoints import document_uploads
+from core.exceptions import register_exception_handlers
+from schemas.document_schema import DocumentStatus, DocumentType
+from services import document_upload_service
+from shared.exceptions.base import ApplicationError
+
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = []
+
+    async def list_documents(**kwargs):
+        calls.append(kwargs)
+        return {"items": [], "next_cursor": None}
+
+    monkeypatch.setattr(document_upload_service, "list_documents", list_documents)
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(document_uploads.router, prefix="/documents")
+    test_client = TestClient(app)
+    test_client.calls = calls
+    return test_client
+
+
+def test_unknown_filter_value_is_rejected_at_the_gateway(client):
+    response = client.get("/documents/", params={"status_filter": "archived"})
+
+    assert response.status_code == 422
+    assert client.calls == []
+
+
+def test_known_filter_values_are_passed_on(client):
+    response = client.get(
+        "/documents/",
+        params={"status_filter": "processed", "document_type": "invoice"},
+    )
+
+    assert response.status_code == 200
+    assert client.calls[0]["status_filter"] is DocumentStatus.PROCESSED
+    assert client.calls[0]["document_type"] is DocumentType.INVOICE
+
+
+@pytest.mark.asyncio
+async def test_validation_error_from_ingestion_keeps_its_status(monkeypatch):
+    async def proxy_request(**kwargs):
+        return httpx.Response(
+            422,
+            json={
+                "detail": [
+                    {"loc": ["query", "status"], "msg": "Input should be 'uploaded'"}
+                ]
+            },
+        )
+
+    monkeypatch.setattr(document_upload_service, "proxy_request", proxy_request)
+
+    with pytest.raises(ApplicationError) as exc_info:
+        await document_upload_service.list_documents(
+            status_filter=DocumentStatus.UPLOADED
+        )
+
+    assert exc_info.value.status_code == 422
+    assert "Input should be 'uploaded'" in exc_info.value.message
+
+
+@pytest.mark.asyncio
+async def test_error_without_json_body_keeps_its_status(monkeypatch):
+    async def proxy_request(**kwargs):
+        return httpx.Response(502, content=b"Bad Gateway")
+
+    monkeypatch.setattr(document_upload_service, "proxy_request", proxy_request)
+
+    with pytest.raises(ApplicationError) as exc_info:
+        await document_upload_service.list_documents()
+
+    assert exc_info.value.status_code == 502
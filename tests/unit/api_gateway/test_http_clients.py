@@ -0,0 +1,100 @@
+import httpx
+import pytest
+
+from shared.exceptions import ServiceUnavailableError
+from utils.circuit_breaker import CircuitBreaker, CircuitBreakerTransport
+from utils.http_clients import InstrumentedTransport, ServiceClientRegistry
+
+
+def make_client(handler, registry: ServiceClientRegistry) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url="http://test",
+        transport=InstrumentedTransport(httpx.MockTransport(handler), registry, "test"),
+    )
+
+
+def observe(registry: ServiceClientRegistry) -> list[tuple[str, str, str]]:
+    calls: list[tuple[str, str, str]] = []
+    registry.add_call_observer(
+        lambda service, method, outcome, duration: calls.append(
+            (service, method, outcome)
+        )
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_reports_status_of_direct_calls():
+    registry = ServiceClientRegistry()
+    calls = observe(registry)
+    client = make_client(lambda request: httpx.Response(201), registry)
+
+    await client.post("/documents")
+
+    assert calls == [("test", "POST", "201")]
+    assert registry._in_flight["test"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reports_reason_of_failed_calls():
+    def refuse(request):
+        raise httpx.ConnectError("refused")
+
+    def time_out(request):
+        raise httpx.ReadTimeout("slow")
+
+    registry = ServiceClientRegistry()
+    calls = observe(registry)
+
+    with pytest.raises(httpx.ConnectError):
+        await make_client(refuse, registry).get("/")
+    with pytest.raises(httpx.ReadTimeout):
+        await make_client(time_out, registry).get("/")
+
+    assert calls == [("test", "GET", "connection_error"), ("test", "GET", "timeout")]
+
+
+@pytest.mark.asyncio
+async def test_reports_calls_rejected_by_open_circuit():
+    breaker = CircuitBreaker(
+        "test",
+        failure_rate_threshold=0.5,
+        minimum_requests=1,
+        window_seconds=10.0,
+        buckets=5,
+        cooldown_seconds=30.0,
+        half_open_max_probes=1,
+    )
+    breaker.record(breaker.allow_request(), True)
+    registry = ServiceClientRegistry()
+    calls = observe(registry)
+    client = httpx.AsyncClient(
+        base_url="http://test",
+        transport=InstrumentedTransport(
+            CircuitBreakerTransport(
+                httpx.MockTransport(lambda request: httpx.Response(200)), breaker
+            ),
+            registry,
+            "test",
+        ),
+    )
+
+    with pytest.raises(ServiceUnavailableError):
+        await client.get("/")
+
+    assert calls == [("test", "GET", "circuit_open")]
+
+
+@pytest.mark.asyncio
+async def test_failing_observer_does_not_fail_the_call():
+    registry = ServiceClientRegistry()
+
+    def broken(*args):
+        raise RuntimeError("boom")
+
+    registry.add_call_observer(broken)
+    client = make_client(lambda request: httpx.Response(200), registry)
+
+    response = await client.get("/")
+
+    assert response.status_code == 200
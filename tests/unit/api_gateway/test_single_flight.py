@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from core.config import settings
+from shared.exceptions import DeadlineExceededError
+from shared.utils.deadline import deadline_scope, remaining_time
+from utils.concurrency_limiter import Priority, current_priority, set_priority
+from utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    group = SingleFlight("test")
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    waiters = [asyncio.create_task(group.do("key", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["result"] * 3
+    assert calls == 1
+    assert group.stats() == {
+        "calls": 3,
+        "executions": 1,
+        "collapsed": 2,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_shared_call_does_not_inherit_leader_deadline_or_priority():
+    group = SingleFlight("test")
+    seen = {}
+
+    async def fetch():
+        seen["remaining"] = remaining_time()
+        seen["priority"] = current_priority()
+        return "result"
+
+    set_priority(Priority.BULK)
+    with deadline_scope(0.5):
+        assert await group.do("key", fetch) == "result"
+
+    assert seen["priority"] is Priority.NORMAL
+    assert seen["remaining"] > settings.REQUEST_DEADLINE_DEFAULT_SECONDS - 1
+
+
+@pytest.mark.asyncio
+async def test_caller_stops_waiting_at_its_own_deadline():
+    group = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "result"
+
+    async def patient():
+        with deadline_scope(5):
+            return await group.do("key", fetch)
+
+    async def impatient():
+        with deadline_scope(0.05):
+            return await group.do("key", fetch)
+
+    leader = asyncio.create_task(impatient())
+    follower = asyncio.create_task(patient())
+
+    with pytest.raises(DeadlineExceededError):
+        await leader
+    release.set()
+
+    # The leader giving up does not cancel the call the follower waits on
+    assert await follower == "result"
+    assert group.executions == 1
+
+
+@pytest.mark.asyncio
+async def test_caller_past_its_deadline_does_not_start_a_call():
+    group = SingleFlight("test")
+
+    async def fetch():
+        raise AssertionError("should not be called")
+
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededError):
+            await group.do("key", fetch)
+
+    assert group.executions == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_call_exception_reaches_every_caller():
+    group = SingleFlight("test")
+
+    async def fetch():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        group.do("key", fetch), group.do("key", fetch), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert group.executions == 1
@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.endpoints import auth
+from core.exceptions import register_exception_handlers
+from services import authentication_service
+from shared.exceptions import AuthenticationError
+from utils.claims_cache import ClaimsCache
+from utils.token_revocation import BloomFilter, LocalRevocationStore, RevocationList
+
+
+def make_revocation_list() -> RevocationList:
+    return RevocationList(
+        LocalRevocationStore(),
+        capacity=1000,
+        false_positive_rate=0.01,
+        sync_interval=30.0,
+    )
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    items = [f"token-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == 1000
+
+
+def test_bloom_filter_false_positive_rate_at_capacity():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"token-{i}")
+
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_revoked_tokens_are_found_and_others_skip_the_store():
+    revocations = make_revocation_list()
+    await revocations.revoke("revoked", time.time() + 60)
+
+    assert await revocations.is_revoked("revoked")
+    assert not await revocations.is_revoked("live")
+    assert revocations.store_lookups == 1
+    assert revocations.filter_rejections == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_picks_up_other_workers_and_drops_expired_revocations():
+    revocations = make_revocation_list()
+    await revocations.revoke("expiring", time.time() + 60)
+    # Revoked by another worker sharing the store
+    await revocations.store.add("elsewhere", time.time() + 60)
+    revocations.store._entries["expiring"] = time.time() - 1
+
+    await revocations.sync()
+
+    assert await revocations.is_revoked("elsewhere")
+    assert not await revocations.is_revoked("expiring")
+    assert revocations.stats()["filter_items"] == 1
+
+
+class SlowStore(LocalRevocationStore):
+    """Store whose listing is taken before it is returned."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.listed = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def live(self) -> list[str]:
+        token_ids = await super().live()
+        self.listed.set()
+        await self.release.wait()
+        return token_ids
+
+
+@pytest.mark.asyncio
+async def test_token_revoked_during_sync_stays_in_the_filter():
+    store = SlowStore()
+    revocations = RevocationList(
+        store, capacity=1000, false_positive_rate=0.01, sync_interval=30.0
+    )
+    sync = asyncio.create_task(revocations.sync())
+    await store.listed.wait()
+
+    await revocations.revoke("during-sync", time.time() + 60)
+    store.release.set()
+    await sync
+
+    assert await revocations.is_revoked("during-sync")
+
+
+def test_claims_cache_expires_entries_with_the_token():
+    now = [1000.0]
+    cache = ClaimsCache(max_entries=10, clock=lambda: now[0])
+    cache.set("token", {"sub": "user", "exp": 1060})
+
+    assert cache.get("token") == {"sub": "user", "exp": 1060}
+    now[0] = 1060.0
+    assert cache.get("token") is None
+
+
+def test_claims_cache_skips_tokens_without_expiry_and_evicts_oldest():
+    cache = ClaimsCache(max_entries=2, clock=lambda: 0.0)
+    cache.set("forever", {"sub": "user"})
+    for name in ("a", "b"):
+        cache.set(name, {"exp": 60})
+    cache.get("a")
+    cache.set("c", {"exp": 60})
+
+    assert cache.get("forever") is None
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected_and_uncached(monkeypatch):
+    monkeypatch.setattr(
+        authentication_service, "revocation_list", make_revocation_list()
+    )
+    monkeypatch.setattr(
+        authentication_service, "claims_cache", ClaimsCache(max_entries=10)
+    )
+    token = authentication_service.create_access_token({"sub": "user"})
+
+    assert (await authentication_service.decode_token(token)).sub == "user"
+    assert authentication_service.claims_cache.stats()["entries"] == 1
+
+    await authentication_service.revoke_token(token)
+
+    assert authentication_service.claims_cache.stats()["entries"] == 0
+    with pytest.raises(AuthenticationError):
+        await authentication_service.decode_token(token)
+
+
+def test_logout_revokes_the_token_and_answers_no_content(monkeypatch):
+    monkeypatch.setattr(
+        authentication_service, "revocation_list", make_revocation_list()
+    )
+    monkeypatch.setattr(
+        authentication_service, "claims_cache", ClaimsCache(max_entries=10)
+    )
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(auth.router, prefix="/auth")
+    token = authentication_service.create_access_token({"sub": "user"})
+
+    response = TestClient(app).post(
+        "/auth/logout", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 204
+    assert "access_token=" in response.headers["set-cookie"]
+    claims = authentication_service._verify_token(token)
+    assert authentication_service.revocation_list.store._entries.keys() == {
+        claims["jti"]
+    }
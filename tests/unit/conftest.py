@@ -0,0 +1,74 @@
+"""
+Import isolation between the unit test suites of different services.
+
+Each service imports its own modules as top-level packages (``core``,
+``services``, ``schemas`` and so on), several services use the same names,
+and services read their settings from the environment when imported.
+Before the tests of a service are collected, the previous service's
+packages are dropped from ``sys.modules``, the service's directory is put
+first on the import path and the values in its .env.example are used as
+defaults, so ``pytest tests/unit`` imports each suite against its own
+service. Modules imported by a suite keep working afterwards, because they
+hold on to what they imported.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from dotenv import dotenv_values
+
+UNIT_DIR = Path(__file__).resolve().parent
+ROOT_DIR = UNIT_DIR.parents[1]
+
+# Variables set before any suite was loaded take precedence over the
+# services' .env.example defaults.
+_ORIGINAL_ENVIRON = dict(os.environ)
+
+_service_dirs: set[str] = set()
+_current_service: Path | None = None
+
+
+def _top_level_names(service_dir: Path) -> set[str]:
+    """Get the names of the packages and modules at a service's top level."""
+    # Directories without an __init__.py are namespace packages
+    return {
+        path.stem
+        for path in service_dir.iterdir()
+        if (path.is_dir() or path.suffix == ".py")
+        and not path.name.startswith(("_", "."))
+    }
+
+
+def use_service(service_dir: Path) -> None:
+    """
+    Make a service's modules importable under their top-level names.
+
+    Args:
+        service_dir: Directory of the service
+    """
+    for other_dir in _service_dirs:
+        for module_name in _top_level_names(Path(other_dir)):
+            for loaded in list(sys.modules):
+                if loaded == module_name or loaded.startswith(f"{module_name}."):
+                    del sys.modules[loaded]
+        while other_dir in sys.path:
+            sys.path.remove(other_dir)
+
+    for key, value in dotenv_values(service_dir / ".env.example").items():
+        if value is not None and key not in _ORIGINAL_ENVIRON:
+            os.environ[key] = value
+
+    _service_dirs.add(str(service_dir))
+    sys.path.insert(0, str(service_dir))
+
+
+def pytest_collectstart(collector: pytest.Collector) -> None:
+    """Switch to a service before the first of its test modules is imported."""
+    global _current_service
+    if not isinstance(collector, pytest.Module):
+        return
+    service_dir = ROOT_DIR / Path(collector.path).relative_to(UNIT_DIR).parts[0]
+    if service_dir != _current_service and (service_dir / ".env.example").exists():
+        use_service(service_dir)
+        _current_service = service_dir
@@ -0,0 +1,13 @@
+"""
+Fixtures for the document ingestion unit tests.
+
+The service's modules are made importable by ``tests/unit/conftest.py``.
+"""
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+
+@pytest.fixture
+def database():
+    """In-memory MongoDB database."""
+    return AsyncMongoMockClient()["insight_docs_test"]
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services import blob_store
+from services.blob_store import ContentAddressedStore
+from shared.utils.file_utils import WrittenFile
+
+
+def write_temp(store: ContentAddressedStore, content: bytes) -> WrittenFile:
+    """Write content to a fresh temp file of the store."""
+    path = store.temp_path()
+    with open(path, "wb") as f:
+        f.write(content)
+    return WrittenFile(
+        path=path, size=len(content), sha256=hashlib.sha256(content).hexdigest()
+    )
+
+
+@pytest.fixture
+def store(tmp_path, database):
+    return ContentAddressedStore(str(tmp_path), database["document_blobs"])
+
+
+@pytest.mark.asyncio
+async def test_commit_stores_content_once(store):
+    first = await store.commit(write_temp(store, b"same"), "doc-1")
+    second_written = write_temp(store, b"same")
+    second = await store.commit(second_written, "doc-2")
+
+    assert first.ref_count == 1 and not first.is_duplicate
+    assert second.ref_count == 2 and second.is_duplicate
+    assert second.first_document_id == "doc-1"
+    assert second.storage_path == first.storage_path
+    assert os.path.exists(first.storage_path)
+    assert not os.path.exists(second_written.path)
+
+
+@pytest.mark.asyncio
+async def test_release_deletes_blob_with_last_reference(store):
+    blob = await store.commit(write_temp(store, b"content"), "doc-1")
+    await store.commit(write_temp(store, b"content"), "doc-2")
+
+    await store.release(blob.sha256)
+    assert os.path.exists(blob.storage_path)
+    assert (await store.collection.find_one({"_id": blob.sha256}))["ref_count"] == 1
+
+    await store.release(blob.sha256)
+    assert not os.path.exists(blob.storage_path)
+    assert await store.collection.find_one({"_id": blob.sha256}) is None
+
+
+@pytest.mark.asyncio
+async def test_release_of_unknown_blob_is_ignored(store):
+    await store.release("0" * 64)
+
+
+@pytest.mark.asyncio
+async def test_commit_waits_for_pending_deletion(store, monkeypatch):
+    blob = await store.commit(write_temp(store, b"content"), "doc-1")
+    removed = asyncio.Event()
+    resume = asyncio.Event()
+    real_remove = blob_store.remove_if_exists
+
+    def slow_remove(path):
+        real_remove(path)
+        removed.set()
+
+    async def finish_deletion(sha256, storage_path):
+        await asyncio.to_thread(slow_remove, storage_path)
+        await resume.wait()
+        await store.collection.delete_one({"_id": sha256, "deleting": True})
+
+    monkeypatch.setattr(store, "_finish_deletion", finish_deletion)
+    release = asyncio.create_task(store.release(blob.sha256))
+    await removed.wait()
+
+    # The file is gone but the record is still marked as deleting
+    commit = asyncio.create_task(store.commit(write_temp(store, b"content"), "doc-2"))
+    await asyncio.sleep(blob_store.DELETION_POLL_SECONDS * 3)
+    assert not commit.done()
+
+    resume.set()
+    await release
+    recommitted = await commit
+
+    assert recommitted.ref_count == 1
+    assert recommitted.first_document_id == "doc-2"
+    assert os.path.exists(recommitted.storage_path)
+
+
+@pytest.mark.asyncio
+async def test_commit_completes_interrupted_deletion(store):
+    blob = await store.commit(write_temp(store, b"content"), "doc-1")
+    await store.collection.update_one(
+        {"_id": blob.sha256},
+        {
+            "$set": {
+                "ref_count": 0,
+                "deleting": True,
+                "deleting_since": datetime.now(timezone.utc)
+                - blob_store.DELETION_TIMEOUT
+                - timedelta(seconds=1),
+            }
+        },
+    )
+
+    recommitted = await store.commit(write_temp(store, b"content"), "doc-2")
+
+    assert recommitted.ref_count == 1
+    assert recommitted.first_document_id == "doc-2"
+    assert os.path.exists(recommitted.storage_path)
@@ -0,0 +1,109 @@
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+
+from schemas.document_schema import DocumentStatus
+from services.document_service import DocumentService, decode_cursor, encode_cursor
+from shared.exceptions.base import ValidationError
+
+START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def document(index: int, timestamp: datetime, status=DocumentStatus.UPLOADED):
+    return {
+        "_id": f"doc-{index:03d}",
+        "filename": f"{index}.pdf",
+        "original_filename": f"{index}.pdf",
+        "file_size": 1,
+        "mime_type": "application/pdf",
+        "file_extension": "pdf",
+        "upload_timestamp": timestamp,
+        "status": status.value,
+        "document_type": None,
+        "storage_path": f"/tmp/{index}.pdf",
+    }
+
+
+@pytest.fixture
+def service(database):
+    return DocumentService(collection=database["documents"], blob_store=None)
+
+
+async def list_all(service: DocumentService, limit: int, **filters) -> list[str]:
+    ids: list[str] = []
+    cursor = None
+    while True:
+        page = await service.list_documents(limit=limit, cursor=cursor, **filters)
+        assert len(page.items) <= limit
+        ids.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return ids
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor({"_id": "doc-001", "upload_timestamp": START})
+
+    assert decode_cursor(cursor) == (START, "doc-001")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b'["not a date", "doc-001"]').decode(),
+        base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValidationError) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_every_document_once_newest_first(service):
+    # Pairs of documents share a timestamp, so pages must break ties by _id
+    documents = [document(i, START + timedelta(minutes=i // 2)) for i in range(11)]
+    await service.collection.insert_many(documents)
+
+    ids = await list_all(service, limit=3)
+
+    expected = sorted(
+        documents,
+        key=lambda doc: (doc["upload_timestamp"], doc["_id"]),
+        reverse=True,
+    )
+    assert ids == [doc["_id"] for doc in expected]
+
+
+@pytest.mark.asyncio
+async def test_pages_apply_filters(service):
+    await service.collection.insert_many(
+        [
+            document(
+                i,
+                START + timedelta(minutes=i),
+                DocumentStatus.PROCESSED if i % 2 else DocumentStatus.UPLOADED,
+            )
+            for i in range(8)
+        ]
+    )
+
+    ids = await list_all(service, limit=2, status=DocumentStatus.PROCESSED)
+
+    assert ids == ["doc-007", "doc-005", "doc-003", "doc-001"]
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor(service):
+    await service.collection.insert_many(
+        [document(i, START + timedelta(minutes=i)) for i in range(2)]
+    )
+
+    page = await service.list_documents(limit=2)
+
+    assert len(page.items) == 2
+    assert page.next_cursor is None
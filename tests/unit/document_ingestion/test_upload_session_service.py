@@ -0,0 +1,241 @@
+import hashlib
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.config import settings
+from schemas.upload_session_schema import UploadSessionCreate, UploadSessionStatus
+from services.document_service import DocumentService
+from services.upload_session_service import (
+    UploadSessionService,
+    missing_ranges,
+    parse_content_range,
+)
+from shared.exceptions.base import NotFoundError, ValidationError
+
+CHUNK_SIZE = settings.RESUMABLE_UPLOAD_MIN_CHUNK_SIZE
+CONTENT = bytes(range(256)) * (CHUNK_SIZE * 5 // 2 // 256)
+
+
+async def body(data: bytes):
+    yield data
+
+
+def content_range(index: int) -> str:
+    start = index * CHUNK_SIZE
+    end = min(start + CHUNK_SIZE, len(CONTENT)) - 1
+    return f"bytes {start}-{end}/{len(CONTENT)}"
+
+
+def chunk(index: int) -> bytes:
+    return CONTENT[index * CHUNK_SIZE : (index + 1) * CHUNK_SIZE]
+
+
+@pytest.fixture
+def service(tmp_path, database, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path))
+    monkeypatch.setattr(settings, "CONTENT_ADDRESSED_STORAGE", False)
+    return UploadSessionService(
+        database["upload_sessions"],
+        DocumentService(collection=database["documents"]),
+    )
+
+
+async def create(service: UploadSessionService):
+    return await service.create_session(
+        UploadSessionCreate(
+            filename="scan.pdf",
+            file_size=len(CONTENT),
+            mime_type="application/pdf",
+            chunk_size=CHUNK_SIZE,
+        )
+    )
+
+
+async def send(service: UploadSessionService, session_id: str, index: int):
+    return await service.write_chunk(
+        session_id, content_range(index), body(chunk(index))
+    )
+
+
+def test_parse_content_range():
+    assert parse_content_range("bytes 0-9/100") == (0, 9, 100)
+    for header in (None, "bytes 0-9", "items 0-9/100", "bytes 9-0/100"):
+        with pytest.raises(ValidationError):
+            parse_content_range(header)
+
+
+def test_missing_ranges():
+    assert missing_ranges([], 3) == [(0, 2)]
+    assert missing_ranges([0, 1, 2], 3) == []
+    assert missing_ranges([1, 4], 7) == [(0, 0), (2, 3), (5, 6)]
+
+
+def test_chunk_size_below_minimum_is_rejected():
+    with pytest.raises(ValueError):
+        UploadSessionCreate(
+            filename="scan.pdf",
+            file_size=len(CONTENT),
+            mime_type="application/pdf",
+            chunk_size=CHUNK_SIZE - 1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_session_preallocates_part_file(service):
+    session = await create(service)
+
+    stored = await service.collection.find_one({"_id": session.id})
+    assert os.path.getsize(stored["part_path"]) == len(CONTENT)
+    assert session.total_chunks == 3
+    assert session.missing_chunk_count == 3
+    assert session.missing_chunk_ranges == [(0, 2)]
+    assert session.offset == 0
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_tracked_out_of_order(service):
+    session = await create(service)
+
+    await send(service, session.id, 2)
+    progress = await send(service, session.id, 0)
+
+    assert progress.received_chunks == [0, 2]
+    assert progress.missing_chunk_ranges == [(1, 1)]
+    assert progress.offset == CHUNK_SIZE
+    assert progress.chunk_checksums[2] == hashlib.sha256(chunk(2)).hexdigest()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "header",
+    [
+        f"bytes 1-{CHUNK_SIZE}/{len(CONTENT)}",
+        f"bytes 0-{CHUNK_SIZE - 2}/{len(CONTENT)}",
+        f"bytes 0-{CHUNK_SIZE - 1}/{len(CONTENT) + 1}",
+    ],
+)
+async def test_ranges_must_cover_one_chunk(service, header):
+    session = await create(service)
+
+    with pytest.raises(ValidationError) as error:
+        await service.write_chunk(session.id, header, body(chunk(0)))
+    assert error.value.status_code == 416
+
+
+@pytest.mark.asyncio
+async def test_chunk_checksum_is_verified(service):
+    session = await create(service)
+
+    with pytest.raises(ValidationError):
+        await service.write_chunk(
+            session.id, content_range(0), body(chunk(0)), checksum="0" * 64
+        )
+
+
+@pytest.mark.asyncio
+async def test_complete_requires_every_chunk(service):
+    session = await create(service)
+    await send(service, session.id, 0)
+
+    with pytest.raises(ValidationError) as error:
+        await service.complete_session(session.id)
+    assert error.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_complete_creates_document(service):
+    session = await create(service)
+    for index in range(3):
+        await send(service, session.id, index)
+
+    document = await service.complete_session(
+        session.id, sha256=hashlib.sha256(CONTENT).hexdigest()
+    )
+
+    stored = await service.collection.find_one({"_id": session.id})
+    assert stored["status"] == UploadSessionStatus.COMPLETED.value
+    assert stored["document_id"] == document.id
+    assert not os.path.exists(stored["part_path"])
+    with open(document.storage_path, "rb") as f:
+        assert f.read() == CONTENT
+
+
+@pytest.mark.asyncio
+async def test_complete_checksum_mismatch_reopens_session(service):
+    session = await create(service)
+    for index in range(3):
+        await send(service, session.id, index)
+
+    with pytest.raises(ValidationError):
+        await service.complete_session(session.id, sha256="0" * 64)
+
+    stored = await service.collection.find_one({"_id": session.id})
+    assert stored["status"] == UploadSessionStatus.UPLOADING.value
+    assert os.path.exists(stored["part_path"])
+
+
+@pytest.mark.asyncio
+async def test_late_chunk_after_completion_is_rejected(service):
+    session = await create(service)
+    for index in range(3):
+        await send(service, session.id, index)
+    document = await service.complete_session(session.id)
+    stale = await service.collection.find_one({"_id": session.id})
+    stale["status"] = UploadSessionStatus.UPLOADING.value
+
+    async def load(session_id):
+        return stale
+
+    # A retransmission that was loaded before the session was claimed
+    service._load = load
+    with pytest.raises(ValidationError) as error:
+        await service.write_chunk(session.id, content_range(0), body(b"x" * CHUNK_SIZE))
+    assert error.value.status_code == 409
+    with open(document.storage_path, "rb") as f:
+        assert f.read() == CONTENT
+
+
+@pytest.mark.asyncio
+async def test_abort_removes_part_file(service):
+    session = await create(service)
+    stored = await service.collection.find_one({"_id": session.id})
+
+    aborted = await service.abort_session(session.id)
+
+    assert aborted.status == UploadSessionStatus.ABORTED
+    assert not os.path.exists(stored["part_path"])
+    with pytest.raises(ValidationError):
+        await service.abort_session(session.id)
+
+
+@pytest.mark.asyncio
+async def test_sweep_aborts_expired_sessions(service):
+    expired = await create(service)
+    live = await create(service)
+    await service.collection.update_one(
+        {"_id": expired.id},
+        {"$set": {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}},
+    )
+
+    assert await service.sweep_expired() == 1
+
+    expired_record = await service.collection.find_one({"_id": expired.id})
+    live_record = await service.collection.find_one({"_id": live.id})
+    assert expired_record["status"] == UploadSessionStatus.ABORTED.value
+    assert not os.path.exists(expired_record["part_path"])
+    assert live_record["status"] == UploadSessionStatus.UPLOADING.value
+    assert os.path.exists(live_record["part_path"])
+
+
+@pytest.mark.asyncio
+async def test_expired_session_is_not_found(service):
+    session = await create(service)
+    await service.collection.update_one(
+        {"_id": session.id},
+        {"$set": {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}},
+    )
+
+    with pytest.raises(NotFoundError):
+        await service.get_session(session.id)